@@ -0,0 +1,236 @@
+"""
+### Description
+Benchmark suite of the DOC calculator evaluation paths:
+
+- core          Single design `DirectOperatingCost.calculate_doc` / `calculate_ioc` latency
+                (memo reset at every call) and fused evaluator latency, for the ATR-72 and README aircraft
+- construction  `_assign_input` input normalization and instance construction
+- gemseo        `GemseoDirectOperatingCost.execute` overhead versus the core call
+- throughput    Batch engine designs per second from 1e3 to 1e6 designs
+
+Results are written as JSON; `--compare` checks them against a stored
+baseline and exits with status 1 when a benchmark is slower than the
+baseline by more than `--tolerance`.
+
+    python benchmarks/run_benchmarks.py --output baseline.json
+    python benchmarks/run_benchmarks.py --compare baseline.json --tolerance 0.2
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test"))
+from doc_calculator import DirectOperatingCost
+from doc_calculator.core.fused import fused_evaluator
+from doc_calculator.core.utils.schema import INPUT_SCHEMA
+from doc_calculator.core.utils.util_functions import _assign_input
+from aircraft_data import ATR_72, README_AIRCRAFT
+from typing import Callable, Dict, Sequence
+import argparse
+import datetime
+import platform
+import timeit
+import json
+
+AIRCRAFT      = {"atr_72": ATR_72, "readme": README_AIRCRAFT}
+DEFAULT_SIZES = (1000, 10000, 100000, 1000000)
+GROUPS        = ("core", "construction", "gemseo", "throughput")
+
+
+def time_call(function:Callable[[], object], repeat:int=5, min_time:float=0.2) -> float:
+    """
+    ### Description
+    Best (minimum) time per call of `function` in seconds over `repeat`
+    runs, each run looping enough calls to last at least `min_time`.
+    """
+    timer  = timeit.Timer(function)
+    number = 1
+    while timer.timeit(number) < min_time and number < 10**7:
+        number *= 10
+
+    return min(timer.repeat(repeat, number))/number
+
+
+def bench_core(repeat:int=5, min_time:float=0.2) -> Dict[str, dict]:
+    results = {}
+    for name, aircraft in AIRCRAFT.items():
+        doc = DirectOperatingCost(aircraft)
+
+        # the instance memoizes its evaluation: reset it so every call is computed
+        def calculate_doc() -> dict:
+            doc._evaluation_state = None
+            return doc.calculate_doc()
+
+        def calculate_ioc() -> dict:
+            doc._evaluation_state = None
+            return doc.calculate_ioc()
+
+        results[f"core.calculate_doc.{name}"] = _latency(time_call(calculate_doc, repeat, min_time))
+        results[f"core.calculate_ioc.{name}"] = _latency(time_call(calculate_ioc, repeat, min_time))
+        results[f"core.new_instance_doc.{name}"] = _latency(time_call(lambda: DirectOperatingCost(aircraft).calculate_doc(),
+                                                                      repeat, min_time))
+
+        evaluate = fused_evaluator()
+        values   = tuple(INPUT_SCHEMA.normalize(aircraft).values())
+        results[f"core.fused_evaluator.{name}"] = _latency(time_call(lambda: evaluate(*values), repeat, min_time))
+    return results
+
+
+def bench_construction(repeat:int=5, min_time:float=0.2) -> Dict[str, dict]:
+    results = {}
+    for name, aircraft in AIRCRAFT.items():
+        results[f"construction.assign_input.{name}"] = _latency(time_call(lambda: _assign_input(aircraft), repeat, min_time))
+        results[f"construction.instance.{name}"]     = _latency(time_call(lambda: DirectOperatingCost(aircraft), repeat, min_time))
+    return results
+
+
+def gemseo_input_data(discipline, aircraft:dict) -> dict:
+    """Input data of the discipline for an aircraft dict, one entry per input grammar name."""
+    import numpy as np
+
+    record = INPUT_SCHEMA.normalize(aircraft)
+    return {name: np.array([float(record[INPUT_SCHEMA.canonical(name)])]) for name in discipline.io.input_grammar.names}
+
+
+def bench_gemseo(repeat:int=5, min_time:float=0.2) -> Dict[str, dict]:
+    from doc_calculator import GemseoDirectOperatingCost
+
+    results = {}
+    for name, aircraft in AIRCRAFT.items():
+        discipline = GemseoDirectOperatingCost()
+        input_data = gemseo_input_data(discipline, aircraft)
+
+        # without cache, every execution runs the discipline
+        discipline.set_cache(discipline.CacheType.NONE)
+
+        # the overhead is only meaningful if both calls price the same aircraft
+        expected = DirectOperatingCost(aircraft).calculate_all()["DOC [USD/flight]"]
+        if float(discipline.execute(input_data)["DOC"][0]) != expected:
+            raise ValueError(f"The discipline and the core calculator do not price the same {name} aircraft")
+
+        core    = time_call(lambda: DirectOperatingCost(aircraft).calculate_all(), repeat, min_time)
+        execute = time_call(lambda: discipline.execute(input_data), repeat, min_time)
+
+        results[f"gemseo.core_calculate_all.{name}"] = _latency(core)
+        results[f"gemseo.execute.{name}"]            = _latency(execute)
+        results[f"gemseo.overhead.{name}"]           = _latency(execute - core)
+    return results
+
+
+def bench_throughput(sizes:Sequence[int]=DEFAULT_SIZES, repeat:int=3, min_time:float=0.2) -> Dict[str, dict]:
+    import numpy as np
+
+    results = {}
+    rng     = np.random.default_rng(0)
+    for n in sizes:
+        aircraft = {**README_AIRCRAFT, "fuelpri": rng.uniform(1.5, 2.5, n), "bt": rng.uniform(1.0, 3.0, n),
+                    "sector": rng.uniform(300.0, 1500.0, n)}
+        seconds  = time_call(lambda: DirectOperatingCost.from_arrays(aircraft).calculate_all(), repeat, min_time)
+        results[f"throughput.batch.{n}"] = {"seconds": seconds, "designs_per_second": n/seconds, "unit": "s/batch"}
+    return results
+
+
+def run(groups:Sequence[str]=GROUPS, sizes:Sequence[int]=DEFAULT_SIZES, repeat:int=5, min_time:float=0.2) -> dict:
+    """
+    ### Description
+    Run the selected benchmark groups.
+
+    ### Returns
+    Dict {"metadata": {...}, "results": {benchmark name: {"seconds", "unit", ...}}}.
+    """
+    results = {}
+    for group in groups:
+        if group == "core":
+            results.update(bench_core(repeat, min_time))
+        elif group == "construction":
+            results.update(bench_construction(repeat, min_time))
+        elif group == "gemseo":
+            results.update(bench_gemseo(repeat, min_time))
+        elif group == "throughput":
+            results.update(bench_throughput(sizes, min(repeat, 3), min_time))
+        else:
+            raise ValueError(f"Benchmark group {group} not valid")
+
+    return {"metadata": _metadata(), "results": results}
+
+
+def compare(current:dict, baseline:dict, tolerance:float=0.2) -> Dict[str, dict]:
+    """
+    ### Description
+    Compare two benchmark reports. A benchmark regresses when its time is
+    more than (1 + tolerance) times the baseline time. Benchmarks missing
+    from either report are skipped, as are the derived overhead entries.
+
+    ### Returns
+    Dict {benchmark name: {"baseline", "current", "ratio", "regression"}}.
+    """
+    comparison = {}
+    for name, result in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None or ".overhead." in name or reference["seconds"] <= 0.0:
+            continue
+
+        ratio = result["seconds"]/reference["seconds"]
+        comparison[name] = {
+            "baseline": reference["seconds"],
+            "current": result["seconds"],
+            "ratio": ratio,
+            "regression": ratio > 1.0 + tolerance,
+        }
+    return comparison
+
+
+def _latency(seconds:float) -> dict:
+    return {"seconds": seconds, "unit": "s/call"}
+
+
+def _metadata() -> dict:
+    metadata = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+    }
+    for package in ("numpy", "gemseo"):
+        if package in sys.modules:
+            metadata[package] = getattr(sys.modules[package], "__version__", "unknown")
+    return metadata
+
+
+def main(argv:Sequence[str]=None) -> int:
+    parser = argparse.ArgumentParser(description="DOC calculator benchmark suite")
+    parser.add_argument("--groups", nargs="+", choices=GROUPS, default=list(GROUPS), help="Benchmark groups to run")
+    parser.add_argument("--sizes", nargs="+", type=lambda value: int(float(value)), default=list(DEFAULT_SIZES),
+                        help="Batch sizes of the throughput benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (the best one is kept)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum duration of a timing repetition [s]")
+    parser.add_argument("--output", help="JSON file the results are written to")
+    parser.add_argument("--compare", help="Baseline JSON file to compare the results with")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative slowdown before a regression")
+    args = parser.parse_args(argv)
+
+    report = run(args.groups, args.sizes, args.repeat, args.min_time)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+    for name, result in report["results"].items():
+        rate = f"\t{result['designs_per_second']:12.0f} designs/s" if "designs_per_second" in result else ""
+        print(f"{name:45s}\t{result['seconds']*1e6:12.2f} us{rate}")
+
+    if args.compare is None:
+        return 0
+
+    with open(args.compare) as file:
+        comparison = compare(report, json.load(file), args.tolerance)
+
+    print("\n")
+    for name, entry in comparison.items():
+        flag = "REGRESSION" if entry["regression"] else "ok"
+        print(f"{name:45s}\t{entry['ratio']:6.2f}x\t{flag}")
+
+    return 1 if any(entry["regression"] for entry in comparison.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
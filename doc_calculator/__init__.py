@@ -1,2 +1,26 @@
 from .core import DirectOperatingCost
-from .gemseo_discipline import GemseoDirectOperatingCost
\ No newline at end of file
+
+# the GEMSEO discipline is only imported on first access, so that the core
+# calculator can be used without loading gemseo (and numpy)
+_LAZY_ATTRIBUTES = {
+    "GemseoDirectOperatingCost": ".gemseo_discipline",
+    "BatchGemseoDirectOperatingCost": ".gemseo_discipline",
+    "create_default_gemseo_grammar": ".gemseo_discipline.utils.utils_functions",
+}
+
+__all__ = ["DirectOperatingCost", *_LAZY_ATTRIBUTES]
+
+
+def __getattr__(name:str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted({*globals(), *__all__})
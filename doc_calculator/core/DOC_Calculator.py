@@ -1,6 +1,10 @@
-from .utils.params import Params
+from .utils.params import PARAMS_FIELDS, Params, params_values
+from .utils.cache import ResultCache
+from .utils.profiling import TimingStats, active_stats
+from .utils.schema import INPUT_SCHEMA
 from .utils.util_functions import _assign_input
 from typing import Dict, Tuple
+import operator
 import math
 
 class DirectOperatingCost(object):
@@ -9,7 +13,50 @@ class DirectOperatingCost(object):
     MACH_NUMBER_FACTOR = 1.0  # 1.0 = Assumed subsonic cruise
     FLIGHT_TIME_OFFSET = 0.25
 
-    def __init__(self, aircraft:dict, params:Params=Params()) -> None:
+    # Elementary functions used by the cost terms (overridden by the batch engine)
+    _sqrt  = staticmethod(math.sqrt)
+    _power = staticmethod(math.pow)
+
+    # Memoized cost terms and the input state they were evaluated for
+    _evaluation_state = None
+    _evaluation       = None
+    _result_cache     = None
+
+    # Columnar result of the memoized cost terms and the input state it was built for
+    _result = None
+
+    # Cost term methods and the cost lines they evaluate, in the order of
+    # _calculate_financial_cost and _calculate_cash_operating_cost
+    _FINANCIAL_TERMS = {
+        "_calculate_insurance_cost": ("INSURANCE [USD/BHR]",),
+        "_calculate_depreciation": ("DEPRECIATION [USD/BHR]",),
+        "_calculate_interest": ("INTEREST [USD/BHR]",),
+    }
+    _OPERATING_TERMS = {
+        "_calculate_fuel_cost": ("FUEL [USD/BHR]",),
+        "_calculate_electric_energy_price": ("ELECTRYCITY [USD/BHR]",),
+        "_calculate_h2_price": ("H2 [USD/BHR]",),
+        "_calculate_cockpit_crew_cost": ("COCKPIT CREW [USD/BHR]",),
+        "_calculate_cabin_crew_cost": ("CABIN CREW [USD/BHR]",),
+        "_calculate_landing_fees": ("LANDING FEES [USD/BHR]",),
+        "_calculate_navigation_charges": ("NAVIGATION CHARGES [USD/BHR]",),
+        "_calculate_ground_handling_charges": ("GROUND HANDLING [USD/BHR]",),
+        "_calculate_noise_charges": ("NOISE CHARGES [USD/BHR]",),
+        "_calculate_nox_emission_charges": ("NOX EMISSION CHARGES [USD/BHR]",),
+        "_calculate_co_emission_charges": ("CO EMISSION CHARGES [USD/BHR]",),
+        "_calculate_co2_emission_charges": ("CO2 EMISSION CHARGES [USD/BHR]",),
+        "_calculate_airframe_maintenance_cost": ("AIRFRANE MAINTENANCE [USD/BHR]",),
+        "_calculate_thermal_engine_maintenance_cost": ("THERM. ENG. MAINTENANCE [USD/BH]",),
+        "_calculate_electric_machine_maintenance_cost": ("ELECTRIC MACHINE LINE MAINT. [USD/BH]",
+                                                         "ELECTRIC MACHINE BASE MAINT. [USD/BH]"),
+        "_calculate_battery_maintenance_cost": ("BATTERY LINE MAINT. [USD/BH]", "BATTERY BASE MAINT. [USD/BH]"),
+        "_calculate_fuel_cell_maintenance_cost": ("FUEL CELL LINE MAINT. [USD/BH]", "FUEL CELL BASE MAINT. [USD/BH]"),
+        "_calculate_power_electronic_maintenance_cost": ("POWER ELECTR. LINE MAINT. [USD/BH]",
+                                                         "POWER ELECTR. BASE MAINT. [USD/BH]"),
+    }
+
+    def __init__(self, aircraft:dict, params:Params=Params(), result_cache:ResultCache=None,
+                 stats:TimingStats=None) -> None:
         """
         ### Description
         This code enables to evaluate Direct and Total Operating Costs
@@ -96,18 +143,50 @@ class DirectOperatingCost(object):
         - ener_req  (kWh)          Electricity Requirement (from battery)
         - h2_pri         (USD/kg)  H2 price
         - h2_req (kg)              H2 requirements
+
+        ### Result Cache
+        An optional `ResultCache` (`result_cache` keyword) can be shared by many
+        instances: cost terms of design points already evaluated are read back
+        from it instead of being recomputed.
+
+        ### Timing Stats
+        An optional `TimingStats` (`stats` keyword, or activated with a `with`
+        block) records the calls and time of the input normalization, of every
+        cost term and of the result assembly. Without it the instance is not
+        instrumented.
         
         """
-        self.aircraft = _assign_input(input=aircraft)
+        stats = stats if stats is not None else active_stats()
+
+        if stats is None:
+            self.aircraft = _assign_input(input=aircraft)
+        else:
+            self.aircraft = stats.wrap("normalize_input", _assign_input)(input=aircraft)
+            stats.instrument(self, self._timed_methods())
+
         self._params = params
+        self._result_cache = result_cache
 
         return None
+
+    @classmethod
+    def from_arrays(cls, aircraft:dict, params:Params=Params()) -> "DirectOperatingCost":
+        """
+        ### Description
+        Build a vectorized calculator evaluating many aircraft at once.
+
+        Every key of the aircraft dict may be a scalar or a NumPy array; all
+        values are broadcast together and each cost line returned by
+        `calculate_doc` and `calculate_ioc` becomes an array.
+        """
+        from .batch import BatchDirectOperatingCost
+
+        return BatchDirectOperatingCost(aircraft=aircraft, params=params)
     
     def calculate_doc(self) -> Dict[str, float]:
 
-        bt = self.aircraft["bt"]
-        financial = self._calculate_financial_cost()
-        operating = self._calculate_cash_operating_cost()
+        bt = self.aircraft.bt
+        financial, operating = self._evaluate()
 
         doc_total = sum(financial.values()) + sum(operating.values())
 
@@ -120,15 +199,165 @@ class DirectOperatingCost(object):
         
     def calculate_ioc(self) -> Dict[str, float]:
     
-        ioc_factor = self.aircraft["ioc_fact"]
-        bt = self.aircraft["bt"]
-        operating_cost = self._calculate_cash_operating_cost()
+        ioc_factor = self.aircraft.ioc_fact
+        bt = self.aircraft.bt
+        _, operating_cost = self._evaluate()
         ioc_bhr = ioc_factor * sum(operating_cost.values())
 
         return {
             "IOC [USD/BHR]": ioc_bhr,
             "IOC [USD/flight]": bt * ioc_bhr,
         }
+
+    def calculate_all(self) -> Dict[str, float]:
+        """
+        ### Description
+        DOC cost lines and totals, IOC totals and the Total Operating Cost
+        (TOC = DOC + IOC) from a single evaluation of the cost terms.
+        """
+        doc = self.calculate_doc()
+        ioc = self.calculate_ioc()
+
+        return {
+            **doc,
+            **ioc,
+            "TOC [USD/BHR]": doc["DOC [USD/BHR]"] + ioc["IOC [USD/BHR]"],
+            "TOC [USD/flight]": doc["DOC [USD/flight]"] + ioc["IOC [USD/flight]"],
+        }
+
+    def calculate_result(self) -> "CostResult":
+        """
+        ### Description
+        Columnar counterpart of `calculate_all`: a `CostResult` holding every
+        cost line and total in one float64 block, with stable field ids, unit
+        metadata and zero-copy pandas/Arrow export. `as_dict()` returns the
+        `calculate_all` dict.
+
+        The cost lines are written once into the block, which is memoized with
+        the cost terms: the same `CostResult` is returned until an input changes.
+
+            result = DirectOperatingCost.from_arrays(fleet).calculate_result()
+            result.doc_flight, result.UNITS["doc_flight"], result.to_pandas()
+        """
+        from .utils.result import CostResult
+
+        financial, operating = self._evaluate()
+        if self._result is None or self._result[0] is not self._evaluation_state:
+            result       = CostResult.from_evaluation(financial, operating, self.aircraft.bt, self.aircraft.ioc_fact)
+            self._result = (self._evaluation_state, result)
+
+        return self._result[1]
+
+    def calculate_sensitivities(self) -> Dict[str, Dict[str, dict]]:
+        """
+        ### Description
+        Exact partial derivatives and elasticities of every cost line and of
+        the DOC/IOC/TOC totals with respect to every aircraft input and
+        `Params` field, from one analytic evaluation.
+
+            sensitivities = doc.calculate_sensitivities()
+            sensitivities["DOC [USD/flight]"]["batprice"]   # {"derivative": ..., "elasticity": ...}
+
+        See `gradients.calculate_sensitivities`.
+        """
+        from .gradients import calculate_sensitivities
+
+        return calculate_sensitivities(self)
+
+    def update(self, **changes) -> Dict[str, float]:
+        """
+        ### Description
+        Change some aircraft inputs (case insensitive keys) and/or `Params`
+        fields (upper case names, e.g. INTEREST_RATE) and re-evaluate only
+        the cost terms reading them, then the totals. The Params object is
+        replaced by an updated copy, never modified in place.
+
+            doc.update(fuelpri=2.1, bt=1.6)
+
+        ### Returns
+        `calculate_all` dict for the updated inputs.
+        """
+        from .dependencies import dependency_graph
+
+        financial, operating = self._evaluate()
+
+        aircraft_changes = {}
+        params_changes   = {}
+        for key, value in changes.items():
+            if key in PARAMS_FIELDS:
+                params_changes[key] = value
+                continue
+            name = INPUT_SCHEMA.canonical(key)
+            if name is None:
+                raise KeyError(f"Unknown input '{key}'")
+            aircraft_changes[name] = value
+
+        for name, value in aircraft_changes.items():
+            self._set_input(name, value)
+        if params_changes:
+            self._params = Params(**{**vars(self._params), **params_changes})
+
+        dirty = dependency_graph(type(self)).affected_terms([*aircraft_changes, *params_changes])
+
+        financial = dict(financial)
+        operating = dict(operating)
+        for terms, lines in ((self._FINANCIAL_TERMS, financial), (self._OPERATING_TERMS, operating)):
+            for method, labels in terms.items():
+                if method not in dirty:
+                    continue
+                values = getattr(self, method)()
+                if len(labels) == 1:
+                    lines[labels[0]] = values
+                else:
+                    lines.update(zip(labels, values))
+
+        self._evaluation       = (financial, operating)
+        self._evaluation_state = (*self.aircraft.values(), *params_values(self._params))
+        if self._result_cache is not None:
+            self._result_cache.put(self._result_cache.key(self.aircraft, self._params, self._cache_name()), self._evaluation)
+
+        return self.calculate_all()
+
+    @classmethod
+    def _cache_name(cls) -> str:
+        # classes of the same name in different modules must not share result cache entries
+        return f"{cls.__module__}.{cls.__qualname__}"
+
+    def _set_input(self, name:str, value:float) -> None:
+        setattr(self.aircraft, name, value)
+
+    @classmethod
+    def _timed_methods(cls) -> list:
+        # public entry points, memo and every cost term
+        terms = sorted(name for name in dir(cls) if name.startswith("_calculate_"))
+        return ["calculate_doc", "calculate_ioc", "calculate_all", "calculate_result", "_evaluate", *terms]
+
+    def _evaluate(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+
+        # the state holds references to the current input values: replacing any
+        # aircraft entry or Params field yields new objects and invalidates it
+        state = (*self.aircraft.values(), *params_values(self._params))
+
+        cached = self._evaluation_state
+        if cached is None or len(cached) != len(state) or any(map(operator.is_not, cached, state)):
+            self._evaluation       = self._evaluate_cost_terms()
+            self._evaluation_state = state
+
+        return self._evaluation
+
+    def _evaluate_cost_terms(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+
+        if self._result_cache is None:
+            return self._calculate_financial_cost(), self._calculate_cash_operating_cost()
+
+        key        = self._result_cache.key(self.aircraft, self._params, self._cache_name())
+        evaluation = self._result_cache.get(key)
+
+        if evaluation is None:
+            evaluation = (self._calculate_financial_cost(), self._calculate_cash_operating_cost())
+            self._result_cache.put(key, evaluation)
+
+        return evaluation
     
     def _calculate_cash_operating_cost(self) -> Dict[str, float]:
 
@@ -178,93 +407,95 @@ class DirectOperatingCost(object):
             }
     
     def _calculate_financial_cost(self) -> Dict[str, float]:
+        investment = self._calculate_investment()
+
         return {
             "INSURANCE [USD/BHR]": self._calculate_insurance_cost(),
-            "DEPRECIATION [USD/BHR]": self._calculate_depreciation(),
-            "INTEREST [USD/BHR]": self._calculate_interest()
+            "DEPRECIATION [USD/BHR]": self._calculate_depreciation(investment),
+            "INTEREST [USD/BHR]": self._calculate_interest(investment)
             }
     
     def _calculate_co2_emission_charges(self) -> float:
-        co2_value = self.aircraft["co2_value"]    
-        prico2 = self.aircraft["prico2"]
-        bt     = self.aircraft["bt"] 
+        co2_value = self.aircraft.co2_value    
+        prico2 = self.aircraft.prico2
+        bt     = self.aircraft.bt 
 
         return (1.0-self._params.AEC)*co2_value*prico2/bt
     
     def _calculate_battery_maintenance_cost(self) -> Tuple[float, float]:
-        n_bat     = self.aircraft["n_bat"]
-        n_repbat  = self.aircraft["n_repbat"]
-        batprice = self.aircraft["batprice"]
-        rvbat    = self.aircraft["rvbat"]
-        lrbat    = self.aircraft["lrbat"]
-        tlbat    = self.aircraft["tlbat"]
-        f_bat     = self.aircraft["f_bat"]
-        lifespan = self.aircraft["lifespan"]
-        util     = self.aircraft["util"]
+        n_bat     = self.aircraft.n_bat
+        n_repbat  = self.aircraft.n_repbat
+        batprice = self.aircraft.batprice
+        rvbat    = self.aircraft.rvbat
+        lrbat    = self.aircraft.lrbat
+        tlbat    = self.aircraft.tlbat
+        f_bat     = self.aircraft.f_bat
+        lifespan = self.aircraft.lifespan
+        util     = self.aircraft.util
 
         battery_maint_line = n_bat*lrbat*tlbat*f_bat
         battery_maint_base = n_bat*(n_repbat*(batprice-rvbat))/(lifespan*util) # replace
         return battery_maint_line, battery_maint_base
     
     def _calculate_fuel_cell_maintenance_cost(self) -> Tuple[float, float]:
-        n_fc      = self.aircraft["n_fc"]
-        n_repfc   = self.aircraft["n_repfc"]
-        fcprice  = self.aircraft["fcprice"]
-        rvfc     = self.aircraft["rvfc"]
-        lrfc     = self.aircraft["lrfc"]
-        tlfc     = self.aircraft["tlfc"]
-        f_fc      = self.aircraft["f_fc"]
-        lifespan = self.aircraft["lifespan"]
-        util     = self.aircraft["util"]
+        n_fc      = self.aircraft.n_fc
+        n_repfc   = self.aircraft.n_repfc
+        fcprice  = self.aircraft.fcprice
+        rvfc     = self.aircraft.rvfc
+        lrfc     = self.aircraft.lrfc
+        tlfc     = self.aircraft.tlfc
+        f_fc      = self.aircraft.f_fc
+        lifespan = self.aircraft.lifespan
+        util     = self.aircraft.util
 
         fuel_cell_maint_line = n_fc*lrfc*tlfc*f_fc
         fuel_cell_maint_base = n_fc*(n_repfc*(fcprice-rvfc))/(lifespan*util) # replace
         return fuel_cell_maint_line, fuel_cell_maint_base
     
     def _calculate_power_electronic_maintenance_cost(self) -> Tuple[float, float]:
-        n_reppe   = self.aircraft["n_reppe"]
-        peprice  = self.aircraft["peprice"]
-        rvpe     = self.aircraft["rvpe"]
-        lrpe     = self.aircraft["lrpe"]
-        tlpe     = self.aircraft["tlpe"]
-        f_pe      = self.aircraft["f_pe"]
-        lifespan = self.aircraft["lifespan"]
-        util     = self.aircraft["util"]
+        n_reppe   = self.aircraft.n_reppe
+        peprice  = self.aircraft.peprice
+        rvpe     = self.aircraft.rvpe
+        lrpe     = self.aircraft.lrpe
+        tlpe     = self.aircraft.tlpe
+        f_pe      = self.aircraft.f_pe
+        lifespan = self.aircraft.lifespan
+        util     = self.aircraft.util
 
         power_electronic_maint_line = lrpe*tlpe*f_pe
         power_electronic_maint_base = (n_reppe*(peprice-rvpe))/(lifespan*util) # replace
         return power_electronic_maint_line, power_electronic_maint_base
 
     def _calculate_electric_machine_maintenance_cost(self) -> Tuple[float, float]:
-        n_em      = self.aircraft["n_em"]     
-        speml    = self.aircraft["speml"]       # spare parts cost line maintenance
-        spemb    = self.aircraft["spemb"]       # spare parts cost base maintenance
-        lrem     = self.aircraft["lrem"]
-        tleml    = self.aircraft["tleml"]       # maintenance man hour line maint.
-        tlemb    = self.aircraft["tlemb"]       # maintenance man hour base maint.
-        f_eml     = self.aircraft["f_eml"]        # maintenance frequency line maint
-        f_emb     = self.aircraft["f_emb"]        # maintenance frequency base maint
-        lifespan = self.aircraft["lifespan"]
-        util     = self.aircraft["util"]
+        n_em      = self.aircraft.n_em     
+        speml    = self.aircraft.speml       # spare parts cost line maintenance
+        spemb    = self.aircraft.spemb       # spare parts cost base maintenance
+        lrem     = self.aircraft.lrem
+        tleml    = self.aircraft.tleml       # maintenance man hour line maint.
+        tlemb    = self.aircraft.tlemb       # maintenance man hour base maint.
+        f_eml     = self.aircraft.f_eml        # maintenance frequency line maint
+        f_emb     = self.aircraft.f_emb        # maintenance frequency base maint
+        lifespan = self.aircraft.lifespan
+        util     = self.aircraft.util
         
         electric_machine_maint_line = n_em*(speml + lrem*tleml)*lifespan*f_eml/util
         electric_machine_maint_base = n_em*(spemb + lrem*tlemb)*f_emb*0.80
         return electric_machine_maint_line, electric_machine_maint_base
     
     def _calculate_airframe_maintenance_cost(self) -> float:
-        n_bat     = self.aircraft["n_bat"]         
-        n_em      = self.aircraft["n_em"]
-        n_fc      = self.aircraft["n_fc"]
-        batprice  = self.aircraft["batprice"]
-        fcprice   = self.aircraft["fcprice"]
-        emprice   = self.aircraft["emprice"]
-        bt        = self.aircraft["bt"]
-        adp       = self.aircraft["adp"]
-        en        = self.aircraft["en"]
-        enpri     = self.aircraft["enpri"]
-        mew       = self.aircraft["mew"]
-        bengw     = self.aircraft["bengw"]
-        labor_rate = self.aircraft["labor_rate"]
+        n_bat     = self.aircraft.n_bat         
+        n_em      = self.aircraft.n_em
+        n_fc      = self.aircraft.n_fc
+        batprice  = self.aircraft.batprice
+        fcprice   = self.aircraft.fcprice
+        emprice   = self.aircraft.emprice
+        bt        = self.aircraft.bt
+        adp       = self.aircraft.adp
+        en        = self.aircraft.en
+        enpri     = self.aircraft.enpri
+        mew       = self.aircraft.mew
+        bengw     = self.aircraft.bengw
+        labor_rate = self.aircraft.labor_rate
 
         FT  = bt - self.FLIGHT_TIME_OFFSET
         AFW = mew-(bengw*en)
@@ -280,47 +511,54 @@ class DirectOperatingCost(object):
         return airframe_material_cost + airframe_labor_cost
 
     def _calculate_thermal_engine_maintenance_cost(self) -> float:
-        ieng = self.aircraft["ieng"]
-        en   = self.aircraft["en"]
+        ieng = self.aircraft.ieng
         
         if ieng == 1:
-            bt    = self.aircraft["bt"]
-            labor_rate    = self.aircraft["labor_rate"]
-            shp   = self.aircraft["shp"]
-            enpri = self.aircraft["enpri"]
-
-            FT       = bt - self.FLIGHT_TIME_OFFSET
-            K_ICE_FC = (0.3 + 0.03*shp/1000.0)*en
-            K_ICE_FH = (0.65 + 0.03*shp/1000.0)*en
-            C_ICE_FC = 2.0*en*enpri*10.0
-            C_ICE_FH = 2.5*en*enpri*10.0
-
-            thermal_engine_labor_cost    = (K_ICE_FH*FT + K_ICE_FC)*labor_rate/bt
-            thermal_engine_material_cost = (C_ICE_FH*FT + C_ICE_FC)/bt
-
-            thermal_engine_maintenance_cost = thermal_engine_material_cost + thermal_engine_labor_cost
+            thermal_engine_maintenance_cost = self._calculate_estimated_engine_maintenance_cost()
 
         elif ieng == 2:
-            eoc = self.aircraft["eoc"]
-
-            thermal_engine_maintenance_cost = eoc*en
+            thermal_engine_maintenance_cost = self._calculate_assigned_engine_maintenance_cost()
             
         else:
             raise ValueError(f"ieng Value {ieng} not valid")
         
         return thermal_engine_maintenance_cost
+
+    def _calculate_estimated_engine_maintenance_cost(self) -> float:
+        en    = self.aircraft.en
+        bt    = self.aircraft.bt
+        labor_rate    = self.aircraft.labor_rate
+        shp   = self.aircraft.shp
+        enpri = self.aircraft.enpri
+
+        FT       = bt - self.FLIGHT_TIME_OFFSET
+        K_ICE_FC = (0.3 + 0.03*shp/1000.0)*en
+        K_ICE_FH = (0.65 + 0.03*shp/1000.0)*en
+        C_ICE_FC = 2.0*en*enpri*10.0
+        C_ICE_FH = 2.5*en*enpri*10.0
+
+        thermal_engine_labor_cost    = (K_ICE_FH*FT + K_ICE_FC)*labor_rate/bt
+        thermal_engine_material_cost = (C_ICE_FH*FT + C_ICE_FC)/bt
+
+        return thermal_engine_material_cost + thermal_engine_labor_cost
+
+    def _calculate_assigned_engine_maintenance_cost(self) -> float:
+        eoc = self.aircraft.eoc
+        en  = self.aircraft.en
+
+        return eoc*en
     
     def _calculate_nox_emission_charges(self) -> float:
-        cnox        = self.aircraft["cnox"]
-        nox_value = self.aircraft["nox_value"]
-        bt           = self.aircraft["bt"]
+        cnox        = self.aircraft.cnox
+        nox_value = self.aircraft.nox_value
+        bt           = self.aircraft.bt
 
         return (cnox*nox_value)/bt
 
     def _calculate_co_emission_charges(self) -> float:
-        cco         = self.aircraft["cco"]
-        co_value  = self.aircraft["co_value"]
-        bt           = self.aircraft["bt"]
+        cco         = self.aircraft.cco
+        co_value  = self.aircraft.co_value
+        bt           = self.aircraft.bt
 
         return (cco*co_value)/bt
     
@@ -329,96 +567,96 @@ class DirectOperatingCost(object):
         td      = self._params.TD
         cnoise  = self._params.CNOISE
 
-        l_app   = self.aircraft["l_app"]
-        l_flyov = self.aircraft["l_flyov"]
-        l_lat   = self.aircraft["l_lat"]
-        bt      = self.aircraft["bt"]
+        l_app   = self.aircraft.l_app
+        l_flyov = self.aircraft.l_flyov
+        l_lat   = self.aircraft.l_lat
+        bt      = self.aircraft.bt
 
         DELTAA = (l_app-ta)/10.0
         DELTAD = (((l_flyov+l_lat)/2.0)-td)/10.0
         
-        return (cnoise*(10.0**(DELTAA)+10.0**(DELTAD)))/bt
+        return (cnoise*(self._power(10.0, DELTAA)+self._power(10.0, DELTAD)))/bt
 
     def _calculate_ground_handling_charges(self) -> float:
-        pld   = self.aircraft["pld"]
-        bt    = self.aircraft["bt"]
+        pld   = self.aircraft.pld
+        bt    = self.aircraft.bt
 
         return (self._params.HTONN*pld)/bt
     
     def _calculate_navigation_charges(self) -> float:
-        mtow   = self.aircraft["mtow"]
-        bt     = self.aircraft["bt"]
-        sector = self.aircraft["sector"]
+        mtow   = self.aircraft.mtow
+        bt     = self.aircraft.bt
+        sector = self.aircraft.sector
 
-        return (self._params.ENR*sector*1.853/100.0)*math.sqrt(mtow/50.0)/bt
+        return (self._params.ENR*sector*1.853/100.0)*self._sqrt(mtow/50.0)/bt
     
     def _calculate_landing_fees(self) -> float:
-        mtow = self.aircraft["mtow"]
-        bt   = self.aircraft["bt"]
+        mtow = self.aircraft.mtow
+        bt   = self.aircraft.bt
 
         return (self._params.LANDINGUR*mtow)/bt
 
     def _calculate_cabin_crew_cost(self) -> float:
-        crcabhr = self.aircraft["crcabhr"]
-        crewc   = self.aircraft["crewc"]
+        crcabhr = self.aircraft.crcabhr
+        crewc   = self.aircraft.crewc
 
         return crcabhr*crewc
     
     def _calculate_cockpit_crew_cost(self) -> float:
-        crtechr  = self.aircraft["crtechr"]
-        crewtech = self.aircraft["crewtech"]
+        crtechr  = self.aircraft.crtechr
+        crewtech = self.aircraft.crewtech
 
         return crtechr*crewtech
     
     def _calculate_h2_price(self) -> None:
-        h2_pri = self.aircraft["h2_pri"]
-        h2_req = self.aircraft["h2_req"]
-        bt     = self.aircraft["bt"]
+        h2_pri = self.aircraft.h2_pri
+        h2_req = self.aircraft.h2_req
+        bt     = self.aircraft.bt
 
         return h2_pri*h2_req/bt
     
     def _calculate_electric_energy_price(self) -> None:
-        enerpri  = self.aircraft["enerpri"]
-        ener_req = self.aircraft["ener_req"]
-        bt       = self.aircraft["bt"]
+        enerpri  = self.aircraft.enerpri
+        ener_req = self.aircraft.ener_req
+        bt       = self.aircraft.bt
 
         return ener_req*enerpri/bt
     
     def _calculate_fuel_cost(self) -> float:
-        fuelpri = self.aircraft["fuelpri"]
-        bf      = self.aircraft["bf"]
-        bt      = self.aircraft["bt"]
+        fuelpri = self.aircraft.fuelpri
+        bf      = self.aircraft.bf
+        bt      = self.aircraft.bt
 
         return (0.328*fuelpri*bf)/bt
     
     def _calculate_insurance_cost(self) -> float:
-        rinsh = self.aircraft["rinsh"]
-        adp   = self.aircraft["adp"]*1.0e6
-        util  = self.aircraft["util"]
+        rinsh = self.aircraft.rinsh
+        adp   = self.aircraft.adp*1.0e6
+        util  = self.aircraft.util
 
         return (rinsh*adp)/util
     
     def _calculate_investment(self) -> float:
-        adp     = self.aircraft["adp"]*1.0e6
-        afspare = self.aircraft["afspare"]
-        enpri   = self.aircraft["enpri"]*1.0e6
-        en      = self.aircraft["en"]
-        enspare = self.aircraft["enspare"]
+        adp     = self.aircraft.adp*1.0e6
+        afspare = self.aircraft.afspare
+        enpri   = self.aircraft.enpri*1.0e6
+        en      = self.aircraft.en
+        enspare = self.aircraft.enspare
 
         return adp+(afspare*(adp-enpri*en))+(enspare*enpri*en)
     
-    def _calculate_interest(self) -> float:
-        util = self.aircraft["util"]
+    def _calculate_interest(self, investment:float=None) -> float:
+        util = self.aircraft.util
 
-        INVEST = self._calculate_investment()
+        INVEST = self._calculate_investment() if investment is None else investment
         
         return (self._params.INTEREST_RATE*INVEST)/util
         
-    def _calculate_depreciation(self) -> float:
-        rval   = self.aircraft["rval"]
-        dyrs   = self.aircraft["dyrs"]
-        util   = self.aircraft["util"]
+    def _calculate_depreciation(self, investment:float=None) -> float:
+        rval   = self.aircraft.rval
+        dyrs   = self.aircraft.dyrs
+        util   = self.aircraft.util
 
-        INVEST = self._calculate_investment()
+        INVEST = self._calculate_investment() if investment is None else investment
 
         return ((1-rval)*INVEST)/(dyrs*util)
\ No newline at end of file
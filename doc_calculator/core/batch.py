@@ -0,0 +1,87 @@
+from .DOC_Calculator import DirectOperatingCost
+from .utils.params import Params
+from .utils.profiling import TimingStats, active_stats
+from .utils.result import CostResult
+from .utils.schema import INPUT_SCHEMA
+from .utils.util_functions import _assign_input
+from typing import Dict
+import numpy as np
+
+# labels of the `calculate_doc` (cost lines and DOC totals) and `calculate_ioc` rows of a CostResult
+_DOC_LABELS = tuple(CostResult.LABELS.values())[:CostResult.INDEX["doc_flight"] + 1]
+_IOC_LABELS = (CostResult.LABELS["ioc_bhr"], CostResult.LABELS["ioc_flight"])
+
+class BatchDirectOperatingCost(DirectOperatingCost):
+
+    _sqrt  = staticmethod(np.sqrt)
+    _power = staticmethod(np.power)
+
+    def __init__(self, aircraft:dict, params:Params=Params(), stats:TimingStats=None) -> None:
+        """
+        ### Description
+        Vectorized counterpart of `DirectOperatingCost`. Each key of the
+        aircraft dict holds a scalar or an array (one entry per design); all
+        values are broadcast to a common shape and the cost terms are evaluated
+        as NumPy expressions, reproducing the scalar results (bit by bit, but
+        for the `np.power` noise terms, which may differ from libm pow() in
+        the last ulp, and the totals summing them).
+
+        `calculate_doc`, `calculate_ioc` and `calculate_all` return the same
+        labelled dicts of the scalar class, their arrays being views of the
+        rows of the `calculate_result` block: the cost lines are copied once
+        into the block and the totals computed on its rows.
+
+        See `DirectOperatingCost` for the list of accepted keys and the
+        optional `stats` instrumentation.
+        """
+        stats = stats if stats is not None else active_stats()
+
+        if stats is None:
+            self.aircraft = self._broadcast_input(aircraft)
+        else:
+            self.aircraft = stats.wrap("normalize_input", self._broadcast_input)(aircraft)
+            stats.instrument(self, self._timed_methods())
+
+        self._params = params
+
+        return None
+
+    def calculate_doc(self) -> Dict[str, np.ndarray]:
+        result = self.calculate_result()
+        return {label: result[label] for label in _DOC_LABELS}
+
+    def calculate_ioc(self) -> Dict[str, np.ndarray]:
+        result = self.calculate_result()
+        return {label: result[label] for label in _IOC_LABELS}
+
+    def calculate_all(self) -> Dict[str, np.ndarray]:
+        return self.calculate_result().as_dict()
+
+    @staticmethod
+    def _broadcast_input(aircraft:dict):
+        # private copies: the broadcast views below are read-only, so the input
+        # state can only change by replacing entries (see `_evaluate`)
+        arrays = [np.array(value, dtype=np.float64) for value in _assign_input(input=aircraft).values()]
+        shape  = np.broadcast_shapes(*(value.shape for value in arrays))
+
+        return INPUT_SCHEMA.record_type._from_values([np.broadcast_to(value, shape) for value in arrays])
+
+    @property
+    def shape(self) -> tuple:
+        return self.aircraft.bt.shape
+
+    def _set_input(self, name:str, value) -> None:
+        # same copy/broadcast rules as the constructor: the batch shape cannot change
+        setattr(self.aircraft, name, np.broadcast_to(np.array(value, dtype=np.float64), self.shape))
+
+    def _calculate_thermal_engine_maintenance_cost(self) -> np.ndarray:
+        ieng = self.aircraft.ieng
+
+        invalid = (ieng != 1) & (ieng != 2)
+        if np.any(invalid):
+            raise ValueError(f"ieng Value {ieng[invalid][0]} not valid")
+
+        # masked select between the two branches of the scalar method
+        return np.where(ieng == 1,
+                        self._calculate_estimated_engine_maintenance_cost(),
+                        self._calculate_assigned_engine_maintenance_cost())
@@ -0,0 +1,266 @@
+from .parallel import DEFAULT_OUTPUTS, evaluate_samples
+from .utils.params import Params, params_values
+from .utils.schema import INPUT_SCHEMA
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, Iterator, Mapping, Sequence, Tuple
+import numpy as np
+import hashlib
+import json
+import os
+
+MANIFEST = "manifest.json"
+
+
+def run_resumable_campaign(aircraft:dict, samples:np.ndarray, names:Sequence[str], directory:str,
+                           params:Params=Params(), outputs:Sequence[str]=DEFAULT_OUTPUTS, chunk_size:int=100000,
+                           n_workers:int=1, evaluate:Callable[..., Mapping]=None) -> "CampaignStore":
+    """
+    ### Description
+    Evaluate a DOE / Monte Carlo sample matrix chunk by chunk into an
+    append-only store on disk, so that a campaign killed halfway resumes
+    where it stopped instead of starting over.
+
+    Every finished chunk is written to its own `.npy` file (temporary file,
+    fsync, atomic rename) and only then recorded in the store manifest,
+    with a digest of its samples. Run again with the same arguments, the
+    campaign skips the recorded chunks and evaluates the others: a crash
+    loses at most the chunks in progress. Only `chunk_size` samples per
+    worker are held in memory, `samples` may be a memory-mapped `.npy`
+    file (`np.load(path, mmap_mode="r")`).
+
+    ### Arguments
+    - aircraft    Base aircraft input dict (values shared by all the samples)
+    - samples     (n_samples, n_variables) array of sampled inputs
+    - names       Aircraft input (or "Params.<FIELD>") name of every sample column
+    - directory   Store directory (created if needed)
+    - params      Params economic scenario
+    - outputs     Result labels stored column by column
+    - chunk_size  Number of samples per chunk (one file and one batch evaluation each)
+    - n_workers   Number of worker processes (1 runs in-process)
+    - evaluate    Evaluation of a chunk, `evaluate(aircraft, samples, names, params)`
+                  returning a dict {label: array} (default: `evaluate_samples`,
+                  the batch engine); with n_workers > 1 it must be picklable
+                  (a module level function), e.g. running the GEMSEO batch discipline
+
+    ### Returns
+    CampaignStore over the results. Raises ValueError if the store holds a
+    campaign with other settings (base aircraft, Params, outputs, ...) or
+    samples.
+    """
+    samples = np.asarray(samples)
+    if samples.ndim != 2 or samples.shape[1] != len(names):
+        raise ValueError(f"samples shape {samples.shape} does not match the {len(names)} variable names")
+
+    evaluate = evaluate or evaluate_samples
+    settings = {
+        "n_samples": int(samples.shape[0]),
+        "chunk_size": int(chunk_size),
+        "names": list(names),
+        "outputs": list(outputs),
+        "aircraft": _digest(np.concatenate([np.ravel(np.asarray(value, dtype=np.float64))
+                                            for value in INPUT_SCHEMA.normalize(aircraft).values()])),
+        "params": list(params_values(params)),
+        "evaluate": f"{evaluate.__module__}.{getattr(evaluate, '__qualname__', type(evaluate).__qualname__)}",
+    }
+
+    store   = CampaignStore.create(directory, settings)
+    pending = [(index, start, stop) for index, (start, stop) in enumerate(store.chunk_bounds())
+               if not store.is_done(index, _digest(samples[start:stop]))]
+
+    if n_workers == 1 or len(pending) < 2:
+        for index, start, stop in pending:
+            chunk = np.ascontiguousarray(samples[start:stop], dtype=np.float64)
+            store.record(*_evaluate_chunk(store.directory, index, evaluate, aircraft, chunk, names, params, outputs))
+        return store
+
+    # at most two chunks per worker in flight: constant memory whatever the number of samples
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        running = set()
+        for index, start, stop in pending:
+            if len(running) >= 2*n_workers:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for task in done:
+                    store.record(*task.result())
+            chunk = np.ascontiguousarray(samples[start:stop], dtype=np.float64)
+            running.add(executor.submit(_evaluate_chunk, store.directory, index, evaluate, aircraft, chunk,
+                                        names, params, tuple(outputs)))
+        for task in running:
+            store.record(*task.result())
+
+    return store
+
+
+class CampaignStore(object):
+
+    def __init__(self, directory:str) -> None:
+        """
+        ### Description
+        Append-only result store of `run_resumable_campaign`: one
+        (rows, n_outputs) float64 `.npy` file per finished chunk and a JSON
+        manifest holding the campaign settings and the finished chunks.
+
+        The results are read through memory maps of the chunk files, without
+        loading the campaign in memory:
+
+        - store[i], store[start:stop]  rows of the combined results
+        - store.column(label)          one output over all the samples
+        - store.iter_chunks()          (start, stop, rows) of every finished chunk
+        - store.consolidate(path)      single `.npy` file of all the results
+
+            store = CampaignStore("doe")
+            store.complete, store.progress
+        """
+        self.directory = directory
+        with open(os.path.join(directory, MANIFEST)) as file:
+            self.manifest = json.load(file)
+
+        return None
+
+    @classmethod
+    def create(cls, directory:str, settings:Dict[str, object]) -> "CampaignStore":
+        """Store of a campaign, resumed if `directory` already holds a campaign with the same settings."""
+        os.makedirs(directory, exist_ok=True)
+        for name in os.listdir(directory):
+            if name.endswith(".tmp"):
+                os.remove(os.path.join(directory, name))
+
+        if os.path.exists(os.path.join(directory, MANIFEST)):
+            store = cls(directory)
+            if store.manifest["settings"] != settings:
+                raise ValueError(f"{directory} holds a campaign with other settings: "
+                                 f"{store.manifest['settings']} instead of {settings}")
+            return store
+
+        _write_atomic(os.path.join(directory, MANIFEST), json.dumps({"settings": settings, "chunks": {}}).encode())
+        return cls(directory)
+
+    @property
+    def settings(self) -> Dict[str, object]:
+        return self.manifest["settings"]
+
+    @property
+    def outputs(self) -> Tuple[str, ...]:
+        return tuple(self.settings["outputs"])
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.settings["n_samples"], len(self.outputs))
+
+    @property
+    def progress(self) -> Tuple[int, int]:
+        """Number of finished chunks and total number of chunks."""
+        return len(self.manifest["chunks"]), len(self.chunk_bounds())
+
+    @property
+    def complete(self) -> bool:
+        done, total = self.progress
+        return done == total
+
+    def __len__(self) -> int:
+        return self.settings["n_samples"]
+
+    def __repr__(self) -> str:
+        done, total = self.progress
+        return f"CampaignStore({self.directory!r}, {done}/{total} chunks, outputs={self.outputs})"
+
+    def chunk_bounds(self) -> list:
+        n_samples, chunk_size = self.settings["n_samples"], self.settings["chunk_size"]
+        return [(start, min(start + chunk_size, n_samples)) for start in range(0, n_samples, chunk_size)]
+
+    def is_done(self, index:int, digest:str) -> bool:
+        """True if the chunk is recorded; raises ValueError if it was evaluated with other samples."""
+        chunk = self.manifest["chunks"].get(str(index))
+        if chunk is None or not os.path.exists(os.path.join(self.directory, chunk["file"])):
+            return False
+        if chunk["digest"] != digest:
+            raise ValueError(f"The samples of chunk {index} differ from the ones stored in {self.directory}")
+        return True
+
+    def record(self, index:int, file:str, digest:str) -> None:
+        """Add a chunk, its file being already written, to the manifest (atomically replaced)."""
+        self.manifest["chunks"][str(index)] = {"file": file, "digest": digest}
+        _write_atomic(os.path.join(self.directory, MANIFEST), json.dumps(self.manifest).encode())
+
+        return None
+
+    def iter_chunks(self) -> Iterator[Tuple[int, int, np.ndarray]]:
+        """(start, stop, read-only memory map of the rows) of every finished chunk, in the sample order."""
+        for index, (start, stop) in enumerate(self.chunk_bounds()):
+            chunk = self.manifest["chunks"].get(str(index))
+            if chunk is not None:
+                yield start, stop, np.load(os.path.join(self.directory, chunk["file"]), mmap_mode="r")
+
+    def __getitem__(self, key) -> np.ndarray:
+        if isinstance(key, (int, np.integer)):
+            index = key + len(self) if key < 0 else key
+            return self[index:index + 1][0]
+        if not isinstance(key, slice) or key.step not in (None, 1):
+            raise TypeError("A CampaignStore is indexed with an integer or a slice of rows")
+
+        start, stop, _ = key.indices(len(self))
+        rows           = np.empty((max(stop - start, 0), len(self.outputs)))
+        chunk_size     = self.settings["chunk_size"]
+        for index in range(start//chunk_size, -(-stop//chunk_size)):
+            chunk = self.manifest["chunks"].get(str(index))
+            if chunk is None:
+                raise KeyError(f"Chunk {index} (rows {index*chunk_size} to {(index + 1)*chunk_size}) is not finished")
+            values = np.load(os.path.join(self.directory, chunk["file"]), mmap_mode="r")
+            first  = max(start, index*chunk_size)
+            last   = min(stop, index*chunk_size + len(values))
+            rows[first - start:last - start] = values[first - index*chunk_size:last - index*chunk_size]
+        return rows
+
+    def column(self, label:str) -> np.ndarray:
+        """One output over all the samples (all the chunks must be finished)."""
+        self._require_complete()
+        j      = self.outputs.index(label)
+        values = np.empty(len(self))
+        for start, stop, rows in self.iter_chunks():
+            values[start:stop] = rows[:, j]
+        return values
+
+    def consolidate(self, path:str) -> np.ndarray:
+        """Copy the results chunk by chunk to one `.npy` file, returned as a read-only memmap."""
+        self._require_complete()
+        result = np.lib.format.open_memmap(path + ".tmp", "w+", np.float64, self.shape)
+        for start, stop, rows in self.iter_chunks():
+            result[start:stop] = rows
+        result.flush()
+        del result
+        os.replace(path + ".tmp", path)
+        return np.load(path, mmap_mode="r")
+
+    def _require_complete(self) -> None:
+        if not self.complete:
+            done, total = self.progress
+            raise ValueError(f"The campaign in {self.directory} is not complete ({done}/{total} chunks)")
+
+
+def _evaluate_chunk(directory:str, index:int, evaluate:Callable[..., Mapping], aircraft:dict, samples:np.ndarray,
+                    names:Sequence[str], params:Params, outputs:Sequence[str]) -> Tuple[int, str, str]:
+    # evaluates and writes a chunk (in a worker process with n_workers > 1): the parent only records it
+    values = evaluate(aircraft, samples, names, params)
+    rows   = np.empty((samples.shape[0], len(outputs)))
+    for j, label in enumerate(outputs):
+        rows[:, j] = values[label]
+
+    file = f"chunk_{index:06d}.npy"
+    with open(os.path.join(directory, file + ".tmp"), "wb") as stream:
+        np.save(stream, rows, allow_pickle=False)
+        stream.flush()
+        os.fsync(stream.fileno())
+    os.replace(os.path.join(directory, file + ".tmp"), os.path.join(directory, file))
+
+    return index, file, _digest(samples)
+
+
+def _digest(samples:np.ndarray) -> str:
+    return hashlib.blake2b(np.ascontiguousarray(samples, dtype=np.float64).data, digest_size=16).hexdigest()
+
+
+def _write_atomic(path:str, data:bytes) -> None:
+    with open(path + ".tmp", "wb") as stream:
+        stream.write(data)
+        stream.flush()
+        os.fsync(stream.fileno())
+    os.replace(path + ".tmp", path)
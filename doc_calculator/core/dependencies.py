@@ -0,0 +1,83 @@
+from .DOC_Calculator import DirectOperatingCost
+from .utils.params import PARAMS_FIELDS, Params
+from .utils.schema import INPUT_SCHEMA
+from typing import FrozenSet, Iterable, Set
+import functools
+
+
+class DependencyGraph(object):
+
+    def __init__(self, calculator_type:type=DirectOperatingCost) -> None:
+        """
+        ### Description
+        Map between the inputs and the cost terms of a calculator class,
+        built by tracing the aircraft inputs and `Params` fields every
+        `_calculate_*` term reads (with both `ieng` branches of the thermal
+        engine maintenance term).
+
+        - terms       Cost term method -> cost line labels it evaluates
+        - reads       Cost term method -> input names it reads (lowercase aircraft
+                      inputs and upper case `Params` field names)
+        - dependents  Input name -> cost term methods reading it
+        """
+        self.terms = {**calculator_type._FINANCIAL_TERMS, **calculator_type._OPERATING_TERMS}
+        self.reads = {method: _trace_reads(calculator_type, method) for method in self.terms}
+
+        dependents = {name: set() for name in (*INPUT_SCHEMA.names, *PARAMS_FIELDS)}
+        for method, names in self.reads.items():
+            for name in names:
+                dependents[name].add(method)
+        self.dependents = {name: frozenset(methods) for name, methods in dependents.items()}
+
+        return None
+
+    def affected_terms(self, names:Iterable[str]) -> Set[str]:
+        """Cost term methods to recompute when the given inputs change."""
+        affected = set()
+        for name in names:
+            affected |= self.dependents[name]
+        return affected
+
+
+@functools.lru_cache(maxsize=None)
+def dependency_graph(calculator_type:type=DirectOperatingCost) -> DependencyGraph:
+    """Dependency graph of a calculator class, built once and cached."""
+    return DependencyGraph(calculator_type)
+
+
+class _TracingRecord(object):
+
+    # aircraft record stand-in answering 1.0 (ieng: the traced branch) and logging the reads
+    def __init__(self, reads:Set[str], ieng:int) -> None:
+        self._reads = reads
+        self._ieng  = ieng
+
+    def __getattr__(self, name:str) -> float:
+        if name not in INPUT_SCHEMA.index:
+            raise AttributeError(name)
+        self._reads.add(name)
+        return float(self._ieng) if name == "ieng" else 1.0
+
+
+class _TracingParams(object):
+
+    # Params stand-in returning the default values and logging the reads
+    def __init__(self, reads:Set[str]) -> None:
+        self._reads  = reads
+        self._params = Params()
+
+    def __getattr__(self, name:str) -> float:
+        self._reads.add(name)
+        return getattr(self._params, name)
+
+
+def _trace_reads(calculator_type:type, method:str) -> FrozenSet[str]:
+    reads = set()
+
+    for ieng in (1, 2):
+        calculator          = calculator_type.__new__(calculator_type)
+        calculator.aircraft = _TracingRecord(reads, ieng)
+        calculator._params  = _TracingParams(reads)
+        getattr(calculator, method)()
+
+    return frozenset(reads)
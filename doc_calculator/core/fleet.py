@@ -0,0 +1,240 @@
+from .batch import BatchDirectOperatingCost
+from .mission import MissionTable
+from .utils.params import Params
+from .utils.schema import INPUT_SCHEMA
+from typing import Dict, Mapping, Sequence, Tuple
+import numpy as np
+
+
+def cost_matrix(fleet:Mapping[str, Mapping], routes:Mapping[str, Sequence], params:Params=Params(),
+                missions:Mapping[str, MissionTable]=None) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """
+    ### Description
+    Operating costs of every aircraft type on every route, from one batch
+    evaluation over an (n_types, n_routes) grid.
+
+    Each route table column named after an aircraft input (case insensitive,
+    e.g. sector, bt, bf, co2_value) overrides the aircraft definitions for
+    that route; a column may also be a scalar shared by all the routes or
+    an (n_types, n_routes) array of type-specific values. With `missions`, the tabulated inputs of each type
+    (bt, bf, energy, emissions, ...) are interpolated at the route sectors,
+    the routes out of the sector range of a table being infeasible for that
+    type.
+
+    ### Arguments
+    - fleet     Dict {aircraft type name: aircraft input dict}
+    - routes    Dict of route columns (the other columns are ignored)
+    - params    Params economic scenario
+    - missions  Optional dict {aircraft type name: MissionTable}
+
+    ### Returns
+    Tuple (results, feasible): dict {result label: (n_types, n_routes) array}
+    (block times added as "BT [h]") and the (n_types, n_routes) boolean
+    array of the type/route pairs the mission tables cover (all True
+    without `missions`).
+    """
+    types    = list(fleet)
+    matrix   = INPUT_SCHEMA.pack(fleet[name] for name in types)
+    inputs   = {name: matrix[:, i, None] for i, name in enumerate(INPUT_SCHEMA.names)}
+    columns  = 0
+    n_routes = 1
+
+    # a scalar column holds a value shared by all the routes
+    for key, values in routes.items():
+        name = INPUT_SCHEMA.canonical(key)
+        if name is None:
+            continue
+        values       = np.asarray(values, dtype=np.float64)
+        inputs[name] = values if values.ndim != 1 else values[None, :]
+        columns     += 1
+        if values.ndim:
+            n_routes = values.shape[-1]
+
+    if not columns:
+        raise ValueError("The route table must hold at least one aircraft input column (e.g. sector)")
+
+    shape    = (len(types), n_routes)
+    feasible = np.ones(shape, dtype=bool)
+
+    if missions:
+        sector = np.broadcast_to(inputs["sector"], shape)
+        for name in {column for table in missions.values() for column in table.columns}:
+            inputs[name] = np.array(np.broadcast_to(inputs[name], shape))
+        for i, name in enumerate(types):
+            table = missions.get(name)
+            if table is None:
+                continue
+            for column, values in table.interpolate(sector[i], extrapolate=True).items():
+                inputs[column][i] = values
+            feasible[i] = (sector[i] >= table.sector[0]) & (sector[i] <= table.sector[-1])
+
+    calculator = BatchDirectOperatingCost(inputs, params=params)
+    results    = {label: np.broadcast_to(value, shape) for label, value in calculator.calculate_all().items()}
+
+    return {**results, "BT [h]": np.broadcast_to(calculator.aircraft.bt, shape)}, feasible
+
+
+class FleetAssignment(object):
+
+    def __init__(self, types:Sequence[str], flights:np.ndarray, results:Dict[str, np.ndarray], method:str) -> None:
+        """
+        ### Description
+        Assignment plan returned by `assign_fleet`:
+
+        - types    Aircraft type names (rows)
+        - flights  (n_types, n_routes) number of flights of every type on every route
+        - results  Cost matrices {result label: (n_types, n_routes) array} of `cost_matrix`
+        - method   Solver used ("lp" or "greedy")
+        """
+        self.types   = list(types)
+        self.flights = flights
+        self.results = results
+        self.method  = method
+
+        return None
+
+    @property
+    def total_cost(self) -> float:
+        """Total DOC [USD] of the plan."""
+        return float(np.sum(self.flights*self.results["DOC [USD/flight]"]))
+
+    @property
+    def route_types(self) -> np.ndarray:
+        """Index of the type flying the most flights on every route."""
+        return np.argmax(self.flights, axis=0)
+
+    def breakdown(self) -> Dict[str, Dict[str, float]]:
+        """
+        ### Description
+        Cost breakdown of the plan per aircraft type: flights, block hours,
+        routes served and the total [USD] of every DOC cost line, DOC, IOC
+        and TOC.
+        """
+        hours   = self.flights*self.results["BT [h]"]
+        per_bhr = [label for label in self.results if label.endswith(("[USD/BHR]", "[USD/BH]"))]
+
+        breakdown = {}
+        for i, name in enumerate(self.types):
+            flights = self.flights[i]
+            lines   = {label.rsplit(" [", 1)[0] + " [USD]": float(hours[i] @ self.results[label][i]) for label in per_bhr}
+            breakdown[name] = {"flights": float(flights.sum()), "block_hours": float(hours[i].sum()),
+                               "routes": int(np.count_nonzero(flights > 0.0)), **lines}
+
+        return breakdown
+
+    def report(self) -> str:
+        """Table of the flights, block hours and DOC/IOC/TOC of every type."""
+        lines = [f"{'type':20s}{'routes':>8s}{'flights':>12s}{'block hours':>14s}{'DOC [USD]':>16s}{'IOC [USD]':>16s}{'TOC [USD]':>16s}"]
+        for name, values in self.breakdown().items():
+            lines.append(f"{name:20s}{values['routes']:8d}{values['flights']:12.1f}{values['block_hours']:14.1f}"
+                         f"{values['DOC [USD]']:16.0f}{values['IOC [USD]']:16.0f}{values['TOC [USD]']:16.0f}")
+        lines.append(f"{'total':20s}{'':8s}{self.flights.sum():12.1f}{'':14s}{self.total_cost:16.0f}")
+        return "\n".join(lines)
+
+
+def assign_fleet(fleet:Mapping[str, Mapping], routes:Mapping[str, Sequence], frequency, available_hours:Mapping[str, float],
+                 params:Params=Params(), missions:Mapping[str, MissionTable]=None, feasible:np.ndarray=None,
+                 method:str="auto") -> FleetAssignment:
+    """
+    ### Description
+    Choose which aircraft type flies which route at minimum total DOC:
+
+        minimize    sum(flights*DOC [USD/flight])
+        subject to  sum over the types of flights = frequency          (every route)
+                    sum over the routes of flights*bt <= available_hours (every type)
+                    flights >= 0, 0 on the infeasible type/route pairs
+
+    solved as a linear program with SciPy (HiGHS) when available, otherwise
+    with a greedy heuristic serving the routes by decreasing regret (cost
+    gap between their cheapest and second cheapest type). The flights are
+    continuous: a route may be split between types when a fleet runs out
+    of hours.
+
+    ### Arguments
+    - fleet            Dict {aircraft type name: aircraft input dict}
+    - routes           Dict of route columns (see `cost_matrix`)
+    - frequency        Flights required on every route (scalar or (n_routes,) array)
+    - available_hours  Dict {aircraft type name: block hours available} (e.g. fleet size times
+                       the utilisation over the planning period)
+    - params           Params economic scenario
+    - missions         Optional dict {aircraft type name: MissionTable} (see `cost_matrix`)
+    - feasible         Optional (n_types, n_routes) boolean array of the allowed pairs (range, runway, ...)
+    - method           "lp", "greedy" or "auto" (LP when SciPy is installed)
+
+    ### Returns
+    FleetAssignment. Raises ValueError when the demand cannot be served.
+    """
+    results, covered = cost_matrix(fleet, routes, params, missions)
+
+    cost     = results["DOC [USD/flight]"]
+    bt       = results["BT [h]"]
+    allowed  = covered & np.isfinite(cost) if feasible is None else covered & np.isfinite(cost) & np.asarray(feasible, dtype=bool)
+    demand   = np.broadcast_to(np.asarray(frequency, dtype=np.float64), cost.shape[1:])
+    capacity = np.array([available_hours[name] for name in fleet], dtype=np.float64)
+
+    if method == "auto":
+        try:
+            import scipy.optimize
+            method = "lp"
+        except ImportError:
+            method = "greedy"
+
+    if method == "lp":
+        flights = _solve_lp(cost, bt, allowed, demand, capacity)
+    elif method == "greedy":
+        flights = _solve_greedy(cost, bt, allowed, demand, capacity)
+    else:
+        raise ValueError(f"Unknown method '{method}'")
+
+    return FleetAssignment(list(fleet), flights, results, method)
+
+
+def _solve_lp(cost:np.ndarray, bt:np.ndarray, allowed:np.ndarray, demand:np.ndarray, capacity:np.ndarray) -> np.ndarray:
+    from scipy.optimize import linprog
+    from scipy.sparse import csr_array
+
+    # one variable per allowed (type, route) pair: a demand row per route, an hours row per type
+    n_types, n_routes = cost.shape
+    kinds, routes     = np.nonzero(allowed)
+    pairs             = np.arange(kinds.size)
+
+    served = csr_array((np.ones(pairs.size), (routes, pairs)), shape=(n_routes, pairs.size))
+    hours  = csr_array((bt[kinds, routes], (kinds, pairs)), shape=(n_types, pairs.size))
+
+    solution = linprog(cost[kinds, routes], A_ub=hours, b_ub=capacity, A_eq=served, b_eq=demand,
+                       bounds=(0.0, None), method="highs")
+    if solution.status == 2:
+        raise ValueError("Fleet assignment failed: the demand cannot be served with the available hours")
+    if solution.status != 0:
+        raise ValueError(f"Fleet assignment failed: {solution.message}")
+
+    flights = np.zeros(cost.shape)
+    flights[kinds, routes] = solution.x
+    return flights
+
+
+def _solve_greedy(cost:np.ndarray, bt:np.ndarray, allowed:np.ndarray, demand:np.ndarray, capacity:np.ndarray) -> np.ndarray:
+    n_types, n_routes = cost.shape
+    flights   = np.zeros(cost.shape)
+    remaining = capacity.copy()
+
+    masked = np.where(allowed, cost, np.inf)
+    order  = np.argsort(masked, axis=0)
+    ranked = np.take_along_axis(masked, order, axis=0)
+    regret = ranked[1] - ranked[0] if n_types > 1 else ranked[0]
+    regret = np.where(np.isfinite(regret), regret, np.inf)
+
+    for route in np.argsort(-regret, kind="stable"):
+        needed = demand[route]
+        for kind in order[:, route]:
+            if needed <= 0.0 or not allowed[kind, route]:
+                break
+            served = min(needed, remaining[kind]/bt[kind, route])
+            if served > 0.0:
+                flights[kind, route] += served
+                remaining[kind]      -= served*bt[kind, route]
+                needed               -= served
+        if needed > 1.0e-9*max(demand[route], 1.0):
+            raise ValueError(f"Fleet assignment failed: route {route} cannot be served with the available hours")
+
+    return flights
@@ -0,0 +1,201 @@
+from .DOC_Calculator import DirectOperatingCost
+from .utils.params import PARAMS_FIELDS, Params, params_values
+from .utils.schema import INPUT_SCHEMA
+from typing import Callable, Dict, List, Tuple
+import functools
+import inspect
+import textwrap
+import ast
+import math
+
+
+def fused_evaluator(params:Params=Params(), calculator_type:type=DirectOperatingCost) -> Callable[..., tuple]:
+    """
+    ### Description
+    Flat Python function evaluating all the cost lines and totals of
+    `calculator_type` for one design, generated once from the source of its
+    `_calculate_*` cost terms: the terms are inlined (the helper terms, e.g.
+    the investment, evaluated once), the aircraft inputs become positional
+    arguments and the `Params` values constants. The totals are summed in
+    the order of `calculate_doc`/`calculate_ioc`: the results match the
+    calculator bit by bit.
+
+    The function takes the aircraft inputs as positional floats in the
+    `INPUT_SCHEMA.names` order (lowercase canonical names, defaults
+    included) and returns a tuple in the `calculate_all` order, whose labels
+    are given by its `labels` attribute (its `source` attribute holds the
+    generated code):
+
+        evaluate = fused_evaluator(params)
+        values   = evaluate(*INPUT_SCHEMA.normalize(aircraft).values())
+        results  = dict(zip(evaluate.labels, values))
+
+    Evaluators are cached per calculator class and Params values.
+    """
+    return _fused_evaluator(calculator_type, params_values(params))
+
+
+@functools.lru_cache(maxsize=64)
+def _fused_evaluator(calculator_type:type, values:tuple) -> Callable[..., tuple]:
+    source    = _FusedSource(calculator_type, dict(zip(PARAMS_FIELDS, values))).generate()
+    namespace = {"_sqrt": calculator_type._sqrt, "_power": calculator_type._power, "math": math}
+    exec(compile(source, f"<fused {calculator_type.__name__}>", "exec"), namespace)
+
+    evaluate        = namespace["fused_doc"]
+    evaluate.labels = (*(label for terms in (calculator_type._FINANCIAL_TERMS, calculator_type._OPERATING_TERMS)
+                         for labels in terms.values() for label in labels),
+                       "DOC [USD/BHR]", "DOC [USD/flight]", "IOC [USD/BHR]", "IOC [USD/flight]",
+                       "TOC [USD/BHR]", "TOC [USD/flight]")
+    evaluate.source = source
+    return evaluate
+
+
+class _FusedSource(object):
+
+    # generates the source of the fused function, inlining one cost term method after the other
+    def __init__(self, calculator_type:type, params:Dict[str, float]) -> None:
+        self.calculator_type = calculator_type
+        self.params          = params
+        self.body            = []
+        self.results         = {}
+
+    def generate(self) -> str:
+        financial = [name for method in self.calculator_type._FINANCIAL_TERMS for name in self._inline(method)]
+        operating = [name for method in self.calculator_type._OPERATING_TERMS for name in self._inline(method)]
+
+        totals = f"""
+            _financial  = {" + ".join(financial)}
+            _operating  = {" + ".join(operating)}
+            _doc_bhr    = _financial + _operating
+            _doc_flight = bt*_doc_bhr
+            _ioc_bhr    = ioc_fact*_operating
+            _ioc_flight = bt*_ioc_bhr
+            return ({", ".join(financial + operating)},
+                    _doc_bhr, _doc_flight, _ioc_bhr, _ioc_flight, _doc_bhr + _ioc_bhr, _doc_flight + _ioc_flight)
+        """
+        function      = ast.parse(f"def fused_doc({', '.join(INPUT_SCHEMA.names)}): pass").body[0]
+        function.body = self.body + ast.parse(textwrap.dedent(totals)).body
+
+        return ast.unparse(ast.fix_missing_locations(ast.Module(body=[function], type_ignores=[])))
+
+    def _inline(self, method:str) -> List[str]:
+        # appends the statements of `method` to the body, returns the name(s) holding its result
+        if method in self.results:
+            return self.results[method]
+
+        definition = ast.parse(textwrap.dedent(inspect.getsource(getattr(self.calculator_type, method)))).body[0]
+        prefix     = f"_{method[len('_calculate_'):]}_"
+        statements = definition.body
+
+        if not isinstance(statements[-1], ast.Return):
+            raise TypeError(f"{method} must end with a return statement")
+
+        # optional arguments take their default value
+        arguments = definition.args.args[1:]
+        if len(definition.args.defaults) != len(arguments):
+            raise TypeError(f"The arguments of {method} must all have a default value")
+        for argument, default in zip(arguments, definition.args.defaults):
+            self.body.append(ast.Assign(targets=[ast.Name(prefix + argument.arg, ast.Store())], value=default))
+
+        transformer = _InlineTransformer(self, prefix, _aliases(statements))
+        for statement in statements[:-1]:
+            if _is_docstring(statement) or transformer.is_alias(statement):
+                continue
+            self._append(transformer, statement)
+
+        value   = statements[-1].value
+        n_names = len(value.elts) if isinstance(value, ast.Tuple) else 1
+        names   = [f"{prefix}result{i if n_names > 1 else ''}" for i in range(n_names)]
+        target  = ast.Tuple([ast.Name(name, ast.Store()) for name in names], ast.Store()) if n_names > 1 else ast.Name(names[0], ast.Store())
+        self.body.append(ast.Assign(targets=[target], value=transformer.visit(value)))
+
+        self.results[method] = names
+        return names
+
+    def _append(self, transformer:"_InlineTransformer", statement:ast.stmt) -> None:
+        # helper terms called by the statement are inlined (by `visit_Call`) before it
+        self.body.append(transformer.visit(statement))
+
+
+class _InlineTransformer(ast.NodeTransformer):
+
+    def __init__(self, source:_FusedSource, prefix:str, aliases:Dict[str, str]) -> None:
+        self.source  = source
+        self.prefix  = prefix
+        self.aliases = aliases
+
+    def is_alias(self, statement:ast.stmt) -> bool:
+        return isinstance(statement, ast.Assign) and _assigned_name(statement) in self.aliases
+
+    def visit_Name(self, node:ast.Name) -> ast.Name:
+        if node.id in self.aliases:
+            return ast.Name(self.aliases[node.id], node.ctx)
+        if node.id in ("math", "ValueError", "None"):
+            return node
+        return ast.Name(self.prefix + node.id, node.ctx)
+
+    def visit_Attribute(self, node:ast.Attribute) -> ast.expr:
+        owner = node.value
+        if _is_self(owner):
+            if node.attr in ("_sqrt", "_power"):
+                return ast.Name(node.attr, ast.Load())
+            value = getattr(self.source.calculator_type, node.attr)
+            if isinstance(value, (int, float)):
+                return ast.Constant(value)
+        elif isinstance(owner, ast.Attribute) and _is_self(owner.value):
+            if owner.attr == "aircraft" and node.attr in INPUT_SCHEMA.index:
+                return ast.Name(node.attr, ast.Load())
+            if owner.attr == "_params" and node.attr in self.source.params:
+                return ast.Constant(self.source.params[node.attr])
+        elif isinstance(owner, ast.Name) and owner.id == "math":
+            return node
+
+        raise TypeError(f"Cannot inline the expression {ast.unparse(node)}")
+
+    def visit_Call(self, node:ast.Call) -> ast.expr:
+        function = node.func
+        if isinstance(function, ast.Attribute) and _is_self(function.value) and function.attr.startswith("_calculate_"):
+            if node.args or node.keywords:
+                raise TypeError(f"Cannot inline the call {ast.unparse(node)}")
+            names = self.source._inline(function.attr)
+            if len(names) > 1:
+                return ast.Tuple([ast.Name(name, ast.Load()) for name in names], ast.Load())
+            return ast.Name(names[0], ast.Load())
+
+        return self.generic_visit(node)
+
+
+def _is_self(node:ast.expr) -> bool:
+    return isinstance(node, ast.Name) and node.id == "self"
+
+
+def _is_docstring(statement:ast.stmt) -> bool:
+    return isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Constant)
+
+
+def _assigned_name(statement:ast.Assign) -> str:
+    target = statement.targets[0]
+    return target.id if len(statement.targets) == 1 and isinstance(target, ast.Name) else None
+
+
+def _aliases(statements:List[ast.stmt]) -> Dict[str, str]:
+    # locals only holding an aircraft input (`bt = self.aircraft.bt`) are replaced by the input argument
+    assigned = {}
+    for statement in ast.walk(ast.Module(body=statements, type_ignores=[])):
+        if isinstance(statement, (ast.Assign, ast.AugAssign, ast.AnnAssign)):
+            for target in (statement.targets if isinstance(statement, ast.Assign) else [statement.target]):
+                for node in ast.walk(target):
+                    if isinstance(node, ast.Name):
+                        assigned.setdefault(node.id, []).append(statement)
+
+    aliases = {}
+    for name, assignments in assigned.items():
+        statement = assignments[0]
+        if len(assignments) != 1 or not isinstance(statement, ast.Assign) or _assigned_name(statement) != name:
+            continue
+        value = statement.value
+        if (isinstance(value, ast.Attribute) and isinstance(value.value, ast.Attribute) and _is_self(value.value.value)
+                and value.value.attr == "aircraft" and value.attr in INPUT_SCHEMA.index):
+            aliases[name] = value.attr
+
+    return aliases
@@ -0,0 +1,522 @@
+from .DOC_Calculator import DirectOperatingCost
+from .utils.params import Params
+from typing import Callable, Dict, Iterable
+import numpy as np
+import math
+
+LN10 = math.log(10.0)
+
+Gradient = Dict[str, float]
+
+
+def calculate_gradients(doc:DirectOperatingCost) -> Dict[str, Gradient]:
+    """
+    ### Description
+    Exact partial derivatives of every cost line and of the DOC/IOC totals
+    with respect to the aircraft inputs and the `Params` fields, evaluated
+    in closed form.
+
+    Works for both the scalar `DirectOperatingCost` and the vectorized batch
+    engine (each derivative is then an array). Inputs not appearing in an
+    output are omitted from its gradient dict (their derivative is zero).
+
+    ### Returns
+    Dict `{output label: {input key (lowercase) or Params field (upper case):
+    derivative}}` with the cost line labels of `calculate_doc` plus
+    "DOC [USD/BHR]", "DOC [USD/flight]", "IOC [USD/BHR]" and "IOC [USD/flight]".
+    """
+    aircraft = doc.aircraft
+    bt       = aircraft.bt
+
+    financial = {label: gradient(doc) for label, gradient in FINANCIAL_GRADIENTS.items()}
+    operating = {label: gradient(doc) for label, gradient in OPERATING_GRADIENTS.items()}
+
+    doc_values = doc.calculate_doc()
+    ioc_values = doc.calculate_ioc()
+    doc_bhr    = doc_values["DOC [USD/BHR]"]
+    ioc_bhr    = ioc_values["IOC [USD/BHR]"]
+    cash_bhr   = sum(doc_values[label] for label in OPERATING_GRADIENTS)
+
+    doc_bhr_gradient = _sum_gradients(list(financial.values()) + list(operating.values()))
+    ioc_bhr_gradient = _scale_gradient(_sum_gradients(operating.values()), aircraft.ioc_fact)
+    ioc_bhr_gradient = _add_term(ioc_bhr_gradient, "ioc_fact", cash_bhr)
+
+    return {
+        **financial,
+        **operating,
+        "DOC [USD/BHR]": doc_bhr_gradient,
+        "DOC [USD/flight]": _add_term(_scale_gradient(doc_bhr_gradient, bt), "bt", doc_bhr),
+        "IOC [USD/BHR]": ioc_bhr_gradient,
+        "IOC [USD/flight]": _add_term(_scale_gradient(ioc_bhr_gradient, bt), "bt", ioc_bhr),
+    }
+
+
+def approximate_gradients(doc:DirectOperatingCost, step:float=1.0e-6) -> Dict[str, Gradient]:
+    """
+    ### Description
+    Central finite-difference approximation of `calculate_gradients`, with a
+    relative step on every continuous input ("ieng" is a flag and is skipped)
+    and `Params` field. Meant to check the analytic derivatives, not for
+    production use.
+    """
+    aircraft  = doc.aircraft.to_dict()
+    params    = vars(doc._params)
+    gradients = {}
+
+    perturbations = [(key, value, False) for key, value in aircraft.items() if key != "ieng"]
+    perturbations += [(name, value, True) for name, value in params.items()]
+
+    for key, value, is_param in perturbations:
+        h = step*max(abs(value), 1.0)
+
+        values = []
+        for perturbed in (value + h, value - h):
+            if is_param:
+                calculator = type(doc)(aircraft, params=Params(**{**params, key: perturbed}))
+            else:
+                calculator = type(doc)({**aircraft, key: perturbed}, params=doc._params)
+            values.append({**calculator.calculate_doc(), **calculator.calculate_ioc()})
+
+        for label in values[0]:
+            gradients.setdefault(label, {})[key] = (values[0][label] - values[1][label])/(2.0*h)
+
+    return gradients
+
+
+def calculate_sensitivities(doc:DirectOperatingCost) -> Dict[str, Dict[str, dict]]:
+    """
+    ### Description
+    Sensitivity report of every cost line and of the DOC/IOC/TOC totals:
+    exact partial derivatives (see `calculate_gradients`) and elasticities
+    (d output/d input * input/output, i.e. the % change of the output for a
+    1% change of the input) with respect to every aircraft input and
+    `Params` field, from one analytic evaluation.
+
+    Inputs an output does not depend on are omitted (zero derivative and
+    elasticity). The elasticity of a zero output is undefined (NaN).
+
+    ### Returns
+    Dict `{output label: {input key or Params field: {"derivative", "elasticity"}}}`.
+    """
+    gradients = calculate_gradients(doc)
+    values    = doc.calculate_all()
+
+    for per in ("BHR", "flight"):
+        gradients[f"TOC [USD/{per}]"] = _sum_gradients([gradients[f"DOC [USD/{per}]"], gradients[f"IOC [USD/{per}]"]])
+
+    inputs = {**doc.aircraft.to_dict(), **vars(doc._params)}
+
+    return {
+        label: {key: {"derivative": derivative, "elasticity": _elasticity(derivative, inputs[key], values[label])}
+                for key, derivative in gradient.items()}
+        for label, gradient in gradients.items()
+    }
+
+
+def _elasticity(derivative, value, output):
+    if np.ndim(output) == 0:
+        return derivative*value/output if output != 0.0 else math.nan
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(output != 0.0, derivative*value/np.where(output != 0.0, output, 1.0), np.nan)
+
+
+def _sum_gradients(gradients:Iterable[Gradient]) -> Gradient:
+    total = {}
+    for gradient in gradients:
+        for key, value in gradient.items():
+            total[key] = total[key] + value if key in total else value
+    return total
+
+
+def _scale_gradient(gradient:Gradient, factor) -> Gradient:
+    return {key: factor*value for key, value in gradient.items()}
+
+
+def _add_term(gradient:Gradient, key:str, value) -> Gradient:
+    gradient = dict(gradient)
+    gradient[key] = gradient[key] + value if key in gradient else value
+    return gradient
+
+
+def _product_gradient(aircraft, keys:Iterable[str], factor=1.0) -> Gradient:
+    # d(factor*x1*x2*...*xn)/dxi = factor*prod(xj, j != i)
+    keys = list(keys)
+    gradient = {}
+    for i, key in enumerate(keys):
+        value = factor
+        for other in keys[:i] + keys[i+1:]:
+            value = value*getattr(aircraft, other)
+        gradient[key] = value
+    return gradient
+
+
+def _investment_gradient(doc:DirectOperatingCost) -> Gradient:
+    adp     = doc.aircraft.adp*1.0e6
+    afspare = doc.aircraft.afspare
+    enpri   = doc.aircraft.enpri*1.0e6
+    en      = doc.aircraft.en
+    enspare = doc.aircraft.enspare
+
+    return {
+        "adp": 1.0e6*(1.0 + afspare),
+        "afspare": adp - enpri*en,
+        "enpri": 1.0e6*en*(enspare - afspare),
+        "en": enpri*(enspare - afspare),
+        "enspare": enpri*en,
+    }
+
+
+def _insurance_gradient(doc:DirectOperatingCost) -> Gradient:
+    rinsh = doc.aircraft.rinsh
+    adp   = doc.aircraft.adp*1.0e6
+    util  = doc.aircraft.util
+
+    return {
+        "rinsh": adp/util,
+        "adp": rinsh*1.0e6/util,
+        "util": -(rinsh*adp)/util**2,
+    }
+
+
+def _depreciation_gradient(doc:DirectOperatingCost) -> Gradient:
+    rval   = doc.aircraft.rval
+    dyrs   = doc.aircraft.dyrs
+    util   = doc.aircraft.util
+
+    INVEST       = doc._calculate_investment()
+    depreciation = ((1-rval)*INVEST)/(dyrs*util)
+
+    gradient = _scale_gradient(_investment_gradient(doc), (1-rval)/(dyrs*util))
+    gradient["rval"] = -INVEST/(dyrs*util)
+    gradient["dyrs"] = -depreciation/dyrs
+    gradient["util"] = -depreciation/util
+    return gradient
+
+
+def _interest_gradient(doc:DirectOperatingCost) -> Gradient:
+    util = doc.aircraft.util
+
+    INVEST = doc._calculate_investment()
+
+    gradient = _scale_gradient(_investment_gradient(doc), doc._params.INTEREST_RATE/util)
+    gradient["util"] = -(doc._params.INTEREST_RATE*INVEST)/util**2
+    gradient["INTEREST_RATE"] = INVEST/util
+    return gradient
+
+
+def _per_block_hour_gradient(doc:DirectOperatingCost, keys:Iterable[str], factor=1.0) -> Gradient:
+    # gradient of factor*x1*...*xn/bt
+    bt = doc.aircraft.bt
+
+    gradient = _scale_gradient(_product_gradient(doc.aircraft, keys, factor), 1.0/bt)
+    value    = factor
+    for key in keys:
+        value = value*getattr(doc.aircraft, key)
+    gradient["bt"] = -value/bt**2
+    return gradient
+
+
+def _fuel_gradient(doc:DirectOperatingCost) -> Gradient:
+    return _per_block_hour_gradient(doc, ["fuelpri", "bf"], 0.328)
+
+
+def _electric_energy_gradient(doc:DirectOperatingCost) -> Gradient:
+    return _per_block_hour_gradient(doc, ["ener_req", "enerpri"])
+
+
+def _h2_gradient(doc:DirectOperatingCost) -> Gradient:
+    return _per_block_hour_gradient(doc, ["h2_pri", "h2_req"])
+
+
+def _cockpit_crew_gradient(doc:DirectOperatingCost) -> Gradient:
+    return _product_gradient(doc.aircraft, ["crtechr", "crewtech"])
+
+
+def _cabin_crew_gradient(doc:DirectOperatingCost) -> Gradient:
+    return _product_gradient(doc.aircraft, ["crcabhr", "crewc"])
+
+
+def _landing_fees_gradient(doc:DirectOperatingCost) -> Gradient:
+    gradient = _per_block_hour_gradient(doc, ["mtow"], doc._params.LANDINGUR)
+    gradient["LANDINGUR"] = doc.aircraft.mtow/doc.aircraft.bt
+    return gradient
+
+
+def _ground_handling_gradient(doc:DirectOperatingCost) -> Gradient:
+    gradient = _per_block_hour_gradient(doc, ["pld"], doc._params.HTONN)
+    gradient["HTONN"] = doc.aircraft.pld/doc.aircraft.bt
+    return gradient
+
+
+def _nox_emission_gradient(doc:DirectOperatingCost) -> Gradient:
+    return _per_block_hour_gradient(doc, ["cnox", "nox_value"])
+
+
+def _co_emission_gradient(doc:DirectOperatingCost) -> Gradient:
+    return _per_block_hour_gradient(doc, ["cco", "co_value"])
+
+
+def _co2_emission_gradient(doc:DirectOperatingCost) -> Gradient:
+    gradient = _per_block_hour_gradient(doc, ["co2_value", "prico2"], 1.0-doc._params.AEC)
+    gradient["AEC"] = -doc.aircraft.co2_value*doc.aircraft.prico2/doc.aircraft.bt
+    return gradient
+
+
+def _navigation_gradient(doc:DirectOperatingCost) -> Gradient:
+    mtow   = doc.aircraft.mtow
+    bt     = doc.aircraft.bt
+    sector = doc.aircraft.sector
+
+    unit_rate  = doc._params.ENR*1.853/100.0
+    weight_fac = doc._sqrt(mtow/50.0)
+    navigation = unit_rate*sector*weight_fac/bt
+
+    return {
+        "sector": unit_rate*weight_fac/bt,
+        "mtow": _sqrt_term_derivative(unit_rate*sector/bt*0.5/50.0, weight_fac),
+        "bt": -navigation/bt,
+        "ENR": sector*1.853/100.0*weight_fac/bt,
+    }
+
+
+def _sqrt_term_derivative(factor, root):
+    # factor/root, the derivative of a term in sqrt(x) at root = sqrt(x): at x = 0, where the
+    # term is not differentiable (infinite one-sided derivative), taken as 0 to keep Jacobians finite
+    if np.ndim(root) == 0:
+        return factor/root if root != 0.0 else 0.0*factor
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(root != 0.0, factor/np.where(root != 0.0, root, 1.0), 0.0)
+
+
+def _noise_gradient(doc:DirectOperatingCost) -> Gradient:
+    cnoise  = doc._params.CNOISE
+    l_app   = doc.aircraft.l_app
+    l_flyov = doc.aircraft.l_flyov
+    l_lat   = doc.aircraft.l_lat
+    bt      = doc.aircraft.bt
+
+    arrival   = doc._power(10.0, (l_app - doc._params.TA)/10.0)
+    departure = doc._power(10.0, (((l_flyov+l_lat)/2.0) - doc._params.TD)/10.0)
+
+    return {
+        "l_app": cnoise*LN10*arrival/10.0/bt,
+        "l_flyov": cnoise*LN10*departure/20.0/bt,
+        "l_lat": cnoise*LN10*departure/20.0/bt,
+        "bt": -(cnoise*(arrival + departure))/bt**2,
+        "CNOISE": (arrival + departure)/bt,
+        "TA": -cnoise*LN10*arrival/10.0/bt,
+        "TD": -cnoise*LN10*departure/10.0/bt,
+    }
+
+
+def _airframe_maintenance_gradient(doc:DirectOperatingCost) -> Gradient:
+    aircraft   = doc.aircraft
+    bt         = aircraft.bt
+    en         = aircraft.en
+    enpri      = aircraft.enpri
+    bengw      = aircraft.bengw
+    labor_rate = aircraft.labor_rate
+    offset     = doc.FLIGHT_TIME_OFFSET
+    mach       = math.sqrt(doc.MACH_NUMBER_FACTOR)
+
+    FT  = bt - offset
+    AFW = aircraft.mew - (bengw*en)
+    P   = (aircraft.adp - en*enpri - aircraft.n_bat*aircraft.batprice/1.0e6
+           - aircraft.n_em*aircraft.emprice/1.0e6 - aircraft.n_fc*aircraft.fcprice/1.0e6)
+
+    K_A_FC = 0.05*AFW*2.2 + 6 - 630.0/(AFW*2.2 + 120.0)
+    K_A_FH = 0.59*K_A_FC
+
+    # material cost = P*(3.08*FT + 6.24)/bt, labor cost = K_A_FC*(0.59*FT + 1)*labor_rate*mach/bt
+    dmaterial_dP   = (3.08*FT + 6.24)/bt
+    dlabor_dK      = (0.59*FT + 1.0)*labor_rate*mach/bt
+    dK_dAFW        = 0.11 + 630.0*2.2/(AFW*2.2 + 120.0)**2
+    dlabor_dAFW    = dlabor_dK*dK_dAFW
+
+    return {
+        "adp": dmaterial_dP,
+        "enpri": -en*dmaterial_dP,
+        "en": -enpri*dmaterial_dP - bengw*dlabor_dAFW,
+        "n_bat": -aircraft.batprice/1.0e6*dmaterial_dP,
+        "batprice": -aircraft.n_bat/1.0e6*dmaterial_dP,
+        "n_em": -aircraft.emprice/1.0e6*dmaterial_dP,
+        "emprice": -aircraft.n_em/1.0e6*dmaterial_dP,
+        "n_fc": -aircraft.fcprice/1.0e6*dmaterial_dP,
+        "fcprice": -aircraft.n_fc/1.0e6*dmaterial_dP,
+        "mew": dlabor_dAFW,
+        "bengw": -en*dlabor_dAFW,
+        "labor_rate": (K_A_FH*FT + K_A_FC)*mach/bt,
+        "bt": ((3.08*P*offset - 6.24*P) + (K_A_FH*offset - K_A_FC)*labor_rate*mach)/bt**2,
+    }
+
+
+def _estimated_engine_maintenance_gradient(doc:DirectOperatingCost) -> Gradient:
+    aircraft   = doc.aircraft
+    en         = aircraft.en
+    bt         = aircraft.bt
+    labor_rate = aircraft.labor_rate
+    shp        = aircraft.shp
+    enpri      = aircraft.enpri
+    offset     = doc.FLIGHT_TIME_OFFSET
+
+    FT       = bt - offset
+    K_ICE_FC = (0.3 + 0.03*shp/1000.0)*en
+    K_ICE_FH = (0.65 + 0.03*shp/1000.0)*en
+    C_ICE_FC = 2.0*en*enpri*10.0
+    C_ICE_FH = 2.5*en*enpri*10.0
+
+    return {
+        "en": ((0.65 + 0.03*shp/1000.0)*FT + (0.3 + 0.03*shp/1000.0))*labor_rate/bt + (25.0*enpri*FT + 20.0*enpri)/bt,
+        "enpri": en*(25.0*FT + 20.0)/bt,
+        "shp": 0.03/1000.0*en*(FT + 1.0)*labor_rate/bt,
+        "labor_rate": (K_ICE_FH*FT + K_ICE_FC)/bt,
+        "bt": ((K_ICE_FH*offset - K_ICE_FC)*labor_rate + (C_ICE_FH*offset - C_ICE_FC))/bt**2,
+    }
+
+
+def _assigned_engine_maintenance_gradient(doc:DirectOperatingCost) -> Gradient:
+    return _product_gradient(doc.aircraft, ["eoc", "en"])
+
+
+def _thermal_engine_maintenance_gradient(doc:DirectOperatingCost) -> Gradient:
+    ieng = doc.aircraft.ieng
+
+    if np.ndim(ieng) == 0:
+        if ieng == 1:
+            return _estimated_engine_maintenance_gradient(doc)
+        elif ieng == 2:
+            return _assigned_engine_maintenance_gradient(doc)
+        raise ValueError(f"ieng Value {ieng} not valid")
+
+    invalid = (ieng != 1) & (ieng != 2)
+    if invalid.any():
+        raise ValueError(f"ieng Value {ieng[invalid][0]} not valid")
+
+    # batch engine: masked select between the two branches
+    estimated = _estimated_engine_maintenance_gradient(doc)
+    assigned  = _assigned_engine_maintenance_gradient(doc)
+
+    return {key: np.where(ieng == 1, estimated.get(key, 0.0), assigned.get(key, 0.0))
+            for key in {**estimated, **assigned}}
+
+
+def _replacement_gradient(doc:DirectOperatingCost, count:str, price:str, residual:str, units:str=None) -> Gradient:
+    # gradient of units*count*(price - residual)/(lifespan*util)
+    aircraft = doc.aircraft
+    lifespan = aircraft.lifespan
+    util     = aircraft.util
+
+    n_units  = getattr(aircraft, units) if units else 1.0
+    n_count  = getattr(aircraft, count)
+    net      = getattr(aircraft, price) - getattr(aircraft, residual)
+    base     = n_units*(n_count*net)/(lifespan*util)
+
+    gradient = {
+        count: n_units*net/(lifespan*util),
+        price: n_units*n_count/(lifespan*util),
+        residual: -n_units*n_count/(lifespan*util),
+        "lifespan": -base/lifespan,
+        "util": -base/util,
+    }
+    if units:
+        gradient[units] = n_count*net/(lifespan*util)
+    return gradient
+
+
+def _battery_line_gradient(doc:DirectOperatingCost) -> Gradient:
+    return _product_gradient(doc.aircraft, ["n_bat", "lrbat", "tlbat", "f_bat"])
+
+
+def _battery_base_gradient(doc:DirectOperatingCost) -> Gradient:
+    return _replacement_gradient(doc, "n_repbat", "batprice", "rvbat", units="n_bat")
+
+
+def _fuel_cell_line_gradient(doc:DirectOperatingCost) -> Gradient:
+    return _product_gradient(doc.aircraft, ["n_fc", "lrfc", "tlfc", "f_fc"])
+
+
+def _fuel_cell_base_gradient(doc:DirectOperatingCost) -> Gradient:
+    return _replacement_gradient(doc, "n_repfc", "fcprice", "rvfc", units="n_fc")
+
+
+def _power_electronic_line_gradient(doc:DirectOperatingCost) -> Gradient:
+    return _product_gradient(doc.aircraft, ["lrpe", "tlpe", "f_pe"])
+
+
+def _power_electronic_base_gradient(doc:DirectOperatingCost) -> Gradient:
+    return _replacement_gradient(doc, "n_reppe", "peprice", "rvpe")
+
+
+def _electric_machine_line_gradient(doc:DirectOperatingCost) -> Gradient:
+    aircraft = doc.aircraft
+    n_em     = aircraft.n_em
+    speml    = aircraft.speml
+    lrem     = aircraft.lrem
+    tleml    = aircraft.tleml
+    f_eml    = aircraft.f_eml
+    lifespan = aircraft.lifespan
+    util     = aircraft.util
+
+    spares = speml + lrem*tleml
+    line   = n_em*spares*lifespan*f_eml/util
+
+    return {
+        "n_em": spares*lifespan*f_eml/util,
+        "speml": n_em*lifespan*f_eml/util,
+        "lrem": n_em*tleml*lifespan*f_eml/util,
+        "tleml": n_em*lrem*lifespan*f_eml/util,
+        "lifespan": n_em*spares*f_eml/util,
+        "f_eml": n_em*spares*lifespan/util,
+        "util": -line/util,
+    }
+
+
+def _electric_machine_base_gradient(doc:DirectOperatingCost) -> Gradient:
+    aircraft = doc.aircraft
+    n_em     = aircraft.n_em
+    spemb    = aircraft.spemb
+    lrem     = aircraft.lrem
+    tlemb    = aircraft.tlemb
+    f_emb    = aircraft.f_emb
+
+    return {
+        "n_em": (spemb + lrem*tlemb)*f_emb*0.80,
+        "spemb": n_em*f_emb*0.80,
+        "lrem": n_em*tlemb*f_emb*0.80,
+        "tlemb": n_em*lrem*f_emb*0.80,
+        "f_emb": n_em*(spemb + lrem*tlemb)*0.80,
+    }
+
+
+FINANCIAL_GRADIENTS: Dict[str, Callable[[DirectOperatingCost], Gradient]] = {
+    "INSURANCE [USD/BHR]": _insurance_gradient,
+    "DEPRECIATION [USD/BHR]": _depreciation_gradient,
+    "INTEREST [USD/BHR]": _interest_gradient,
+}
+
+OPERATING_GRADIENTS: Dict[str, Callable[[DirectOperatingCost], Gradient]] = {
+    "FUEL [USD/BHR]": _fuel_gradient,
+    "ELECTRYCITY [USD/BHR]": _electric_energy_gradient,
+    "H2 [USD/BHR]": _h2_gradient,
+    "COCKPIT CREW [USD/BHR]": _cockpit_crew_gradient,
+    "CABIN CREW [USD/BHR]": _cabin_crew_gradient,
+    "LANDING FEES [USD/BHR]": _landing_fees_gradient,
+    "NAVIGATION CHARGES [USD/BHR]": _navigation_gradient,
+    "GROUND HANDLING [USD/BHR]": _ground_handling_gradient,
+    "NOISE CHARGES [USD/BHR]": _noise_gradient,
+    "NOX EMISSION CHARGES [USD/BHR]": _nox_emission_gradient,
+    "CO EMISSION CHARGES [USD/BHR]": _co_emission_gradient,
+    "CO2 EMISSION CHARGES [USD/BHR]": _co2_emission_gradient,
+    "AIRFRANE MAINTENANCE [USD/BHR]": _airframe_maintenance_gradient,
+    "THERM. ENG. MAINTENANCE [USD/BH]": _thermal_engine_maintenance_gradient,
+    "ELECTRIC MACHINE LINE MAINT. [USD/BH]": _electric_machine_line_gradient,
+    "ELECTRIC MACHINE BASE MAINT. [USD/BH]": _electric_machine_base_gradient,
+    "BATTERY LINE MAINT. [USD/BH]": _battery_line_gradient,
+    "BATTERY BASE MAINT. [USD/BH]": _battery_base_gradient,
+    "FUEL CELL LINE MAINT. [USD/BH]": _fuel_cell_line_gradient,
+    "FUEL CELL BASE MAINT. [USD/BH]": _fuel_cell_base_gradient,
+    "POWER ELECTR. LINE MAINT. [USD/BH]": _power_electronic_line_gradient,
+    "POWER ELECTR. BASE MAINT. [USD/BH]": _power_electronic_base_gradient,
+}
@@ -0,0 +1,150 @@
+from .batch import BatchDirectOperatingCost
+from .utils.params import Params
+from .utils.schema import INPUT_SCHEMA
+from dataclasses import dataclass
+from typing import Dict, Iterable, Mapping, Union
+import numpy as np
+
+
+@dataclass
+class Escalation():
+    """
+    ### Description
+    Annual escalation rates of the energy and emission prices used by
+    `project_lifecycle` (0.03 = +3 % per year, year 1 at today's prices)
+
+    - FUEL: fuel price escalation rate
+    - ELECTRICITY: electric energy price escalation rate
+    - H2: hydrogen price escalation rate
+    - CO2: CO2 allowance price escalation rate
+    """
+
+    FUEL: float = 0.0
+    ELECTRICITY: float = 0.0
+    H2: float = 0.0
+    CO2: float = 0.0
+
+
+# cost lines whose price escalates over the years -> Escalation field
+_ESCALATED_LINES = {
+    "FUEL [USD/BHR]": "FUEL",
+    "ELECTRYCITY [USD/BHR]": "ELECTRICITY",
+    "H2 [USD/BHR]": "H2",
+    "CO2 EMISSION CHARGES [USD/BHR]": "CO2",
+}
+
+# averaged replacement lines -> number of replacements over the lifespan
+_REPLACEMENT_LINES = {
+    "BATTERY BASE MAINT. [USD/BH]": "n_repbat",
+    "FUEL CELL BASE MAINT. [USD/BH]": "n_repfc",
+    "POWER ELECTR. BASE MAINT. [USD/BH]": "n_reppe",
+}
+
+
+def project_lifecycle(aircraft:Union[Mapping, Iterable[Mapping]], params:Params=Params(),
+                      escalation:Escalation=Escalation(), years:int=None) -> Dict[str, np.ndarray]:
+    """
+    ### Description
+    Year-by-year cash flows of a fleet over the aircraft lifespan, vectorized
+    over aircraft and years, from the cost lines of `DirectOperatingCost`:
+
+    - every line is flown `util` block hours a year while the aircraft is in
+      service (`lifespan` years, a fractional last year counting pro rata);
+    - the depreciation follows a straight-line schedule over `dyrs` years,
+      cut at the retirement when `dyrs` exceeds the lifespan;
+    - the battery, fuel cell and power electronics replacements (`n_repbat`,
+      `n_repfc`, `n_reppe`) are paid as events evenly spaced over the
+      lifespan instead of the averaged base maintenance lines;
+    - fuel, electricity, H2 and CO2 prices escalate at the `escalation` rates;
+    - the IOC is `ioc_fact` times the operating cash flows of the year;
+    - the TOC cash flows are discounted at `Params.INTEREST_RATE` (end of
+      year convention).
+
+    Without escalation, over `dyrs = lifespan` years, the undiscounted TOC
+    cash flows add up to `lifespan*util` times the TOC [USD/BHR].
+
+    ### Arguments
+    - aircraft    List of aircraft input dicts, or one aircraft dict whose values are
+                  scalars or 1D arrays (one entry per aircraft)
+    - params      Params economic scenario
+    - escalation  Escalation rates of the energy and emission prices
+    - years       Projection horizon [years] (default: the longest lifespan)
+
+    ### Returns
+    Dict with the year numbers ("YEAR", shape (n_years,)), a
+    "<cost line> [USD/year]" cash flow for every DOC line, "DOC [USD/year]",
+    "IOC [USD/year]", "TOC [USD/year]" and "DISCOUNTED TOC [USD/year]"
+    (shape (n_aircraft, n_years)) and the net present cost "NPV [USD]"
+    (shape (n_aircraft,)).
+    """
+    if not isinstance(aircraft, Mapping):
+        aircraft = INPUT_SCHEMA.columns(INPUT_SCHEMA.pack(aircraft))
+
+    calculator           = BatchDirectOperatingCost(aircraft, params=params)
+    financial, operating = calculator._evaluate()
+
+    n_aircraft = int(np.prod(calculator.shape)) if calculator.shape else 1
+
+    def column(value) -> np.ndarray:
+        return np.reshape(np.broadcast_to(value, calculator.shape), (n_aircraft, 1))
+
+    util     = column(calculator.aircraft.util)
+    lifespan = column(calculator.aircraft.lifespan)
+
+    n_years = int(np.ceil(lifespan.max())) if years is None else years
+    year    = np.arange(n_years, dtype=np.float64)[None, :]
+
+    # fraction of every year in service / in the depreciation period, which
+    # ends with the retirement of the aircraft when dyrs exceeds the lifespan
+    in_service   = np.clip(lifespan - year, 0.0, 1.0)
+    depreciating = np.clip(np.minimum(column(calculator.aircraft.dyrs), lifespan) - year, 0.0, 1.0)
+
+    flows = {}
+    for lines in (financial, operating):
+        for label, value in lines.items():
+            annual = column(value)*util
+
+            if label == "DEPRECIATION [USD/BHR]":
+                flow = annual*depreciating
+            elif label in _REPLACEMENT_LINES:
+                flow = annual*lifespan*_replacement_fraction(column(getattr(calculator.aircraft, _REPLACEMENT_LINES[label])),
+                                                             lifespan, year)
+            elif label in _ESCALATED_LINES:
+                rate = getattr(escalation, _ESCALATED_LINES[label])
+                flow = annual*in_service*(1.0 + rate)**year
+            else:
+                flow = annual*in_service
+
+            flows[_annual_label(label)] = flow
+
+    operating_total = sum(flows[_annual_label(label)] for label in operating)
+    doc             = sum(flows.values())
+    ioc             = column(calculator.aircraft.ioc_fact)*operating_total
+    toc             = doc + ioc
+    discounted      = toc*(1.0 + params.INTEREST_RATE)**-(year + 1.0)
+
+    return {
+        "YEAR": np.arange(1, n_years + 1),
+        **flows,
+        "DOC [USD/year]": doc,
+        "IOC [USD/year]": ioc,
+        "TOC [USD/year]": toc,
+        "DISCOUNTED TOC [USD/year]": discounted,
+        "NPV [USD]": discounted.sum(axis=1),
+    }
+
+
+def _annual_label(label:str) -> str:
+    return label.rsplit(" [", 1)[0] + " [USD/year]"
+
+
+def _replacement_fraction(n_replacements:np.ndarray, lifespan:np.ndarray, year:np.ndarray) -> np.ndarray:
+    # replacement k (k = 1..n) happens at k*lifespan/(n + 1) years: share of the
+    # n replacements falling in every year, so that the shares add up to 1
+    def replaced_before(time):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            count = np.ceil(time*(n_replacements + 1.0)/lifespan) - 1.0
+        return np.clip(np.nan_to_num(count), 0.0, n_replacements)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(n_replacements > 0.0, (replaced_before(year + 1.0) - replaced_before(year))/n_replacements, 0.0)
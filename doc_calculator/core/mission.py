@@ -0,0 +1,144 @@
+from .batch import BatchDirectOperatingCost
+from .utils.params import Params
+from .utils.schema import INPUT_SCHEMA
+from typing import Dict, Mapping, Sequence, Tuple
+import numpy as np
+
+
+class MissionTable(object):
+
+    def __init__(self, sector:Sequence[float], **columns:Sequence[float]) -> None:
+        """
+        ### Description
+        Mission data of one aircraft tabulated on a sector grid: block time,
+        block fuel, energy, H2 and emissions (any aircraft input, e.g. bt,
+        bf, ener_req, h2_req, co2_value, nox_value, co_value) versus the
+        sector, linearly interpolated with a sorted-index search for arrays
+        of sectors, to price whole networks in one batch evaluation.
+
+        The table is one NumPy structured array (a field per column) saved as
+        a single `.npy` file; `load` memory-maps it read-only, so that every
+        worker process loading the same file shares one copy in the page
+        cache. A memory-mapped table is pickled as its path.
+
+        ### Arguments
+        - sector   Strictly increasing sector grid (same unit as the `sector` input)
+        - columns  Aircraft input values on the grid (case insensitive keys)
+
+            table = MissionTable(sector=[100, 300, 600], bt=[0.6, 1.1, 1.8], bf=[300, 700, 1300])
+            table.evaluate(aircraft, sector=np.array([150.0, 420.0]))
+        """
+        sector = np.asarray(sector, dtype=np.float64)
+        names  = []
+        for key in columns:
+            name = INPUT_SCHEMA.canonical(key)
+            if name is None or name == "sector":
+                raise KeyError(f"Unknown mission table column '{key}'")
+            names.append(name)
+
+        data = np.empty(sector.shape, dtype=[("sector", np.float64)] + [(name, np.float64) for name in names])
+        data["sector"] = sector
+        for name, values in zip(names, columns.values()):
+            data[name] = values
+
+        self._set_data(data)
+        self.path = None
+
+        return None
+
+    @classmethod
+    def load(cls, path:str, mmap:bool=True) -> "MissionTable":
+        """Table saved by `save`, memory-mapped read-only (or read in memory if not `mmap`)."""
+        table = cls.__new__(cls)
+        table._set_data(np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False))
+        table.path = path if mmap else None
+
+        return table
+
+    def save(self, path:str) -> None:
+        np.save(path, self.data, allow_pickle=False)
+
+        return None
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return self.data.dtype.names[1:]
+
+    @property
+    def sector(self) -> np.ndarray:
+        return self.data["sector"]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"MissionTable({len(self)} sectors, columns={self.columns})"
+
+    def __reduce__(self):
+        if self.path is not None:
+            return (type(self).load, (self.path,))
+        return (_from_data, (type(self), np.array(self.data)))
+
+    def interpolate(self, sector, extrapolate:bool=False) -> Dict[str, np.ndarray]:
+        """
+        ### Description
+        Linear interpolation of every column at the given sector(s). Sectors
+        out of the grid raise a ValueError unless `extrapolate` is True
+        (linear extrapolation of the first/last grid interval).
+
+        ### Returns
+        Dict {column name: array of the shape of `sector`}.
+        """
+        sector = np.asarray(sector, dtype=np.float64)
+        grid   = self.sector
+
+        if not extrapolate and (np.any(sector < grid[0]) or np.any(sector > grid[-1])):
+            raise ValueError(f"Sectors out of the mission table range [{grid[0]}, {grid[-1]}]")
+
+        # left grid point of the interval holding each sector and its weight
+        index  = np.clip(np.searchsorted(grid, sector, side="right") - 1, 0, len(grid) - 2)
+        left   = grid[index]
+        weight = (sector - left)/(grid[index + 1] - left)
+
+        results = {}
+        for name in self.columns:
+            values        = self.data[name]
+            results[name] = values[index] + weight*(values[index + 1] - values[index])
+
+        return results
+
+    def aircraft_inputs(self, aircraft:Mapping, sector, extrapolate:bool=False) -> dict:
+        """Aircraft input dict flying the given sector(s), the tabulated inputs being interpolated."""
+        inputs = {INPUT_SCHEMA.canonical(key) or key: value for key, value in aircraft.items()}
+        return {**inputs, "sector": np.asarray(sector, dtype=np.float64), **self.interpolate(sector, extrapolate)}
+
+    def evaluate(self, aircraft:Mapping, sector, params:Params=Params(), outputs:Sequence[str]=None,
+                 extrapolate:bool=False) -> Dict[str, np.ndarray]:
+        """
+        ### Description
+        Operating costs of the aircraft flying an array of sectors, in one
+        batch evaluation.
+
+        ### Returns
+        Dict {result label: array of the shape of `sector`}.
+        """
+        sector  = np.asarray(sector, dtype=np.float64)
+        results = BatchDirectOperatingCost(self.aircraft_inputs(aircraft, sector, extrapolate), params=params).calculate_all()
+
+        labels = results if outputs is None else outputs
+        return {label: np.broadcast_to(results[label], sector.shape) for label in labels}
+
+    def _set_data(self, data:np.ndarray) -> None:
+        if data.ndim != 1 or data.dtype.names is None or data.dtype.names[0] != "sector":
+            raise ValueError("A mission table is a 1D structured array whose first field is the sector")
+        if len(data) < 2 or np.any(np.diff(data["sector"]) <= 0.0):
+            raise ValueError("The sector grid must hold at least two strictly increasing values")
+
+        self.data = data
+
+
+def _from_data(table_type:type, data:np.ndarray) -> MissionTable:
+    table = table_type.__new__(table_type)
+    table._set_data(data)
+    table.path = None
+    return table
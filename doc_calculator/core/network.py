@@ -0,0 +1,173 @@
+from .batch import BatchDirectOperatingCost
+from .utils.params import Params
+from .utils.schema import INPUT_SCHEMA
+from typing import Dict, Iterator, List, Mapping, Sequence
+import numpy as np
+import csv
+import os
+
+
+def evaluate_network(aircraft:Mapping, routes:str, output:str, params:Params=Params(),
+                     chunk_size:int=10000, outputs:Sequence[str]=None) -> int:
+    """
+    ### Description
+    Evaluate the operating costs of an airline network, streaming the route
+    table from `routes` to `output` in chunks of `chunk_size` rows: memory
+    stays constant whatever the size of the table.
+
+    Each route table column named after an aircraft input (case insensitive,
+    e.g. sector, bt, bf, co2_value, nox_value) overrides the aircraft
+    definition for that route; the other columns (route id, airports, ...)
+    are copied to the output.
+
+    ### Arguments
+    - aircraft    Aircraft input dict, or dict {aircraft type name: aircraft input dict}
+                  to price every route with each type (an "aircraft" column is then added)
+    - routes      Route table path (.csv, or .parquet when pyarrow is installed)
+    - output      Result table path (.csv or .parquet)
+    - params      Params economic scenario
+    - chunk_size  Number of routes evaluated at once
+    - outputs     Result labels to write (default: all the `calculate_all` outputs)
+
+    ### Returns
+    Number of result rows written.
+    """
+    if not aircraft:
+        raise ValueError("No aircraft to evaluate the network with")
+    fleet = aircraft if all(isinstance(value, Mapping) for value in aircraft.values()) else {None: aircraft}
+
+    n_rows = 0
+    with _open_writer(output) as writer:
+        for columns in read_route_chunks(routes, chunk_size):
+            for name, definition in fleet.items():
+                result = evaluate_route_chunk(definition, columns, params, outputs)
+                if name is not None:
+                    n_routes = len(next(iter(result.values())))
+                    result = {"aircraft": [name]*n_routes, **result}
+                writer.write(result)
+                n_rows += len(next(iter(result.values())))
+
+    return n_rows
+
+
+def evaluate_route_chunk(aircraft:Mapping, columns:Mapping[str, Sequence], params:Params=Params(),
+                         outputs:Sequence[str]=None) -> Dict[str, Sequence]:
+    """
+    ### Description
+    Evaluate one chunk of a route table, given as a dict of columns, with the
+    batch engine. Returns the pass-through columns followed by the result
+    columns (arrays).
+    """
+    inputs      = dict(aircraft)
+    passthrough = {}
+
+    for key, values in columns.items():
+        if INPUT_SCHEMA.canonical(key) is None:
+            passthrough[key] = values
+        else:
+            inputs[key] = np.asarray(values, dtype=np.float64)
+
+    n_routes = len(next(iter(columns.values())))
+    results  = BatchDirectOperatingCost(inputs, params=params).calculate_all()
+
+    labels = results if outputs is None else outputs
+    return {**passthrough, **{label: np.broadcast_to(results[label], (n_routes,)) for label in labels}}
+
+
+def read_route_chunks(path:str, chunk_size:int=10000) -> Iterator[Dict[str, Sequence]]:
+    """
+    ### Description
+    Stream a route table (.csv or .parquet) as successive dicts of columns
+    holding at most `chunk_size` rows.
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".parquet":
+        parquet = _import_parquet()
+        for batch in parquet.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield {name: batch.column(name).to_numpy(zero_copy_only=False) for name in batch.schema.names}
+        return
+
+    with open(path, newline="") as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"The route table {path} is empty: a header row is expected")
+        rows   = []
+        for row in reader:
+            rows.append(row)
+            if len(rows) == chunk_size:
+                yield dict(zip(header, zip(*rows)))
+                rows = []
+        if rows:
+            yield dict(zip(header, zip(*rows)))
+
+
+class _CsvWriter(object):
+
+    def __init__(self, path:str) -> None:
+        self._file   = open(path, "w", newline="")
+        self._writer = csv.writer(self._file)
+        self._header = None
+
+    def write(self, columns:Dict[str, Sequence]) -> None:
+        if self._header is None:
+            self._header = list(columns)
+            self._writer.writerow(self._header)
+
+        self._writer.writerows(zip(*(_to_list(columns[name]) for name in self._header)))
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "_CsvWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _ParquetWriter(object):
+
+    def __init__(self, path:str) -> None:
+        self._path   = path
+        self._writer = None
+
+    def write(self, columns:Dict[str, Sequence]) -> None:
+        import pyarrow
+
+        table = pyarrow.Table.from_pydict({name: np.ascontiguousarray(values) if isinstance(values, np.ndarray) else _to_list(values)
+                                           for name, values in columns.items()})
+        if self._writer is None:
+            self._writer = _import_parquet().ParquetWriter(self._path, table.schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+    def __enter__(self) -> "_ParquetWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _open_writer(path:str):
+    if os.path.splitext(path)[1].lower() == ".parquet":
+        _import_parquet()
+        return _ParquetWriter(path)
+    return _CsvWriter(path)
+
+
+def _import_parquet():
+    try:
+        import pyarrow.parquet as parquet
+    except ImportError:
+        raise ImportError("Parquet route tables require pyarrow (pip install pyarrow)") from None
+    return parquet
+
+
+def _to_list(values:Sequence) -> List:
+    # tolist() turns float64 into Python floats, written with their shortest repr
+    return values.tolist() if isinstance(values, np.ndarray) else list(values)
@@ -0,0 +1,151 @@
+from .batch import BatchDirectOperatingCost
+from .utils.params import Params
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Sequence, Tuple
+import numpy as np
+import os
+
+DEFAULT_OUTPUTS = ("DOC [USD/flight]", "IOC [USD/flight]", "TOC [USD/flight]")
+
+
+def run_campaign(aircraft:dict, samples:np.ndarray, names:Sequence[str], params:Params=Params(),
+                 outputs:Sequence[str]=DEFAULT_OUTPUTS, n_workers:int=None, chunk_size:int=100000,
+                 output_path:str=None) -> np.ndarray:
+    """
+    ### Description
+    Evaluate a DOE / Monte Carlo sample matrix in parallel. The samples are
+    split into one contiguous shard per task and spread over a pool of
+    `n_workers` processes; every worker evaluates its shard with the batch
+    engine, `chunk_size` samples at a time, and writes the results directly
+    into a shared output array at the shard rows. The output order is the
+    sample order whatever the completion order, and no result is pickled
+    back to the parent process.
+
+    ### Arguments
+    - aircraft     Base aircraft input dict (values shared by all the samples)
+    - samples      (n_samples, n_variables) array of sampled inputs
+    - names        Aircraft input (or "Params.<FIELD>") name of every sample column
+    - params       Params economic scenario
+    - outputs      Result labels (`calculate_all` keys) stored column by column
+    - n_workers    Number of worker processes (default: os.cpu_count(); 1 runs in-process)
+    - chunk_size   Number of samples per batch evaluation
+    - output_path  Optional .npy file: the results are written to this memory-mapped file
+                   (returned as a read-only memmap) instead of shared memory
+
+    ### Returns
+    (n_samples, len(outputs)) float64 array.
+    """
+    samples = np.ascontiguousarray(samples, dtype=np.float64)
+    if samples.ndim != 2 or samples.shape[1] != len(names):
+        raise ValueError(f"samples shape {samples.shape} does not match the {len(names)} variable names")
+
+    n_samples = samples.shape[0]
+    n_workers = n_workers or os.cpu_count() or 1
+    shape     = (n_samples, len(outputs))
+    shards    = _split(n_samples, n_workers)
+
+    if n_workers == 1 or len(shards) < 2:
+        result = np.lib.format.open_memmap(output_path, "w+", np.float64, shape) if output_path else np.empty(shape)
+        for start, stop in shards:
+            _evaluate_into(aircraft, samples, names, params, outputs, chunk_size, result, start, stop)
+        return _finalize(result, output_path)
+
+    input_memory  = shared_memory.SharedMemory(create=True, size=max(samples.nbytes, 1))
+    output_memory = None if output_path else shared_memory.SharedMemory(create=True, size=max(8*shape[0]*shape[1], 1))
+    try:
+        np.ndarray(samples.shape, np.float64, buffer=input_memory.buf)[:] = samples
+
+        if output_path:
+            np.lib.format.open_memmap(output_path, "w+", np.float64, shape).flush()
+            output = ("memmap", output_path)
+        else:
+            output = ("shared", output_memory.name)
+
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            tasks = [executor.submit(_evaluate_shard, aircraft, (input_memory.name, samples.shape), names,
+                                     params, tuple(outputs), chunk_size, output, shape, start, stop)
+                     for start, stop in shards]
+            for task in tasks:
+                task.result()
+
+        if output_path:
+            return _finalize(None, output_path)
+        return np.ndarray(shape, np.float64, buffer=output_memory.buf).copy()
+
+    finally:
+        input_memory.close()
+        input_memory.unlink()
+        if output_memory is not None:
+            output_memory.close()
+            output_memory.unlink()
+
+
+def evaluate_samples(aircraft:dict, samples:np.ndarray, names:Sequence[str], params:Params=Params()) -> dict:
+    """
+    ### Description
+    Evaluate `calculate_all` with the batch engine for a (n_samples, n_variables)
+    sample matrix. Columns named "Params.<FIELD>" sample a Params field.
+    """
+    inputs       = dict(aircraft)
+    param_values = {}
+
+    for j, name in enumerate(names):
+        if name.startswith("Params."):
+            param_values[name[len("Params."):]] = samples[:, j]
+        else:
+            inputs[name] = samples[:, j]
+
+    if param_values:
+        params = Params(**{**vars(params), **param_values})
+
+    return BatchDirectOperatingCost(inputs, params=params).calculate_all()
+
+
+def _evaluate_into(aircraft:dict, samples:np.ndarray, names:Sequence[str], params:Params, outputs:Sequence[str],
+                   chunk_size:int, result:np.ndarray, start:int, stop:int) -> None:
+    for chunk_start in range(start, stop, chunk_size):
+        chunk_stop = min(chunk_start + chunk_size, stop)
+        values     = evaluate_samples(aircraft, samples[chunk_start:chunk_stop], names, params)
+        for j, label in enumerate(outputs):
+            result[chunk_start:chunk_stop, j] = values[label]
+
+
+def _evaluate_shard(aircraft:dict, samples_memory:Tuple[str, tuple], names:Sequence[str], params:Params,
+                    outputs:Sequence[str], chunk_size:int, output:Tuple[str, str], shape:tuple,
+                    start:int, stop:int) -> None:
+    # worker side: attach to the shared input/output buffers and fill the shard rows
+    input_memory = shared_memory.SharedMemory(name=samples_memory[0])
+    output_memory = None
+    try:
+        samples = np.ndarray(samples_memory[1], np.float64, buffer=input_memory.buf)
+
+        if output[0] == "memmap":
+            result = np.load(output[1], mmap_mode="r+")
+        else:
+            output_memory = shared_memory.SharedMemory(name=output[1])
+            result = np.ndarray(shape, np.float64, buffer=output_memory.buf)
+
+        _evaluate_into(aircraft, samples, names, params, outputs, chunk_size, result, start, stop)
+
+        if output[0] == "memmap":
+            result.flush()
+        del samples, result
+
+    finally:
+        input_memory.close()
+        if output_memory is not None:
+            output_memory.close()
+
+
+def _split(n_samples:int, n_shards:int) -> list:
+    bounds = np.linspace(0, n_samples, min(n_shards, max(n_samples, 1)) + 1).astype(int)
+    return [(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+
+def _finalize(result:np.ndarray, output_path:str) -> np.ndarray:
+    if output_path is None:
+        return result
+    if result is not None:
+        result.flush()
+    return np.load(output_path, mmap_mode="r")
@@ -0,0 +1,79 @@
+from .DOC_Calculator import DirectOperatingCost
+from .batch import BatchDirectOperatingCost
+from .utils.params import PARAMS_FIELDS, Params
+from .utils.profiling import TimingStats
+from .utils.schema import INPUT_SCHEMA
+from typing import Dict, Iterable, Mapping, Sequence, Union
+import numpy as np
+
+
+def evaluate_scenarios(aircraft:Union[Mapping, Iterable[Mapping]], scenarios:Sequence[Params],
+                       outputs:Sequence[str]=None, stats:TimingStats=None) -> Dict[str, np.ndarray]:
+    """
+    ### Description
+    Evaluate a set of aircraft against a list of `Params` economic scenarios
+    (horizons, regional tariff sets, ...) in one batch evaluation.
+
+    The aircraft run along the first axis and the scenarios along the
+    second: every Params field differing between the scenarios becomes a
+    (1, n_scenarios) array, the aircraft inputs (n_aircraft, 1) arrays.
+    Cost terms not reading any Params field (crew, maintenance, fuel, ...)
+    are therefore evaluated once per aircraft and only the Params-dependent
+    terms (financial interest, airport and navigation charges, CO2 and
+    noise) and the totals are computed for every aircraft/scenario pair.
+
+    ### Arguments
+    - aircraft   List of aircraft input dicts, or one aircraft dict whose values are
+                 scalars or 1D arrays (one entry per aircraft)
+    - scenarios  Sequence of Params
+    - outputs    Result labels to return (default: all the `calculate_all` outputs)
+    - stats      Optional TimingStats
+
+    ### Returns
+    Dict {result label: (n_aircraft, n_scenarios) array}. Arrays of lines
+    independent of the scenario are read-only broadcast views; stack the
+    labels (`np.stack([results[label] for label in labels], axis=-1)`) for
+    an aircraft x scenario x output cube.
+    """
+    scenarios = list(scenarios)
+    if not scenarios:
+        raise ValueError("At least one scenario is required")
+
+    if isinstance(aircraft, Mapping):
+        record = INPUT_SCHEMA.normalize(aircraft)
+        inputs = {name: np.atleast_1d(np.asarray(value, dtype=np.float64)) for name, value in record.items()}
+        if any(value.ndim != 1 for value in inputs.values()):
+            raise ValueError("Aircraft values must be scalars or 1D arrays")
+    else:
+        record = INPUT_SCHEMA.columns(INPUT_SCHEMA.pack(aircraft))
+        inputs = dict(record.items())
+
+    n_aircraft = np.broadcast_shapes(*(value.shape for value in inputs.values()))[0]
+    shape      = (n_aircraft, len(scenarios))
+
+    # aircraft along the first axis, scenarios along the second
+    calculator = _ScenarioCalculator({name: value[:, None] for name, value in inputs.items()},
+                                     params=_stack_scenarios(scenarios), stats=stats)
+    results    = calculator.calculate_all()
+
+    labels = results if outputs is None else outputs
+    return {label: np.broadcast_to(results[label], shape) for label in labels}
+
+
+class _ScenarioCalculator(BatchDirectOperatingCost):
+
+    # labelled dicts of the cost terms as evaluated: a CostResult block would copy
+    # the scenario-independent lines to every aircraft/scenario pair
+    calculate_doc = DirectOperatingCost.calculate_doc
+    calculate_ioc = DirectOperatingCost.calculate_ioc
+    calculate_all = DirectOperatingCost.calculate_all
+
+
+def _stack_scenarios(scenarios:Sequence[Params]) -> Params:
+    # one (1, n_scenarios) array per Params field varying between the scenarios
+    fields = {}
+    for name in PARAMS_FIELDS:
+        values = [getattr(scenario, name) for scenario in scenarios]
+        fields[name] = values[0] if all(value == values[0] for value in values) else np.array(values, dtype=np.float64)[None, :]
+
+    return Params(**fields)
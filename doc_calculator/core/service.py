@@ -0,0 +1,363 @@
+from .batch import BatchDirectOperatingCost
+from .utils.params import Params
+from .utils.schema import INPUT_SCHEMA
+from collections import deque
+from time import perf_counter
+from typing import Dict, List, Mapping, Sequence, Tuple
+import numpy as np
+import argparse
+import asyncio
+import json
+import math
+import sys
+
+
+class ServiceMetrics(object):
+
+    def __init__(self, window:float, max_batch_size:int, n_latencies:int=10000) -> None:
+        """
+        ### Description
+        Counters of a `MicroBatcher`: requests and batches served, batch
+        sizes, request latencies (queueing + evaluation, over the last
+        `n_latencies` requests) and throughput since the start.
+        """
+        self.window         = window
+        self.max_batch_size = max_batch_size
+        self.requests       = 0
+        self.errors         = 0
+        self.batches        = 0
+        self.last_batch     = 0
+        self.largest_batch  = 0
+        self.latencies      = deque(maxlen=n_latencies)
+        self._start         = perf_counter()
+
+        return None
+
+    def record_batch(self, size:int, latencies:Sequence[float]) -> None:
+        self.requests     += size
+        self.batches      += 1
+        self.last_batch    = size
+        self.largest_batch = max(self.largest_batch, size)
+        self.latencies.extend(latencies)
+
+        return None
+
+    def to_dict(self) -> Dict[str, float]:
+        """Dict of the counters, with latencies in milliseconds and throughput in requests/s."""
+        latencies = np.array(self.latencies) if self.latencies else np.zeros(1)
+        uptime    = perf_counter() - self._start
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "batches": self.batches,
+            "window_ms": 1e3*self.window,
+            "max_batch_size": self.max_batch_size,
+            "last_batch_size": self.last_batch,
+            "largest_batch_size": self.largest_batch,
+            "mean_batch_size": self.requests/self.batches if self.batches else 0.0,
+            "latency_p50_ms": 1e3*float(np.percentile(latencies, 50)),
+            "latency_p99_ms": 1e3*float(np.percentile(latencies, 99)),
+            "throughput_rps": self.requests/uptime,
+            "uptime_s": uptime,
+        }
+
+
+class MicroBatcher(object):
+
+    def __init__(self, params:Params=Params(), window:float=0.002, max_batch_size:int=1024,
+                 outputs:Sequence[str]=None) -> None:
+        """
+        ### Description
+        Queue of DOC requests evaluated in micro-batches: the first queued
+        request opens a batch which collects the following ones for `window`
+        seconds (or until `max_batch_size` requests), then the whole batch is
+        priced by one vectorized `BatchDirectOperatingCost` evaluation and the
+        future of every caller is resolved with its own results.
+
+        Must be started (`await batcher.start()`, or `async with batcher`)
+        inside a running event loop.
+
+        ### Arguments
+        - params          Params economic scenario
+        - window          Batching window [s]
+        - max_batch_size  Maximum number of requests per batch
+        - outputs         Result labels returned (default: all the `calculate_all` outputs)
+        """
+        self.params         = params
+        self.window         = window
+        self.max_batch_size = max_batch_size
+        self.outputs        = outputs
+        self.metrics        = ServiceMetrics(window, max_batch_size)
+
+        self._queue = None
+        self._task  = None
+
+        return None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task  = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the batching task; the requests still queued raise a RuntimeError."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+            while not self._queue.empty():
+                _, future, _ = self._queue.get_nowait()
+                _cancel(future)
+
+    async def __aenter__(self) -> "MicroBatcher":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def submit(self, aircraft:Mapping) -> Dict[str, float]:
+        """
+        ### Description
+        Queue one aircraft input dict and wait for its results (dict
+        {label: float}). Invalid inputs raise here, without affecting the
+        other requests of the batch.
+        """
+        if self._task is None:
+            raise RuntimeError("The MicroBatcher is not running: call `await batcher.start()` or use `async with`")
+
+        try:
+            values = INPUT_SCHEMA.normalize(aircraft).to_array()
+        except (TypeError, ValueError, AttributeError):
+            self.metrics.errors += 1
+            raise
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((values, future, perf_counter()))
+
+        return await future
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                if self._queue.qsize() < self.max_batch_size - 1:
+                    await asyncio.sleep(self.window)
+            except asyncio.CancelledError:
+                # stopped while collecting the batch: its requests are not evaluated
+                for _, future, _ in batch:
+                    _cancel(future)
+                raise
+
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            self._evaluate(batch)
+
+    def _evaluate(self, batch:List[Tuple[np.ndarray, asyncio.Future, float]]) -> None:
+        try:
+            columns = self._price(np.stack([values for values, _, _ in batch]))
+        except Exception:
+            # one invalid request (e.g. an ieng flag other than 1 or 2) fails the batch evaluation:
+            # the requests are priced one by one, so that only the invalid ones raise
+            served = [start for request in batch if self._evaluate_one(request) for start in request[2:]]
+            if served:
+                end = perf_counter()
+                self.metrics.record_batch(len(served), [end - start for start in served])
+            return
+
+        end = perf_counter()
+        for i, (_, future, _) in enumerate(batch):
+            if not future.done():
+                future.set_result({label: values[i] for label, values in columns.items()})
+
+        self.metrics.record_batch(len(batch), [end - start for _, _, start in batch])
+
+    def _evaluate_one(self, request:Tuple[np.ndarray, asyncio.Future, float]) -> bool:
+        values, future, _ = request
+        try:
+            columns = self._price(values[None, :])
+        except Exception as error:
+            self.metrics.errors += 1
+            if not future.done():
+                future.set_exception(error)
+            return False
+
+        if not future.done():
+            future.set_result({label: column[0] for label, column in columns.items()})
+        return True
+
+    def _price(self, matrix:np.ndarray) -> Dict[str, list]:
+        results = BatchDirectOperatingCost(INPUT_SCHEMA.columns(matrix), params=self.params).calculate_all()
+        labels  = results if self.outputs is None else self.outputs
+        return {label: np.broadcast_to(results[label], (len(matrix),)).tolist() for label in labels}
+
+
+class PricingServer(object):
+
+    def __init__(self, batcher:MicroBatcher=None, host:str="127.0.0.1", port:int=8080) -> None:
+        """
+        ### Description
+        Minimal HTTP/1.1 pricing service (standard library only) in front of a
+        `MicroBatcher`:
+
+        - POST /doc      JSON aircraft input dict -> JSON dict of results
+                         (non-finite costs as null); 400 for invalid or null
+                         inputs, 503 once the batcher is stopped, 500 for any
+                         other evaluation error
+        - GET  /metrics  JSON `ServiceMetrics` counters
+
+        Use `port=0` to bind a free port, read back from `port` once started.
+        """
+        self.batcher = batcher if batcher is not None else MicroBatcher()
+        self.host    = host
+        self.port    = port
+        self._server = None
+
+        return None
+
+    async def start(self) -> None:
+        await self.batcher.start()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port    = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+        await self.batcher.stop()
+
+    async def __aenter__(self) -> "PricingServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def serve_forever(self) -> None:
+        async with self:
+            await self._server.serve_forever()
+
+    async def _handle(self, reader:asyncio.StreamReader, writer:asyncio.StreamWriter) -> None:
+        # keep-alive connection: one request after the other until the client closes it
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except ValueError as error:
+                    # malformed request line or Content-Length: the connection cannot be read further
+                    writer.write(_format_response(400, {"error": str(error)}, keep_alive=False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, payload = await self._respond(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(_format_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, method:str, path:str, body:bytes) -> Tuple[int, object]:
+        if path == "/metrics" and method == "GET":
+            return 200, self.batcher.metrics.to_dict()
+        if path != "/doc":
+            return 404, {"error": f"Unknown path {path}"}
+        if method != "POST":
+            return 405, {"error": f"Method {method} not allowed"}
+
+        try:
+            aircraft = json.loads(body, parse_constant=_reject_constant)
+            if not isinstance(aircraft, dict):
+                raise ValueError("The request body must be a JSON object of aircraft inputs")
+            missing = [name for name, value in aircraft.items() if value is None]
+            if missing:
+                raise ValueError(f"Null aircraft input(s) {missing}")
+            results = await self.batcher.submit(aircraft)
+        except (TypeError, ValueError) as error:
+            return 400, {"error": str(error)}
+        except RuntimeError as error:
+            # the batcher is not running or was stopped before pricing the request
+            return 503, {"error": str(error)}
+        except Exception as error:
+            return 500, {"error": f"{type(error).__name__}: {error}"}
+
+        # non-finite costs (e.g. zero utilisation) are not valid JSON numbers
+        return 200, {label: value if math.isfinite(value) else None for label, value in results.items()}
+
+
+async def _read_request(reader:asyncio.StreamReader):
+    line = await reader.readline()
+    if not line.strip():
+        return None
+
+    try:
+        method, path, _ = line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise ValueError(f"Malformed request line {line!r}") from None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    length = headers.get("content-length", "0")
+    if not length.isdigit():
+        raise ValueError(f"Invalid Content-Length {length!r}")
+
+    body = await reader.readexactly(int(length))
+    return method.upper(), path.split("?", 1)[0], headers, body
+
+
+def _reject_constant(constant:str) -> None:
+    raise ValueError(f"Non-finite value {constant} in the request body")
+
+
+def _cancel(future:asyncio.Future) -> None:
+    if not future.done():
+        future.set_exception(RuntimeError("The MicroBatcher was stopped before evaluating the request"))
+
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+def _format_response(status:int, payload:object, keep_alive:bool) -> bytes:
+    body = json.dumps(payload, allow_nan=False).encode()
+    head = (f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode("latin-1") + body
+
+
+def main(argv:Sequence[str]=None) -> None:
+    parser = argparse.ArgumentParser(description="DOC pricing service with request micro-batching")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--window", type=float, default=2.0, help="batching window [ms]")
+    parser.add_argument("--max-batch-size", type=int, default=1024)
+    args = parser.parse_args(argv)
+
+    batcher = MicroBatcher(window=1e-3*args.window, max_batch_size=args.max_batch_size)
+    server  = PricingServer(batcher, host=args.host, port=args.port)
+    print(f"Serving DOC quotes on http://{args.host}:{args.port}/doc (metrics: /metrics)", file=sys.stderr)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
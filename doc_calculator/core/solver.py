@@ -0,0 +1,128 @@
+from .batch import BatchDirectOperatingCost
+from .gradients import calculate_gradients
+from .utils.params import PARAMS_FIELDS, Params
+from .utils.schema import INPUT_SCHEMA
+from typing import Mapping, Tuple, Union
+import numpy as np
+import warnings
+
+
+def solve(aircraft:Mapping, variable:str, target, output:str="DOC [USD/flight]", params:Params=Params(),
+          initial=None, rtol:float=1.0e-10, max_iter:int=50) -> Union[float, np.ndarray]:
+    """
+    ### Description
+    Find the value of one input (aircraft key or upper case `Params` field)
+    giving a target DOC/IOC/TOC, vectorized over many aircraft/target pairs:
+    the aircraft values and the targets may be arrays, broadcast together.
+
+    The output is solved with Newton iterations on the analytic derivatives
+    of `calculate_gradients`, starting from the current input value (or
+    `initial`). Outputs affine in the variable (e.g. DOC versus fuelpri,
+    batprice, h2_pri or crtechr) are solved in closed form by the first
+    step, the second evaluation only confirming the residual. A step
+    turning a positive input negative is shortened instead (by 2, then 4,
+    16, ... on consecutive crossings), the entry being given up when the input
+    nears zero without a change of the residual sign; once the residual
+    changed sign, the steps leaving the bracket are replaced by bisection.
+
+    ### Arguments
+    - aircraft  Aircraft input dict (scalars or arrays)
+    - variable  Input to solve for
+    - target    Target value(s) of `output`
+    - output    Output label: a `calculate_doc`/`calculate_ioc` label, "TOC [USD/BHR]" or "TOC [USD/flight]"
+    - params    Params economic scenario
+    - initial   Optional initial guess(es) (default: the current input value)
+    - rtol      Convergence tolerance on the residual, relative to the target
+    - max_iter  Maximum number of Newton steps
+
+    ### Returns
+    Solution (float, or array for array inputs). Entries which do not
+    converge (e.g. output independent of the variable) are NaN, with a
+    RuntimeWarning.
+    """
+    name = variable if variable in PARAMS_FIELDS else INPUT_SCHEMA.canonical(variable)
+    if name is None:
+        raise KeyError(f"Unknown input '{variable}'")
+    if name == "ieng":
+        raise ValueError("ieng is a discrete flag and cannot be solved for")
+
+    target = np.asarray(target, dtype=np.float64)
+    if initial is None:
+        initial = getattr(params, name) if name in PARAMS_FIELDS else BatchDirectOperatingCost(aircraft, params).aircraft[name]
+
+    value   = np.array(initial, dtype=np.float64)
+    scale   = np.abs(value)
+    below   = np.full(value.shape, np.nan)     # latest input values with a negative/positive residual:
+    above   = np.full(value.shape, np.nan)     # they bracket the solution once both are known
+    halving = np.zeros(value.shape)            # exponent of the shortening factor 0.5**halving
+    failed  = np.zeros(value.shape, dtype=bool)
+
+    for iteration in range(max_iter + 1):
+        result, derivative = _evaluate(aircraft, params, name, value, output)
+
+        residual  = result - target
+        converged = np.abs(residual) <= rtol*np.maximum(np.abs(target), 1.0)
+        if (converged | failed).all() or iteration == max_iter:
+            break
+
+        below = np.where(residual < 0.0, value, below)
+        above = np.where(residual > 0.0, value, above)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = np.where(derivative != 0.0, residual/derivative, np.nan)
+
+        update     = value - step
+        bracketed  = np.isfinite(below) & np.isfinite(above)
+        crossing   = ~bracketed & (value > 0.0) & (update <= 0.0)
+        low, high  = np.fmin(below, above), np.fmax(below, above)
+
+        # inside a bracket, Newton steps leaving it are replaced by bisection
+        outside = bracketed & ~((update > low) & (update < high))
+        update  = np.where(outside, 0.5*(low + high), update)
+
+        # a step turning a positive input negative is shortened, ever more on consecutive
+        # crossings; the solution is taken as negative once the input nears zero with no
+        # change of the residual sign
+        halving = np.where(crossing, np.fmax(2.0*halving, 1.0), 0.0)
+        update  = np.where(crossing, value*0.5**halving, update)
+        failed  = failed | (~converged & (~np.isfinite(update) | (crossing & (update <= 1.0e-12*scale))))
+        value   = np.where(converged | failed, value, update)
+
+    converged = converged & ~failed
+    solution  = np.where(converged, value, np.nan)
+    if not converged.all():
+        warnings.warn(f"{np.count_nonzero(~converged)} of {converged.size} {name} solution(s) did not converge",
+                      RuntimeWarning, stacklevel=2)
+
+    return float(solution) if solution.ndim == 0 else solution
+
+
+def breakeven(aircraft:Mapping, baseline:Mapping, variable:str, output:str="DOC [USD/flight]",
+              params:Params=Params(), baseline_params:Params=None, **kwargs) -> Union[float, np.ndarray]:
+    """
+    ### Description
+    Value of `variable` for which `aircraft` matches the `output` of a
+    baseline aircraft (e.g. the battery price making a hybrid-electric
+    design as cheap per flight as a conventional one). Both aircraft dicts
+    may hold arrays. Keyword arguments are passed to `solve`.
+    """
+    baseline_params = params if baseline_params is None else baseline_params
+    target          = BatchDirectOperatingCost(baseline, baseline_params).calculate_all()[output]
+
+    return solve(aircraft, variable, target, output=output, params=params, **kwargs)
+
+
+def _evaluate(aircraft:Mapping, params:Params, name:str, value:np.ndarray, output:str) -> Tuple[np.ndarray, np.ndarray]:
+    if name in PARAMS_FIELDS:
+        calculator = BatchDirectOperatingCost(aircraft, Params(**{**vars(params), name: value}))
+    else:
+        calculator = BatchDirectOperatingCost({**aircraft, name: value}, params)
+
+    gradients = calculate_gradients(calculator)
+    if output.startswith("TOC"):
+        per      = output[len("TOC"):]
+        gradient = (gradients["DOC" + per].get(name, 0.0) + gradients["IOC" + per].get(name, 0.0))
+    else:
+        gradient = gradients[output].get(name, 0.0)
+
+    return calculator.calculate_all()[output], np.asarray(gradient, dtype=np.float64)
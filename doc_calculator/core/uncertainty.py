@@ -0,0 +1,235 @@
+from .parallel import evaluate_samples
+from .utils.params import Params
+from typing import Dict, Mapping, Sequence
+import numpy as np
+
+DEFAULT_PERCENTILES = (5.0, 25.0, 50.0, 75.0, 95.0)
+
+
+class Normal(object):
+
+    def __init__(self, mean:float, std:float) -> None:
+        self.mean = mean
+        self.std  = std
+
+    def sample(self, rng:np.random.Generator, n:int) -> np.ndarray:
+        return rng.normal(self.mean, self.std, n)
+
+
+class LogNormal(object):
+
+    def __init__(self, mean:float, sigma:float) -> None:
+        """Log-normal distribution: mean and sigma of the underlying normal distribution."""
+        self.mean  = mean
+        self.sigma = sigma
+
+    def sample(self, rng:np.random.Generator, n:int) -> np.ndarray:
+        return rng.lognormal(self.mean, self.sigma, n)
+
+
+class Uniform(object):
+
+    def __init__(self, low:float, high:float) -> None:
+        self.low  = low
+        self.high = high
+
+    def sample(self, rng:np.random.Generator, n:int) -> np.ndarray:
+        return rng.uniform(self.low, self.high, n)
+
+
+class Triangular(object):
+
+    def __init__(self, low:float, mode:float, high:float) -> None:
+        self.low  = low
+        self.mode = mode
+        self.high = high
+
+    def sample(self, rng:np.random.Generator, n:int) -> np.ndarray:
+        return rng.triangular(self.low, self.mode, self.high, n)
+
+
+class RunningStatistics(object):
+
+    def __init__(self, n_outputs:int, reservoir_size:int=100000, rng:np.random.Generator=None) -> None:
+        """
+        ### Description
+        Streaming statistics of `n_outputs` quantities updated chunk by chunk
+        with constant memory: count, mean and variance (Chan/Welford merge),
+        min/max and a uniform reservoir sample of at most `reservoir_size`
+        rows for the percentiles (exact as long as the count does not exceed
+        the reservoir size).
+        """
+        self.count      = 0
+        self.mean       = np.zeros(n_outputs)
+        self._m2        = np.zeros(n_outputs)
+        self.min        = np.full(n_outputs, np.inf)
+        self.max        = np.full(n_outputs, -np.inf)
+        self._rng       = rng if rng is not None else np.random.default_rng()
+        self._reservoir = np.empty((reservoir_size, n_outputs))
+
+        return None
+
+    def update(self, values:np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64).reshape(len(values), -1)
+        n      = len(values)
+        if n == 0:
+            return None
+
+        # merge the chunk moments into the running ones
+        chunk_mean = values.mean(axis=0)
+        chunk_m2   = ((values - chunk_mean)**2).sum(axis=0)
+        total      = self.count + n
+        delta      = chunk_mean - self.mean
+
+        self.mean = self.mean + delta*n/total
+        self._m2  = self._m2 + chunk_m2 + delta**2*self.count*n/total
+        self.min  = np.minimum(self.min, values.min(axis=0))
+        self.max  = np.maximum(self.max, values.max(axis=0))
+
+        # reservoir sampling (algorithm R) of the rows
+        size   = len(self._reservoir)
+        filled = min(max(size - self.count, 0), n)
+        self._reservoir[self.count:self.count + filled] = values[:filled]
+        if filled < n:
+            seen   = np.arange(self.count + filled, total) + 1
+            slots  = (self._rng.random(n - filled)*seen).astype(np.int64)
+            keep   = slots < size
+            self._reservoir[slots[keep]] = values[filled:][keep]
+
+        self.count = total
+        return None
+
+    @property
+    def variance(self) -> np.ndarray:
+        return self._m2/(self.count - 1) if self.count > 1 else np.zeros_like(self._m2)
+
+    @property
+    def std(self) -> np.ndarray:
+        return np.sqrt(self.variance)
+
+    def percentiles(self, q:Sequence[float]) -> np.ndarray:
+        """(len(q), n_outputs) array of percentiles."""
+        return np.percentile(self._reservoir[:min(self.count, len(self._reservoir))], q, axis=0)
+
+
+def propagate(aircraft:dict, distributions:Mapping[str, object], n_samples:int, params:Params=Params(),
+              seed:int=None, chunk_size:int=100000, outputs:Sequence[str]=None,
+              percentiles:Sequence[float]=DEFAULT_PERCENTILES, sobol:bool=False,
+              reservoir_size:int=100000) -> Dict[str, dict]:
+    """
+    ### Description
+    Monte Carlo propagation of input uncertainties through the DOC model.
+
+    Samples are drawn `chunk_size` at a time from the given distributions,
+    evaluated with the batch engine and folded into running statistics, so
+    memory does not grow with `n_samples`.
+
+    With `sobol=True`, first-order (Saltelli) and total (Jansen) Sobol indices
+    of every output are estimated with the pick-freeze scheme: each chunk
+    draws two independent sample matrices A and B and evaluates the model on
+    A, B and the k matrices A with column i taken from B, i.e.
+    n_samples*(k + 2) evaluations.
+
+    ### Arguments
+    - aircraft        Nominal aircraft input dict
+    - distributions   Dict {input key or "Params.<FIELD>": distribution} where a distribution
+                      is any object with a `sample(rng, n)` method (Normal, LogNormal,
+                      Uniform, Triangular, ...)
+    - n_samples       Number of Monte Carlo samples
+    - params          Nominal Params economic scenario
+    - seed            Seed of the random generator (reproducible results)
+    - chunk_size      Number of samples evaluated at once
+    - outputs         Result labels (`calculate_all` keys) to analyse (default: all)
+    - percentiles     Percentiles to estimate, in [0, 100]
+    - sobol           Whether to estimate the Sobol sensitivity indices
+    - reservoir_size  Number of samples kept to estimate the percentiles
+
+    ### Returns
+    Dict {output label: {"mean", "std", "min", "max", "percentiles": {q: value},
+    and with sobol=True "first_order"/"total_order": {input: index}}}.
+    """
+    names = list(distributions)
+    sampling, reservoir = (np.random.default_rng(seed_sequence) for seed_sequence in np.random.SeedSequence(seed).spawn(2))
+
+    statistics = None
+    sobol_sums = None
+
+    for start in range(0, n_samples, chunk_size):
+        n = min(chunk_size, n_samples - start)
+
+        sample_a = np.column_stack([distributions[name].sample(sampling, n) for name in names])
+        values_a = evaluate_samples(aircraft, sample_a, names, params)
+
+        if statistics is None:
+            outputs    = list(values_a) if outputs is None else list(outputs)
+            statistics = RunningStatistics(len(outputs), reservoir_size, reservoir)
+            if sobol:
+                sobol_sums = _SobolSums(len(names), len(outputs))
+
+        f_a = _stack(values_a, outputs, n)
+        statistics.update(f_a)
+
+        if sobol:
+            sample_b = np.column_stack([distributions[name].sample(sampling, n) for name in names])
+            f_b      = _stack(evaluate_samples(aircraft, sample_b, names, params), outputs, n)
+            f_ab     = []
+            for i in range(len(names)):
+                sample_ab       = sample_a.copy()
+                sample_ab[:, i] = sample_b[:, i]
+                f_ab.append(_stack(evaluate_samples(aircraft, sample_ab, names, params), outputs, n))
+            sobol_sums.update(f_a, f_b, f_ab)
+
+    if statistics is None:
+        raise ValueError(f"n_samples Value {n_samples} not valid")
+
+    quantiles = statistics.percentiles(percentiles)
+    results   = {}
+    for j, label in enumerate(outputs):
+        results[label] = {
+            "mean": float(statistics.mean[j]),
+            "std": float(statistics.std[j]),
+            "min": float(statistics.min[j]),
+            "max": float(statistics.max[j]),
+            "percentiles": {q: float(quantiles[k, j]) for k, q in enumerate(percentiles)},
+        }
+        if sobol:
+            first_order, total_order = sobol_sums.indices(j)
+            results[label]["first_order"] = dict(zip(names, first_order))
+            results[label]["total_order"] = dict(zip(names, total_order))
+
+    return results
+
+
+class _SobolSums(object):
+
+    # running sums of the Saltelli (first order) and Jansen (total) estimators
+    def __init__(self, n_inputs:int, n_outputs:int) -> None:
+        self.variance    = RunningStatistics(n_outputs, reservoir_size=1)
+        self.first_order = np.zeros((n_inputs, n_outputs))
+        self.total_order = np.zeros((n_inputs, n_outputs))
+        self.count       = 0
+
+    def update(self, f_a:np.ndarray, f_b:np.ndarray, f_ab:Sequence[np.ndarray]) -> None:
+        self.variance.update(np.concatenate([f_a, f_b]))
+
+        # centering f(B) leaves the estimator unbiased (E[f(AB_i) - f(A)] = 0) and
+        # removes its variance due to the output mean, large for cost outputs
+        f_b = f_b - self.variance.mean
+        for i, f_abi in enumerate(f_ab):
+            self.first_order[i] += (f_b*(f_abi - f_a)).sum(axis=0)
+            self.total_order[i] += ((f_a - f_abi)**2).sum(axis=0)
+        self.count += len(f_a)
+
+    def indices(self, output:int) -> tuple:
+        variance = self.variance.variance[output]
+        if variance <= 0.0:
+            zeros = [0.0]*len(self.first_order)
+            return zeros, zeros
+
+        first_order = self.first_order[:, output]/self.count/variance
+        total_order = 0.5*self.total_order[:, output]/self.count/variance
+        return [float(value) for value in first_order], [float(value) for value in total_order]
+
+
+def _stack(values:dict, outputs:Sequence[str], n:int) -> np.ndarray:
+    return np.column_stack([np.broadcast_to(values[label], (n,)) for label in outputs])
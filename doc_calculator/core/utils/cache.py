@@ -0,0 +1,120 @@
+from .params import Params, params_values
+from collections import OrderedDict
+from typing import Any, Hashable
+import os
+import pickle
+
+
+class ResultCache(object):
+
+    def __init__(self, max_size:int=1024, path:str=None, digits:int=None) -> None:
+        """
+        ### Description
+        Bounded LRU cache of evaluated operating costs, shared across
+        `DirectOperatingCost` instances (and `GemseoDirectOperatingCost`
+        executions) to skip the evaluation of design points already seen.
+
+        Entries are keyed on the calculator class (module and qualified name),
+        the normalized aircraft input vector and the `Params` values (a
+        subclass overriding cost terms never gets the results of its base
+        class); the least recently used entry is evicted once `max_size`
+        entries are stored.
+
+        The persistence file is read with `pickle`, which can run arbitrary
+        code: only load cache files you created or otherwise trust.
+
+        ### Arguments
+        - max_size  Maximum number of stored design points
+        - path      Optional persistence file: loaded at creation if it exists,
+                    written by `save`
+        - digits    Optional number of significant digits the inputs are rounded
+                    to in the key, so that near-identical design points hit the
+                    same entry (exact match if None)
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size Value {max_size} not valid")
+
+        self.max_size = max_size
+        self.path     = path
+        self.digits   = digits
+        self.hits     = 0
+        self.misses   = 0
+        self._entries = OrderedDict()
+
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+        return None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key:Hashable) -> bool:
+        return key in self._entries
+
+    def key(self, aircraft:dict, params:Params, calculator:str=None) -> tuple:
+        values = (*aircraft.values(), *params_values(params))
+
+        if self.digits is None:
+            return (calculator, *(float(value) for value in values))
+
+        return (calculator, *(float(f"{value:.{self.digits}g}") for value in values))
+
+    def get(self, key:Hashable) -> Any:
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        return None
+
+    def put(self, key:Hashable, value:Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+        return None
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits   = 0
+        self.misses = 0
+
+        return None
+
+    @property
+    def stats(self) -> dict:
+        calls = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits/calls if calls else 0.0,
+        }
+
+    def save(self, path:str=None) -> None:
+        path = path or self.path
+        if path is None:
+            raise ValueError("No persistence path given")
+
+        # write to a temporary file first so an interrupted save never corrupts the cache
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as file:
+            pickle.dump(list(self._entries.items()), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+        return None
+
+    def load(self, path:str=None) -> None:
+        """Add the entries of a file written by `save`; unpickled, so it must be a trusted file."""
+        path = path or self.path
+
+        with open(path, "rb") as file:
+            for key, value in pickle.load(file):
+                self.put(key, value)
+
+        return None
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from operator import attrgetter
 
 @dataclass
 class Params():
@@ -19,12 +20,19 @@ class Params():
 
     AEC: float = 0.15
     ENR: float = 68.5
-    INTEREST_RATE = 0.053
     LANDINGUR: float = 10.0
     HTONN: float = 45.0
     CNOISE: float = 4.15
     TA: float = 89.0
     TD: float = 92.0
+    INTEREST_RATE: float = 0.053  # last field: keeps the positional order of the others
+
+PARAMS_FIELDS = tuple(field.name for field in fields(Params))
+
+_params_getter = attrgetter(*PARAMS_FIELDS)
+
+def params_values(params:Params) -> tuple:
+    return _params_getter(params)
 
 default_dict = {"ADP": 0.0,
         "MTOW": 0.0,
@@ -39,6 +47,7 @@ default_dict = {"ADP": 0.0,
         "BF": 0.0,
         "SECTOR": 0.0,
         "IENG": 1.0,
+        "EOC": 0.0,
         "SHP": 0.0,
         "AFSPARE": 0.0,
         "ENSPARE": 0.0,
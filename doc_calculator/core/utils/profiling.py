@@ -0,0 +1,136 @@
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List
+import marshal
+import json
+
+# stack of the TimingStats activated with a `with` block (innermost last)
+_ACTIVE_STATS: List["TimingStats"] = []
+
+
+def active_stats() -> "TimingStats":
+    """Innermost TimingStats activated with a `with` block, or None."""
+    return _ACTIVE_STATS[-1] if _ACTIVE_STATS else None
+
+
+class TimingStats(object):
+
+    def __init__(self) -> None:
+        """
+        ### Description
+        Opt-in call counters and wall time of the evaluation stages (input
+        normalization, every `_calculate_*` cost term, result assembly,
+        GEMSEO execution and grammar checks).
+
+        For every stage the number of calls, the cumulative time (callees
+        included) and the own time (callees excluded) are recorded: e.g. the
+        own time of `calculate_doc` is the result dict assembly, the own time
+        of `gemseo.execute` the GEMSEO overhead (grammar checks, data
+        processing) around `_run`.
+
+        Pass it to a calculator (`stats` keyword) or activate it for every
+        calculator created in a `with` block:
+
+            with TimingStats() as stats:
+                ...
+            print(stats.report())
+
+        Calculators created without stats are not instrumented at all.
+        """
+        self.calls      = {}
+        self.total_time = {}
+        self.own_time   = {}
+        self._stack     = []
+
+        return None
+
+    def __enter__(self) -> "TimingStats":
+        _ACTIVE_STATS.append(self)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        _ACTIVE_STATS.remove(self)
+
+    def reset(self) -> None:
+        self.calls.clear()
+        self.total_time.clear()
+        self.own_time.clear()
+
+        return None
+
+    def wrap(self, name:str, function:Callable) -> Callable:
+        """Return `function` recording its calls under the stage `name`."""
+
+        def timed(*args, **kwargs):
+            self._stack.append(0.0)
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._record(name, perf_counter() - start)
+
+        timed.__wrapped__ = function
+        return timed
+
+    @contextmanager
+    def timer(self, name:str) -> Iterator[None]:
+        """Record the execution of a `with` block under the stage `name`."""
+        self._stack.append(0.0)
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, perf_counter() - start)
+
+    def instrument(self, instance:object, names:List[str]) -> None:
+        """Replace the methods `names` of `instance` (not of its class) by recording wrappers."""
+        for name in names:
+            setattr(instance, name, self.wrap(name, getattr(instance, name)))
+
+        return None
+
+    def to_dict(self) -> Dict[str, dict]:
+        """Dict {stage: {"calls", "total_time", "own_time"}} with times in seconds."""
+        return {
+            name: {"calls": calls, "total_time": self.total_time[name], "own_time": self.own_time[name]}
+            for name, calls in self.calls.items()
+        }
+
+    def to_json(self, path:str=None) -> str:
+        """JSON dump of `to_dict`, also written to `path` if given."""
+        text = json.dumps(self.to_dict(), indent=2)
+        if path is not None:
+            with open(path, "w") as file:
+                file.write(text)
+        return text
+
+    def dump_stats(self, path:str) -> None:
+        """Write the stats in the cProfile format, readable with `pstats.Stats(path)`."""
+        with open(path, "wb") as file:
+            marshal.dump(self._pstats(), file)
+
+        return None
+
+    def report(self) -> str:
+        """Table of the stages sorted by cumulative time."""
+        lines = [f"{'stage':50s}{'calls':>10s}{'total [ms]':>14s}{'own [ms]':>14s}"]
+        for name in sorted(self.calls, key=self.total_time.get, reverse=True):
+            lines.append(f"{name:50s}{self.calls[name]:10d}{1e3*self.total_time[name]:14.3f}{1e3*self.own_time[name]:14.3f}")
+        return "\n".join(lines)
+
+    def _record(self, name:str, elapsed:float) -> None:
+        # the stack holds the time spent in the callees of every running stage
+        callees = self._stack.pop()
+        if self._stack:
+            self._stack[-1] += elapsed
+
+        self.calls[name]      = self.calls.get(name, 0) + 1
+        self.total_time[name] = self.total_time.get(name, 0.0) + elapsed
+        self.own_time[name]   = self.own_time.get(name, 0.0) + elapsed - callees
+
+    def _pstats(self) -> dict:
+        # {(file, line, function): (primitive calls, calls, own time, cumulative time, callers)}
+        return {
+            ("doc_calculator", 0, name): (calls, calls, self.own_time[name], self.total_time[name], {})
+            for name, calls in self.calls.items()
+        }
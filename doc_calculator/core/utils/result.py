@@ -0,0 +1,168 @@
+from typing import Dict, Mapping, Tuple
+import numpy as np
+
+# stable field id -> result label of `calculate_all`, in the `calculate_all` order
+RESULT_FIELDS = (
+    ("insurance", "INSURANCE [USD/BHR]"),
+    ("depreciation", "DEPRECIATION [USD/BHR]"),
+    ("interest", "INTEREST [USD/BHR]"),
+    ("fuel", "FUEL [USD/BHR]"),
+    ("electricity", "ELECTRYCITY [USD/BHR]"),
+    ("h2", "H2 [USD/BHR]"),
+    ("cockpit_crew", "COCKPIT CREW [USD/BHR]"),
+    ("cabin_crew", "CABIN CREW [USD/BHR]"),
+    ("landing_fees", "LANDING FEES [USD/BHR]"),
+    ("navigation_charges", "NAVIGATION CHARGES [USD/BHR]"),
+    ("ground_handling", "GROUND HANDLING [USD/BHR]"),
+    ("noise_charges", "NOISE CHARGES [USD/BHR]"),
+    ("nox_emission_charges", "NOX EMISSION CHARGES [USD/BHR]"),
+    ("co_emission_charges", "CO EMISSION CHARGES [USD/BHR]"),
+    ("co2_emission_charges", "CO2 EMISSION CHARGES [USD/BHR]"),
+    ("airframe_maintenance", "AIRFRANE MAINTENANCE [USD/BHR]"),
+    ("thermal_engine_maintenance", "THERM. ENG. MAINTENANCE [USD/BH]"),
+    ("electric_machine_line_maintenance", "ELECTRIC MACHINE LINE MAINT. [USD/BH]"),
+    ("electric_machine_base_maintenance", "ELECTRIC MACHINE BASE MAINT. [USD/BH]"),
+    ("battery_line_maintenance", "BATTERY LINE MAINT. [USD/BH]"),
+    ("battery_base_maintenance", "BATTERY BASE MAINT. [USD/BH]"),
+    ("fuel_cell_line_maintenance", "FUEL CELL LINE MAINT. [USD/BH]"),
+    ("fuel_cell_base_maintenance", "FUEL CELL BASE MAINT. [USD/BH]"),
+    ("power_electronics_line_maintenance", "POWER ELECTR. LINE MAINT. [USD/BH]"),
+    ("power_electronics_base_maintenance", "POWER ELECTR. BASE MAINT. [USD/BH]"),
+    ("doc_bhr", "DOC [USD/BHR]"),
+    ("doc_flight", "DOC [USD/flight]"),
+    ("ioc_bhr", "IOC [USD/BHR]"),
+    ("ioc_flight", "IOC [USD/flight]"),
+    ("toc_bhr", "TOC [USD/BHR]"),
+    ("toc_flight", "TOC [USD/flight]"),
+)
+
+
+def _unit(label:str) -> str:
+    unit = label[label.rindex("[") + 1:-1]
+    return "USD/BHR" if unit == "USD/BH" else unit
+
+
+class CostResult(object):
+
+    FIELDS = tuple(field for field, _ in RESULT_FIELDS)
+    LABELS = dict(RESULT_FIELDS)
+    UNITS  = {field: _unit(label) for field, label in RESULT_FIELDS}
+    INDEX  = {**{field: i for i, field in enumerate(FIELDS)}, **{label: i for i, (_, label) in enumerate(RESULT_FIELDS)}}
+
+    __slots__ = ("values",)
+
+    def __init__(self, values:np.ndarray) -> None:
+        """
+        ### Description
+        Columnar cost breakdown: one C-contiguous float64 block of shape
+        (n_fields, *shape) holding every cost line and total of
+        `calculate_all`, one row per field.
+
+        Fields are read as attributes or items by stable id (`result.fuel`,
+        `result["doc_flight"]`) or by their `calculate_all` label, each being
+        a view of the block. `LABELS` and `UNITS` give the label and the unit
+        of every field id ("USD/BHR" or "USD/flight").
+
+        - as_dict     the `calculate_all` dict, its values being views of the block
+        - to_pandas   DataFrame (one column per field id) sharing the block
+        - to_arrow    pyarrow Table (one column per field id, unit and label
+                      in the field metadata) sharing the block
+        """
+        if values.shape[0] != len(self.FIELDS):
+            raise ValueError(f"Expected {len(self.FIELDS)} result rows, got {values.shape[0]}")
+        self.values = np.ascontiguousarray(values, dtype=np.float64)
+
+        return None
+
+    @classmethod
+    def from_dict(cls, results:Mapping[str, object]) -> "CostResult":
+        """CostResult of a `calculate_all` dict (scalars or arrays)."""
+        shape  = np.broadcast_shapes(*(np.shape(results[label]) for _, label in RESULT_FIELDS))
+        values = np.empty((len(cls.FIELDS), *shape))
+        for i, (_, label) in enumerate(RESULT_FIELDS):
+            values[i] = results[label]
+
+        return cls(values)
+
+    @classmethod
+    def from_evaluation(cls, financial:Dict[str, object], operating:Dict[str, object], bt, ioc_fact) -> "CostResult":
+        """
+        ### Description
+        CostResult of the evaluated cost lines of a calculator, the cost lines
+        being written once into the block and the totals computed on its rows
+        (in the order of `calculate_doc`/`calculate_ioc`: same results bit by
+        bit).
+        """
+        lines  = (*financial.items(), *operating.items())
+        shape  = np.broadcast_shapes(*(np.shape(value) for _, value in lines), np.shape(bt), np.shape(ioc_fact))
+        values = np.empty((len(cls.FIELDS), *shape))
+
+        for label, value in lines:
+            values[cls.INDEX[label]] = value
+
+        n_financial = len(financial)
+        n_lines     = len(lines)
+        index       = cls.INDEX
+        operating   = sum(values[n_financial:n_lines])
+        doc         = sum(values[:n_financial]) + operating
+
+        values[index["doc_bhr"]]    = doc
+        values[index["doc_flight"]] = bt*values[index["doc_bhr"]]
+        values[index["ioc_bhr"]]    = ioc_fact*operating
+        values[index["ioc_flight"]] = bt*values[index["ioc_bhr"]]
+        values[index["toc_bhr"]]    = values[index["doc_bhr"]] + values[index["ioc_bhr"]]
+        values[index["toc_flight"]] = values[index["doc_flight"]] + values[index["ioc_flight"]]
+
+        return cls(values)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.values.shape[1:]
+
+    def __getitem__(self, key:str) -> np.ndarray:
+        return self.values[self.INDEX[key]]
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __repr__(self) -> str:
+        return f"CostResult(shape={self.shape})"
+
+    def as_dict(self) -> Dict[str, object]:
+        """The `calculate_all` dict (floats for a single aircraft, else views of the block)."""
+        if not self.shape:
+            return dict(zip(self.LABELS.values(), self.values.tolist()))
+        return dict(zip(self.LABELS.values(), self.values))
+
+    def to_pandas(self):
+        """DataFrame with a column per field id and a row per aircraft, sharing the block."""
+        try:
+            import pandas
+        except ImportError:
+            raise ImportError("CostResult.to_pandas requires pandas (pip install pandas)") from None
+
+        # pandas stores a float block as (n_columns, n_rows): the transposed view is used as is
+        frame = pandas.DataFrame(self.values.reshape(len(self.FIELDS), -1).T, columns=list(self.FIELDS), copy=False)
+        frame.attrs["units"]  = dict(self.UNITS)
+        frame.attrs["labels"] = dict(self.LABELS)
+        return frame
+
+    def to_arrow(self):
+        """pyarrow Table with a column per field id (unit and label in the field metadata), sharing the block."""
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("CostResult.to_arrow requires pyarrow (pip install pyarrow)") from None
+
+        rows   = self.values.reshape(len(self.FIELDS), -1)
+        schema = pyarrow.schema([pyarrow.field(field, pyarrow.float64(), metadata={"unit": self.UNITS[field],
+                                                                                   "label": self.LABELS[field]})
+                                 for field in self.FIELDS])
+        return pyarrow.Table.from_arrays([pyarrow.array(row) for row in rows], schema=schema)
+
+
+for _i, _field in enumerate(CostResult.FIELDS):
+    setattr(CostResult, _field, property(lambda self, _i=_i: self.values[_i], doc=f"{CostResult.LABELS[_field]} row"))
@@ -0,0 +1,192 @@
+from .params import default_dict
+from typing import Any, Iterable, Iterator, Mapping, Sequence, Tuple
+import warnings
+
+
+class AircraftRecord(object):
+    """
+    ### Description
+    Compact `__slots__` record holding one value per aircraft input, with
+    dict-style access (`record["bt"]`, `keys`, `items`, ...) for backward
+    compatibility with the plain dict previously stored in
+    `DirectOperatingCost.aircraft`.
+
+    The concrete record type (one slot per input of the schema) is generated
+    by `InputSchema`; see `INPUT_SCHEMA.record_type`.
+    """
+
+    __slots__ = ()
+
+    # canonical field names, set on the generated subclass
+    _fields: Tuple[str, ...] = ()
+    _field_set: frozenset    = frozenset()
+
+    def __getitem__(self, key:str) -> Any:
+        if key in self._field_set:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key:str, value:Any) -> None:
+        if key not in self._field_set:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key:object) -> bool:
+        return key in self._field_set
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __eq__(self, other:object) -> bool:
+        if isinstance(other, (AircraftRecord, dict)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def __reduce__(self):
+        return (_rebuild_record, (self.values(),))
+
+    def get(self, key:str, default:Any=None) -> Any:
+        return getattr(self, key) if key in self._field_set else default
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._fields
+
+    def values(self) -> tuple:
+        # replaced by a generated, unrolled getter on the concrete record type
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return zip(self._fields, self.values())
+
+    def to_dict(self) -> dict:
+        return dict(self.items())
+
+    def to_array(self):
+        """Float64 vector of the values, in the schema order (see `InputSchema.index`)."""
+        import numpy as np
+
+        return np.array(self.values(), dtype=np.float64)
+
+
+class InputSchema(object):
+
+    def __init__(self, defaults:Mapping[str, float]) -> None:
+        """
+        ### Description
+        Compiled description of the aircraft inputs, built once from a dict
+        of default values (`params.default_dict`): declared and canonical
+        (lowercase) names, defaults, field offsets and the record type used
+        to store normalized inputs.
+
+        - declared_names  Names as declared in the defaults dict (GEMSEO grammar names)
+        - names           Canonical lowercase names
+        - defaults        Default values, in the same order
+        - index           Canonical name -> field offset (also the column of the
+                          packed float64 matrices, see `pack`)
+        """
+        self.declared_names = tuple(defaults)
+        self.names          = tuple(key.lower() for key in defaults)
+        self.defaults       = tuple(defaults.values())
+        self.index          = {name: i for i, name in enumerate(self.names)}
+
+        # every accepted spelling (canonical, declared, upper case) -> canonical name
+        self._lookup = {
+            **{name.upper(): name for name in self.names},
+            **dict(zip(self.declared_names, self.names)),
+            **{name: name for name in self.names},
+        }
+
+        self.record_type = _make_record_type(self.names)
+
+        return None
+
+    def canonical(self, key:str) -> str:
+        name = self._lookup.get(key)
+        if name is None:
+            name = self._lookup.get(key.lower())
+        return name
+
+    def normalize(self, aircraft:Mapping[str, Any], warn_unknown:bool=True) -> AircraftRecord:
+        """
+        ### Description
+        Merge a user aircraft dict (case insensitive keys) into a new record
+        pre-filled with the defaults. Unknown keys are dropped, with a
+        warning unless `warn_unknown` is False. A record is copied as is.
+        """
+        # already normalized: copy the record (it may be updated in place)
+        if type(aircraft) is self.record_type:
+            return self.record_type._from_values(aircraft.values())
+
+        values = list(self.defaults)
+        index  = self.index
+        lookup = self._lookup
+
+        for key, value in aircraft.items():
+            name = lookup.get(key)
+            if name is None:
+                name = lookup.get(key.lower()) if isinstance(key, str) else None
+                if name is None:
+                    if warn_unknown:
+                        warnings.warn(f"Unknown aircraft input '{key}' ignored", stacklevel=4)
+                    continue
+            values[index[name]] = value
+
+        return self.record_type._from_values(values)
+
+    def from_array(self, values:Sequence[float]) -> AircraftRecord:
+        """Record holding the Python floats of a float64 vector in the schema order."""
+        if len(values) != len(self.names):
+            raise ValueError(f"Expected {len(self.names)} values, got {len(values)}")
+        return self.record_type._from_values(values.tolist() if hasattr(values, "tolist") else list(values))
+
+    def pack(self, aircraft:Iterable[Mapping[str, Any]]):
+        """
+        ### Description
+        Store many aircraft as one (n_aircraft, n_inputs) float64 matrix, one
+        row per normalized aircraft and one column per input (offsets given
+        by `index`): about 8 bytes per value instead of a dict or record of
+        Python floats per aircraft.
+        """
+        import numpy as np
+
+        return np.array([self.normalize(item).values() for item in aircraft], dtype=np.float64).reshape(-1, len(self.names))
+
+    def columns(self, matrix) -> AircraftRecord:
+        """Record of column views of a packed matrix, e.g. the input of the batch engine."""
+        return self.record_type._from_values([matrix[:, i] for i in range(len(self.names))])
+
+
+def _make_record_type(names:Tuple[str, ...]) -> type:
+
+    # unrolled accessors: a record is filled/read with one attribute access per field
+    source = "\n".join([
+        "def _from_values(values):",
+        "    record = record_type.__new__(record_type)",
+        *(f"    record.{name} = values[{i}]" for i, name in enumerate(names)),
+        "    return record",
+        "def values(self):",
+        f"    return ({''.join(f'self.{name}, ' for name in names)})",
+    ])
+
+    record_type = type("AircraftRecord", (AircraftRecord,), {"__slots__": names, "_fields": names,
+                                                             "_field_set": frozenset(names), "__module__": __name__})
+    namespace   = {"record_type": record_type}
+    exec(source, namespace)
+
+    record_type._from_values = staticmethod(namespace["_from_values"])
+    record_type.values       = namespace["values"]
+
+    return record_type
+
+
+def _rebuild_record(values:tuple) -> AircraftRecord:
+    return INPUT_SCHEMA.record_type._from_values(values)
+
+
+INPUT_SCHEMA = InputSchema(default_dict)
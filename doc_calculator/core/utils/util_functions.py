@@ -1,11 +1,4 @@
-from .params import default_dict as dt
+from .schema import INPUT_SCHEMA, AircraftRecord
 
-def _assign_input(input:dict) -> dict:
-    default_dict = {k.lower(): v for k, v in dt.items()} 
-    input        = {k.lower(): v for k, v in input.items()} 
-
-    for key, value in default_dict.items():
-        if key in input:
-            default_dict[key] = input[key]
-
-    return default_dict
\ No newline at end of file
+def _assign_input(input:dict) -> AircraftRecord:
+    return INPUT_SCHEMA.normalize(input)
\ No newline at end of file
@@ -0,0 +1,185 @@
+from .DOC_Calculator import DirectOperatingCost
+from .utils.schema import INPUT_SCHEMA
+from typing import Callable, Dict, Iterable, List, Mapping, Tuple, Union
+import numpy as np
+
+# upper bound of the unbounded inputs: the comparisons reject NaN and infinite values
+_INF = np.finfo(np.float64).max
+
+# rows of a packed matrix validated at once
+_BLOCK_SIZE = 65536
+
+# valid closed range [low, high] of every aircraft input; the inputs not listed
+# (noise levels, ieng, the inputs checked by `INPUT_RULES`) only need to be finite
+_FRACTIONS   = ("afspare", "enspare", "rval", "rinsh")
+_CHECKED     = ("ieng", "bt", "util", "lifespan", "dyrs", "l_app", "l_lat", "l_flyov")
+INPUT_RANGES = {
+    name: (0.0, 1.0) if name in _FRACTIONS else (0.0, _INF)
+    for name in INPUT_SCHEMA.names if name not in _CHECKED
+}
+
+# bounds of every column of a packed matrix, and the columns in `INPUT_RANGES`
+_LOW    = np.array([INPUT_RANGES[name][0] if name in INPUT_RANGES else -np.inf for name in INPUT_SCHEMA.names])
+_HIGH   = np.array([INPUT_RANGES[name][1] if name in INPUT_RANGES else np.inf for name in INPUT_SCHEMA.names])
+_RANGED = np.array([name in INPUT_RANGES for name in INPUT_SCHEMA.names])
+
+_OFFSET = DirectOperatingCost.FLIGHT_TIME_OFFSET
+
+# rule id -> (message, failing rows of the input columns): required-when and
+# cross-field rules, whose violation raises or gives meaningless costs
+INPUT_RULES: Dict[str, Tuple[str, Callable]] = {
+    "ieng": ("ieng must be 1 (estimated engine maintenance) or 2 (assigned eoc)",
+             lambda a: (a.ieng != 1.0) & (a.ieng != 2.0)),
+    "shp_required": ("shp > 0 is required when ieng == 1",
+                     lambda a: (a.ieng == 1.0) & ~(a.shp > 0.0)),
+    "eoc_required": ("eoc > 0 is required when ieng == 2",
+                     lambda a: (a.ieng == 2.0) & ~(a.eoc > 0.0)),
+    "bt": (f"bt must exceed the {_OFFSET} h taxi time (flight time bt - {_OFFSET} must be positive)",
+           lambda a: ~(a.bt > _OFFSET)),
+    "util": ("util must be positive", lambda a: ~(a.util > 0.0)),
+    "lifespan": ("lifespan must be positive", lambda a: ~(a.lifespan > 0.0)),
+    "dyrs": ("dyrs must be positive", lambda a: ~(a.dyrs > 0.0)),
+    "noise_levels": ("l_app, l_lat and l_flyov must be finite",
+                     lambda a: ~(np.isfinite(a.l_app) & np.isfinite(a.l_lat) & np.isfinite(a.l_flyov))),
+    "airframe_weight": ("mew must not be lower than the engines weight bengw*en",
+                        lambda a: a.mew < a.bengw*a.en),
+    "rvbat": ("rvbat must not exceed batprice", lambda a: a.rvbat > a.batprice),
+    "rvfc": ("rvfc must not exceed fcprice", lambda a: a.rvfc > a.fcprice),
+    "rvpe": ("rvpe must not exceed peprice", lambda a: a.rvpe > a.peprice),
+}
+
+
+class ValidationReport(object):
+
+    def __init__(self, errors:Dict[str, np.ndarray], messages:Dict[str, str], shape:Tuple[int, ...]) -> None:
+        """
+        ### Description
+        Result of `validate_inputs`:
+
+        - errors    Dict {rule id: boolean array of the failing rows}, holding
+                    only the rules failed by at least one row
+        - messages  Dict {rule id: error message} of the failed rules
+        - shape     Shape of the batch
+        - valid     Boolean array of the rows passing every rule
+        """
+        self.errors   = errors
+        self.messages = messages
+        self.shape    = shape
+
+        valid = np.ones(shape, dtype=bool)
+        for mask in errors.values():
+            valid &= ~mask
+        self.valid = valid
+
+        return None
+
+    @property
+    def n_invalid(self) -> int:
+        return int(self.valid.size - np.count_nonzero(self.valid))
+
+    def __bool__(self) -> bool:
+        return not self.errors
+
+    def __repr__(self) -> str:
+        return f"ValidationReport(shape={self.shape}, invalid={self.n_invalid}, rules={list(self.errors)})"
+
+    def summary(self) -> Dict[str, int]:
+        """Number of failing rows of every failed rule."""
+        return {rule: int(np.count_nonzero(mask)) for rule, mask in self.errors.items()}
+
+    def row_messages(self, index) -> List[str]:
+        """Error messages of one row (an integer, or a tuple for N-D batches)."""
+        return [self.messages[rule] for rule, mask in self.errors.items() if mask[index]]
+
+    def select(self, aircraft:Union[Mapping, np.ndarray]) -> Union[dict, np.ndarray]:
+        """
+        ### Description
+        Valid rows of the validated input, to evaluate them without the
+        invalid ones: rows of a packed matrix, or an aircraft dict whose array
+        values are indexed with the `valid` mask (scalars are kept).
+        """
+        if isinstance(aircraft, np.ndarray):
+            return aircraft[self.valid]
+
+        selected = {}
+        for key, value in aircraft.items():
+            value         = np.asarray(value)
+            selected[key] = np.broadcast_to(value, self.shape)[self.valid] if value.ndim else value
+        return selected
+
+
+def validate_inputs(aircraft:Union[Mapping, np.ndarray, Iterable[Mapping]]) -> ValidationReport:
+    """
+    ### Description
+    Vectorized check of the aircraft inputs of a whole batch against the
+    input schema: every input must be finite and in its `INPUT_RANGES`
+    range, and every row must pass the required-when and cross-field
+    `INPUT_RULES` (e.g. shp given when ieng == 1, bt above the taxi time,
+    positive utilisation). Each rule is evaluated once over the input
+    columns; nothing is evaluated per row.
+
+        report = validate_inputs(aircraft)
+        if not report:
+            print(report.summary())
+        results = BatchDirectOperatingCost(report.select(aircraft)).calculate_all()
+
+    ### Arguments
+    - aircraft  Aircraft dict whose values are scalars or arrays (one entry per design,
+                as taken by `BatchDirectOperatingCost`), packed (n_aircraft, n_inputs)
+                matrix (see `INPUT_SCHEMA.pack`) or list of aircraft dicts
+
+    ### Returns
+    ValidationReport with the error masks of the failed rules.
+    """
+    if isinstance(aircraft, Mapping):
+        # checked on the values as given, a scalar input once for the whole batch
+        values = [np.asarray(value, dtype=np.float64) for value in INPUT_SCHEMA.normalize(aircraft).values()]
+        shape  = np.broadcast_shapes(*(value.shape for value in values))
+        failed = _check(INPUT_SCHEMA.record_type._from_values(values))
+        errors = {rule: np.broadcast_to(mask, shape) for rule, mask in failed.items()}
+    else:
+        matrix = aircraft if isinstance(aircraft, np.ndarray) else INPUT_SCHEMA.pack(aircraft)
+        shape  = matrix.shape[:1]
+        errors = {}
+        # the ranges are checked on the rows of a block at once, the rules on its column views
+        for start in range(0, shape[0], _BLOCK_SIZE):
+            block  = matrix[start:start + _BLOCK_SIZE]
+            failed = _check_rules(INPUT_SCHEMA.columns(block))
+            bad    = ~((block >= _LOW) & (block <= _HIGH))
+            for i in np.flatnonzero(bad.any(axis=0) & _RANGED):
+                failed[INPUT_SCHEMA.names[i]] = bad[:, i]
+            for rule, mask in failed.items():
+                if rule not in errors:
+                    errors[rule] = np.zeros(shape, dtype=bool)
+                errors[rule][start:start + len(mask)] = mask
+
+    return ValidationReport(errors, {rule: _message(rule) for rule in errors}, shape)
+
+
+def _check(inputs) -> Dict[str, np.ndarray]:
+    # failing rows of every failed range and rule, for a record of input columns
+    failed = {}
+    for name, (low, high) in INPUT_RANGES.items():
+        values = getattr(inputs, name)
+        mask   = ~((values >= low) & (values <= high))
+        if mask.any():
+            failed[name] = mask
+
+    return {**failed, **_check_rules(inputs)}
+
+
+def _check_rules(inputs) -> Dict[str, np.ndarray]:
+    failed = {}
+    for rule, (_, check) in INPUT_RULES.items():
+        mask = np.asarray(check(inputs))
+        if mask.any():
+            failed[rule] = mask
+
+    return failed
+
+
+def _message(rule:str) -> str:
+    if rule in INPUT_RULES:
+        return INPUT_RULES[rule][0]
+    low, high = INPUT_RANGES[rule]
+    return f"{rule} must be in [{low:g}, {high:g}]" if high < _INF else f"{rule} must be finite and >= {low:g}"
@@ -1,6 +1,8 @@
 from gemseo.core.discipline.discipline import Discipline
 from ..core import DirectOperatingCost
+from ..core.gradients import calculate_gradients
 from ..core.utils.params import Params
+from ..core.utils.profiling import active_stats
 from .utils.utils_functions import create_default_gemseo_grammar
 import numpy as np
 
@@ -20,10 +22,32 @@ class GemseoDirectOperatingCost(Discipline):
         self.default_input_data = create_default_gemseo_grammar()
 
         # read kwargs params
-        if kwargs:
-            self._params = kwargs["params"]
-        else:
-            self._params = Params()
+        self._params = kwargs.get("params", Params())
+
+        # optional ResultCache shared with other disciplines/calculators
+        self._result_cache = kwargs.get("result_cache")
+
+        # optional TimingStats (see DirectOperatingCost)
+        self._stats = kwargs.get("stats")
+
+    def execute(self, input_data=None):
+
+        stats = self._stats if self._stats is not None else active_stats()
+        if stats is None:
+            return super().execute({} if input_data is None else input_data)
+
+        # own time of the stage: grammar checks and GEMSEO data processing around _run
+        with stats.timer("gemseo.execute"):
+            return super().execute({} if input_data is None else input_data)
+
+    def linearize(self, input_data=None, compute_all_jacobians=False, execute=True):
+
+        stats = self._stats if self._stats is not None else active_stats()
+        if stats is None:
+            return super().linearize({} if input_data is None else input_data, compute_all_jacobians, execute)
+
+        with stats.timer("gemseo.linearize"):
+            return super().linearize({} if input_data is None else input_data, compute_all_jacobians, execute)
 
     def _run(self, input_data):
 
@@ -34,17 +58,15 @@ class GemseoDirectOperatingCost(Discipline):
             aircraft[key] = value[0]
         
         # instance of the DOC class
-        doc_calc_object = DirectOperatingCost(aircraft, params=self._params)
-
-        # DOC [USD/flight]
-        direct_operating_cost = doc_calc_object.calculate_doc()
+        doc_calc_object = DirectOperatingCost(aircraft, params=self._params, result_cache=self._result_cache,
+                                              stats=self._stats)
 
-        # IOC [USD/flight]
-        indirect_operating_cost = doc_calc_object.calculate_ioc()
+        # DOC, IOC and TOC [USD/flight] from a single evaluation of the cost terms
+        operating_cost = doc_calc_object.calculate_all()
 
-        direct_operating_cost_per_flight   = direct_operating_cost["DOC [USD/flight]"]
-        indirect_operating_cost_per_flight = indirect_operating_cost["IOC [USD/flight]"]
-        total_operating_cost_per_flight    = direct_operating_cost_per_flight + indirect_operating_cost_per_flight
+        direct_operating_cost_per_flight   = operating_cost["DOC [USD/flight]"]
+        indirect_operating_cost_per_flight = operating_cost["IOC [USD/flight]"]
+        total_operating_cost_per_flight    = operating_cost["TOC [USD/flight]"]
 
         # write output
         return {
@@ -52,3 +74,42 @@ class GemseoDirectOperatingCost(Discipline):
                 "IOC": np.array([indirect_operating_cost_per_flight]), 
                 "TOC": np.array([total_operating_cost_per_flight])
                 }
+
+    def check_jacobian(self, *args, input_names=(), **kwargs) -> bool:
+
+        # IENG is a discrete flag: never perturb it when approximating the jacobian
+        if not input_names:
+            input_names = [name for name in self.io.input_grammar if name != "IENG"]
+
+        return super().check_jacobian(*args, input_names=input_names, **kwargs)
+
+    def _compute_jacobian(self, input_names=(), output_names=()):
+
+        input_names, output_names = self._init_jacobian(input_names, output_names)
+
+        # create DOC class aircraft dict
+        aircraft = {}
+
+        for key, value in self.io.get_input_data().items():
+            aircraft[key] = value[0]
+
+        # analytic derivatives of the per flight costs (lowercase input keys)
+        gradients = calculate_gradients(DirectOperatingCost(aircraft, params=self._params, stats=self._stats))
+
+        direct_operating_cost_gradient   = gradients["DOC [USD/flight]"]
+        indirect_operating_cost_gradient = gradients["IOC [USD/flight]"]
+        total_operating_cost_gradient    = {
+            key: direct_operating_cost_gradient.get(key, 0.0) + indirect_operating_cost_gradient.get(key, 0.0)
+            for key in {**direct_operating_cost_gradient, **indirect_operating_cost_gradient}
+            }
+
+        output_gradients = {
+                "DOC": direct_operating_cost_gradient,
+                "IOC": indirect_operating_cost_gradient,
+                "TOC": total_operating_cost_gradient
+                }
+
+        # write jacobian
+        for output_name in output_names:
+            for input_name in input_names:
+                self.jac[output_name][input_name][0, 0] = output_gradients[output_name].get(input_name.lower(), 0.0)
@@ -1 +1,18 @@
-from .DOC_Calculator import GemseoDirectOperatingCost
\ No newline at end of file
+# loaded on first access so that the grammar helpers in .utils do not import gemseo
+_LAZY_ATTRIBUTES = {
+    "GemseoDirectOperatingCost": ".DOC_Calculator",
+    "BatchGemseoDirectOperatingCost": ".batch",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name:str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
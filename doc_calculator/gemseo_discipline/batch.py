@@ -0,0 +1,89 @@
+from .DOC_Calculator import GemseoDirectOperatingCost
+from ..core.batch import BatchDirectOperatingCost
+from ..core.gradients import calculate_gradients
+from scipy.sparse import csr_array, diags_array
+import numpy as np
+
+
+class BatchGemseoDirectOperatingCost(GemseoDirectOperatingCost):
+
+    def __init__(self, name="Batch_DOC_Calculator", **kwargs):
+        """
+        ### Description
+        Vectorized GEMSEO discipline: every input is an array of length N (one
+        entry per design) or of length 1 (shared by all the designs), and the
+        DOC, IOC and TOC [USD/flight] outputs are arrays of length N, all
+        evaluated at once with the batch engine.
+
+        Each design only depends on its own inputs, so the Jacobian of an
+        output with respect to a length-N input is a sparse diagonal matrix
+        (a dense column for a shared length-1 input).
+
+        Accepts the `params`, `result_cache` and `stats` keywords of
+        `GemseoDirectOperatingCost` (the result cache is not used by the
+        batch engine).
+        """
+        super().__init__(name, **kwargs)
+
+    def _run(self, input_data):
+
+        # vectorized DOC class instance on the input arrays
+        doc_calc_object = BatchDirectOperatingCost(dict(input_data), params=self._params, stats=self._stats)
+        size            = _batch_size(doc_calc_object)
+
+        # DOC, IOC and TOC [USD/flight] from a single evaluation of the cost terms
+        operating_cost = doc_calc_object.calculate_all()
+
+        # write output
+        return {
+                "DOC": np.broadcast_to(operating_cost["DOC [USD/flight]"], (size,)).copy(),
+                "IOC": np.broadcast_to(operating_cost["IOC [USD/flight]"], (size,)).copy(),
+                "TOC": np.broadcast_to(operating_cost["TOC [USD/flight]"], (size,)).copy()
+                }
+
+    def _compute_jacobian(self, input_names=(), output_names=()):
+
+        input_names, output_names = self._init_jacobian(input_names, output_names,
+                                                        init_type=self.InitJacobianType.SPARSE)
+
+        input_data      = self.io.get_input_data()
+        doc_calc_object = BatchDirectOperatingCost(dict(input_data), params=self._params, stats=self._stats)
+        size            = _batch_size(doc_calc_object)
+
+        # analytic derivatives of the per flight costs, one entry per design
+        gradients = calculate_gradients(doc_calc_object)
+
+        direct_operating_cost_gradient   = gradients["DOC [USD/flight]"]
+        indirect_operating_cost_gradient = gradients["IOC [USD/flight]"]
+        total_operating_cost_gradient    = {
+            key: direct_operating_cost_gradient.get(key, 0.0) + indirect_operating_cost_gradient.get(key, 0.0)
+            for key in {**direct_operating_cost_gradient, **indirect_operating_cost_gradient}
+            }
+
+        output_gradients = {
+                "DOC": direct_operating_cost_gradient,
+                "IOC": indirect_operating_cost_gradient,
+                "TOC": total_operating_cost_gradient
+                }
+
+        # write jacobian
+        for output_name in output_names:
+            for input_name in input_names:
+                derivative = np.broadcast_to(output_gradients[output_name].get(input_name.lower(), 0.0), (size,))
+                self.jac[output_name][input_name] = _jacobian_block(derivative, np.size(input_data[input_name]))
+
+
+def _batch_size(doc_calc_object:BatchDirectOperatingCost) -> int:
+    shape = doc_calc_object.shape
+    if len(shape) > 1:
+        raise ValueError(f"Batch inputs must be 1D arrays, got shape {shape}")
+    return shape[0] if shape else 1
+
+
+def _jacobian_block(derivative:np.ndarray, input_size:int) -> csr_array:
+    # design i only depends on entry i of a per-design input ...
+    if input_size == len(derivative):
+        return csr_array(diags_array(derivative))
+
+    # ... and on the single entry of an input shared by all the designs
+    return csr_array(derivative.reshape(-1, 1))
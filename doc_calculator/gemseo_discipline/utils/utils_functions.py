@@ -1,10 +1,10 @@
-from doc_calculator.core.utils.params import default_dict
+from doc_calculator.core.utils.schema import INPUT_SCHEMA
 import numpy as np
 
 def create_default_gemseo_grammar() -> dict:
     default_grammar_dict = {}
 
-    for key, value in default_dict.items():
+    for key, value in zip(INPUT_SCHEMA.declared_names, INPUT_SCHEMA.defaults):
         default_grammar_dict[key] = np.array([value])
 
     return default_grammar_dict
@@ -4,6 +4,6 @@ from setuptools import setup, find_packages
 setup(
     name="doc_calculator",
     version="0.4.0",
-    packages=find_packages(),
+    packages=find_packages(exclude=("benchmarks*", "test*")),
     install_requires = ["gemseo"]
 )
\ No newline at end of file
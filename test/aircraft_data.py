@@ -0,0 +1,113 @@
+"""Aircraft input dicts shared by the test fixtures and the benchmark suite."""
+
+# Data for regional turboprop
+ATR_72 = {
+    "ADP": 22.0,
+    "MTOW": 23.0,
+    "PLD": 7.25,
+    "MEW": 13.20,
+    "BENGW": 0.775,
+    "ENPRI": 1.305,
+    "EN": 2.0,
+    "CREWTECH": 2.0,
+    "CREWC": 3.0,
+    "BT": 1.05,
+    "BF": 1140.0,
+    "SECTOR": 200.0,
+    "IENG": 1,
+    "SHP": 2475.0,
+    "AFSPARE": 0.1,
+    "ENSPARE": 0.3,
+    "DYRS": 20.0,
+    "RVAL": 0.1,
+    "RINSH": 0.01,
+    "CRTECHR": 70.85,
+    "CRCABHR": 63.15,
+    "LABOR_RATE": 84.5,
+    "FUELPRI": 2.045,
+    "IOC_FACT": 0.65,
+    "UTIL": 2100.0,
+    "LIFESPAN": 20.0,
+    "L_APP": 0.0,
+    "L_LAT": 0.0,
+    "L_FLYOV": 0.0,
+    "CNOX": 3.7,
+    "NOX_VALUE":0.0,
+    "CCO": 3.7,
+    "CO_VALUE": 0.0,
+    "PRICO2": 0.0215,
+    "CO2_VALUE": 1875.0, 
+}
+
+# Data for the medium haul jet of the README, with a hybrid-electric powertrain
+README_AIRCRAFT = {
+    "adp": 85,
+    "mtow": 70,
+    "pld": 18,
+    "mew": 40,
+    "bengw": 1.2,
+    "enpri": 6.5,
+    "en": 2,
+    "crewtech": 2,
+    "crewc": 4,
+    "bt": 1.5,
+    "bf": 2500,
+    "sector": 600,
+    "ieng": 1,
+    "shp": 25000,
+    "eoc": 0.0,
+    "afspare": 0.1,
+    "enspare": 0.3,
+    "dyrs": 15,
+    "rval": 0.15,
+    "rinsh": 0.005,
+    "crtechr": 200,
+    "crcabhr": 50,
+    "labor_rate": 90,
+    "fuelpri": 1.8,
+    "ioc_fact": 0.65,
+    "util": 2800,
+    "lifespan": 20,
+    "l_app": 95.0,
+    "l_lat": 94.0,
+    "l_flyov": 96.0,
+    "cnox": 5,
+    "nox_value": 200,
+    "cco": 4,
+    "co_value": 150,
+    "co2_value": 10000,
+    "prico2": 0.02,
+    "n_bat": 2,
+    "n_repbat": 3,
+    "batprice": 250000.0,
+    "rvbat": 20000.0,
+    "lrbat": 60.0,
+    "tlbat": 2.0,
+    "f_bat": 0.01,
+    "n_fc": 1,
+    "n_repfc": 2,
+    "fcprice": 400000.0,
+    "rvfc": 30000.0,
+    "lrfc": 60.0,
+    "tlfc": 3.0,
+    "f_fc": 0.01,
+    "n_reppe": 1,
+    "peprice": 150000.0,
+    "rvpe": 10000.0,
+    "lrpe": 60.0,
+    "tlpe": 1.5,
+    "f_pe": 0.01,
+    "n_em": 2,
+    "emprice": 300000.0,
+    "lrem": 60.0,
+    "speml": 2000.0,
+    "spemb": 19000.0,
+    "tleml": 4.0,
+    "tlemb": 40.0,
+    "f_eml": 2.0,
+    "f_emb": 0.0005,
+    "enerpri": 0.25,
+    "ener_req": 800.0,
+    "h2_pri": 6.0,
+    "h2_req": 50.0,
+}
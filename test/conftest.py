@@ -0,0 +1,15 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from aircraft_data import ATR_72, README_AIRCRAFT
+import pytest
+
+
+@pytest.fixture
+def atr_72() -> dict:
+    return dict(ATR_72)
+
+
+@pytest.fixture
+def readme_aircraft() -> dict:
+    return dict(README_AIRCRAFT)
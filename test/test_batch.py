@@ -0,0 +1,69 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost
+from doc_calculator.core.batch import BatchDirectOperatingCost
+from doc_calculator.core.utils.params import Params
+import numpy as np
+import pytest
+
+POWER_DEPENDENT = {"NOISE CHARGES [USD/BHR]", "DOC [USD/BHR]", "DOC [USD/flight]", "IOC [USD/BHR]", "IOC [USD/flight]"}
+
+
+def perturbed_designs(aircraft:dict, n:int, seed:int=0) -> dict:
+    rng = np.random.default_rng(seed)
+    return {key: value*rng.uniform(0.8, 1.2, n) if key.lower() != "ieng" else np.full(n, value)
+            for key, value in aircraft.items()}
+
+
+@pytest.mark.parametrize("fixture", ["atr_72", "readme_aircraft"])
+def test_batch_matches_scalar_exactly(fixture, request):
+    aircraft = request.getfixturevalue(fixture)
+    designs  = perturbed_designs(aircraft, 200)
+    params   = Params()
+
+    batch = DirectOperatingCost.from_arrays(designs, params=params)
+    assert isinstance(batch, BatchDirectOperatingCost)
+
+    doc = batch.calculate_doc()
+    ioc = batch.calculate_ioc()
+
+    # np.power may differ from libm pow() in the last ulp: the noise charges (10**x terms)
+    # and the totals summing them match to 1e-15, every other line bit by bit
+    for i in range(200):
+        scalar = DirectOperatingCost({key: value[i] for key, value in designs.items()}, params=params)
+        for results, expected in ((doc, scalar.calculate_doc()), (ioc, scalar.calculate_ioc())):
+            for key, value in expected.items():
+                if key in POWER_DEPENDENT:
+                    assert results[key][i] == pytest.approx(value, rel=1.0e-15, abs=0.0), key
+                else:
+                    assert results[key][i] == value, key
+
+
+def test_batch_engine_flag_is_masked_select(readme_aircraft):
+    designs = perturbed_designs(readme_aircraft, 10)
+    designs["ieng"] = np.array([1, 2]*5)
+    designs["eoc"]  = np.linspace(100.0, 200.0, 10)
+
+    doc = DirectOperatingCost.from_arrays(designs).calculate_doc()
+
+    for i in range(10):
+        scalar = DirectOperatingCost({key: value[i] for key, value in designs.items()})
+        assert doc["THERM. ENG. MAINTENANCE [USD/BH]"][i] == scalar.calculate_doc()["THERM. ENG. MAINTENANCE [USD/BH]"]
+
+
+def test_batch_invalid_engine_flag(atr_72):
+    atr_72["IENG"] = np.array([1, 3])
+
+    with pytest.raises(ValueError):
+        DirectOperatingCost.from_arrays(atr_72).calculate_doc()
+
+
+def test_batch_broadcasts_scalars(atr_72):
+    atr_72["FUELPRI"] = np.array([1.5, 2.0, 2.5])
+
+    doc = DirectOperatingCost.from_arrays(atr_72).calculate_doc()
+
+    assert doc["DOC [USD/flight]"].shape == (3,)
+    assert doc["COCKPIT CREW [USD/BHR]"].shape == (3,)
+    assert np.all(np.diff(doc["DOC [USD/flight]"]) > 0)
@@ -0,0 +1,60 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import BatchGemseoDirectOperatingCost, GemseoDirectOperatingCost
+from scipy.sparse import issparse
+import numpy as np
+import pytest
+
+N = 6
+
+
+def batch_input(aircraft:dict) -> dict:
+    # grammar (upper case) names, length-1 arrays shared by all the designs
+    data = {key.upper(): np.array([float(value)]) for key, value in aircraft.items()}
+    data["FUELPRI"] = np.linspace(1.5, 2.5, N)
+    data["BT"]      = np.linspace(1.0, 3.0, N)
+    data["UTIL"]    = np.linspace(2000.0, 3200.0, N)
+    return data
+
+
+@pytest.mark.parametrize("aircraft", ["atr_72", "readme_aircraft"])
+def test_batch_outputs_match_single_design_executions(aircraft, request):
+    data = batch_input(request.getfixturevalue(aircraft))
+
+    outputs = BatchGemseoDirectOperatingCost().execute(data)
+
+    discipline = GemseoDirectOperatingCost()
+    for i in range(N):
+        single = discipline.execute({key: value[i:i + 1] if value.size == N else value for key, value in data.items()})
+        for name in ("DOC", "IOC", "TOC"):
+            assert outputs[name].shape == (N,)
+            assert outputs[name][i] == single[name][0]
+
+
+def test_sparse_diagonal_jacobian(readme_aircraft):
+    data       = batch_input(readme_aircraft)
+    discipline = BatchGemseoDirectOperatingCost()
+
+    jacobian = discipline.linearize(data, compute_all_jacobians=True)
+
+    # per-design input: diagonal block; shared input: one dense column
+    fuel_price = jacobian["DOC"]["FUELPRI"]
+    assert issparse(fuel_price) and fuel_price.shape == (N, N)
+    assert fuel_price.nnz == N
+    single = GemseoDirectOperatingCost()
+    for i in range(N):
+        design = {key: value[i:i + 1] if value.size == N else value for key, value in data.items()}
+        assert fuel_price.diagonal()[i] == pytest.approx(single.linearize(design, compute_all_jacobians=True)["DOC"]["FUELPRI"][0, 0],
+                                                         rel=1e-12)
+    assert jacobian["TOC"]["ADP"].shape == (N, 1)
+
+    assert discipline.check_jacobian(data, threshold=1e-4, derr_approx="centered_differences", step=1e-6)
+
+
+def test_inconsistent_batch_sizes(readme_aircraft):
+    data       = batch_input(readme_aircraft)
+    data["BF"] = np.ones(N + 1)
+
+    with pytest.raises(ValueError):
+        BatchGemseoDirectOperatingCost().execute(data)
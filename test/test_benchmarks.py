@@ -0,0 +1,66 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from benchmarks.run_benchmarks import AIRCRAFT, compare, gemseo_input_data, main, run
+from doc_calculator import DirectOperatingCost, GemseoDirectOperatingCost
+import json
+import pytest
+
+
+def report(**seconds) -> dict:
+    return {"metadata": {}, "results": {name.replace("_", "."): {"seconds": value, "unit": "s/call"}
+                                        for name, value in seconds.items()}}
+
+
+def test_quick_run_reports_every_group():
+    result = run(["core", "construction", "throughput"], sizes=[10], repeat=1, min_time=0.001)
+
+    assert "python" in result["metadata"]
+    assert "core.calculate_doc.atr_72" in result["results"]
+    assert "construction.assign_input.readme" in result["results"]
+    assert result["results"]["throughput.batch.10"]["designs_per_second"] > 0.0
+    assert all(entry["seconds"] > 0.0 for entry in result["results"].values())
+
+
+def test_gemseo_group_prices_the_benchmark_aircraft():
+    result = run(["gemseo"], repeat=1, min_time=0.001)
+
+    assert "gemseo.overhead.atr_72" in result["results"]
+    assert "gemseo.execute.readme" in result["results"]
+
+    for aircraft in AIRCRAFT.values():
+        discipline = GemseoDirectOperatingCost()
+        outputs    = discipline.execute(gemseo_input_data(discipline, aircraft))
+        expected   = DirectOperatingCost(aircraft).calculate_all()
+        for name in ("DOC", "IOC", "TOC"):
+            assert outputs[name][0] == pytest.approx(expected[f"{name} [USD/flight]"], rel=1e-12)
+
+
+def test_compare_flags_regressions_only_beyond_tolerance():
+    baseline = report(core_a=1.0, core_b=1.0, core_removed=1.0)
+    current  = report(core_a=1.1, core_b=1.5, core_added=1.0)
+
+    comparison = compare(current, baseline, tolerance=0.2)
+
+    assert set(comparison) == {"core.a", "core.b"}
+    assert not comparison["core.a"]["regression"]
+    assert comparison["core.b"]["regression"]
+    assert comparison["core.b"]["ratio"] == 1.5
+
+
+def test_main_writes_json_and_returns_regression_status(tmp_path):
+    baseline_path = str(tmp_path/"baseline.json")
+    output_path   = str(tmp_path/"current.json")
+    arguments     = ["--groups", "construction", "--repeat", "1", "--min-time", "0.001"]
+
+    assert main([*arguments, "--output", baseline_path]) == 0
+    with open(baseline_path) as file:
+        baseline = json.load(file)
+
+    # a baseline 1000 times faster must be reported as a regression
+    for entry in baseline["results"].values():
+        entry["seconds"] /= 1000.0
+    with open(baseline_path, "w") as file:
+        json.dump(baseline, file)
+
+    assert main([*arguments, "--output", output_path, "--compare", baseline_path]) == 1
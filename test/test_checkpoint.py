@@ -0,0 +1,94 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator.core.checkpoint import CampaignStore, run_resumable_campaign
+from doc_calculator.core.parallel import evaluate_samples, run_campaign
+import numpy as np
+import pytest
+
+NAMES = ["fuelpri", "util", "batprice", "Params.INTEREST_RATE"]
+
+# chunk evaluations of `interrupted_evaluation`, which fails after `CRASH_AFTER` chunks
+CALLS       = []
+CRASH_AFTER = [None]
+
+
+def interrupted_evaluation(aircraft, samples, names, params):
+    if CRASH_AFTER[0] is not None and len(CALLS) >= CRASH_AFTER[0]:
+        raise KeyboardInterrupt
+    CALLS.append(len(samples))
+    return evaluate_samples(aircraft, samples, names, params)
+
+
+def sample_matrix(n:int, seed:int=0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return np.column_stack([rng.uniform(1.5, 2.5, n), rng.uniform(2000.0, 3200.0, n),
+                            rng.uniform(1.5e5, 3.5e5, n), rng.uniform(0.03, 0.07, n)])
+
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_campaign_matches_run_campaign(readme_aircraft, tmp_path, n_workers):
+    samples = sample_matrix(1003)
+
+    store = run_resumable_campaign(readme_aircraft, samples, NAMES, str(tmp_path / "doe"), chunk_size=100,
+                                   n_workers=n_workers)
+
+    reference = run_campaign(readme_aircraft, samples, NAMES, n_workers=1)
+    assert store.complete and store.progress == (11, 11)
+    assert store.shape == (1003, 3)
+    np.testing.assert_array_equal(store[:], reference)
+    np.testing.assert_array_equal(store[95:305], reference[95:305])
+    np.testing.assert_array_equal(store[-1], reference[-1])
+    np.testing.assert_array_equal(store.column("TOC [USD/flight]"), reference[:, 2])
+
+    merged = store.consolidate(str(tmp_path / "doe.npy"))
+    assert isinstance(merged, np.memmap)
+    np.testing.assert_array_equal(merged, reference)
+
+
+def test_campaign_resumes_after_a_crash(readme_aircraft, tmp_path):
+    samples   = sample_matrix(1000)
+    directory = str(tmp_path / "doe")
+    CALLS.clear()
+
+    # killed during the 4th chunk, with a partially written file left behind
+    CRASH_AFTER[0] = 3
+    with pytest.raises(KeyboardInterrupt):
+        run_resumable_campaign(readme_aircraft, samples, NAMES, directory, chunk_size=100,
+                               evaluate=interrupted_evaluation)
+    open(os.path.join(directory, "chunk_000003.npy.tmp"), "wb").close()
+
+    store = CampaignStore(directory)
+    assert store.progress == (3, 10) and not store.complete
+    np.testing.assert_array_equal(store[:300], run_campaign(readme_aircraft, samples[:300], NAMES, n_workers=1))
+    with pytest.raises(KeyError):
+        store[250:350]
+    with pytest.raises(ValueError):
+        store.column("DOC [USD/flight]")
+
+    # the restart only evaluates the 7 missing chunks
+    CRASH_AFTER[0] = None
+    store = run_resumable_campaign(readme_aircraft, samples, NAMES, directory, chunk_size=100,
+                                   evaluate=interrupted_evaluation)
+    assert len(CALLS) == 10
+    assert store.complete
+    assert not any(name.endswith(".tmp") for name in os.listdir(directory))
+    np.testing.assert_array_equal(store[:], run_campaign(readme_aircraft, samples, NAMES, n_workers=1))
+
+
+def test_campaign_settings_and_samples_checked(readme_aircraft, tmp_path):
+    samples   = sample_matrix(300)
+    directory = str(tmp_path / "doe")
+    run_resumable_campaign(readme_aircraft, samples, NAMES, directory, chunk_size=100)
+
+    with pytest.raises(ValueError, match="other settings"):
+        run_resumable_campaign(readme_aircraft, samples, NAMES, directory, chunk_size=50)
+
+    # same samples and settings, other base aircraft: the stored chunks must not be reused
+    with pytest.raises(ValueError, match="other settings"):
+        run_resumable_campaign({**readme_aircraft, "bf": 2600.0}, samples, NAMES, directory, chunk_size=100)
+
+    changed = samples.copy()
+    changed[150, 0] += 0.1
+    with pytest.raises(ValueError, match="chunk 1"):
+        run_resumable_campaign(readme_aircraft, changed, NAMES, directory, chunk_size=100)
@@ -0,0 +1,68 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost
+from doc_calculator.core.utils.result import CostResult
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def designs(readme_aircraft):
+    return {**readme_aircraft, "bf": np.linspace(2000.0, 3000.0, 7), "ieng": np.array([1, 2, 1, 2, 1, 2, 1])}
+
+
+def test_matches_calculate_all(atr_72, designs):
+    for aircraft in (atr_72, designs):
+        calculator = DirectOperatingCost.from_arrays(aircraft)
+        expected   = calculator.calculate_all()
+
+        result = calculator.calculate_result()
+
+        assert list(result.as_dict()) == list(expected)
+        for (field, label), value in zip(result.LABELS.items(), expected.values()):
+            assert np.array_equal(result[field], np.broadcast_to(value, result.shape))
+            assert np.array_equal(result[label], getattr(result, field))
+
+    scalar = DirectOperatingCost(atr_72)
+    assert scalar.calculate_result().as_dict() == scalar.calculate_all()
+
+
+def test_views_and_metadata(designs):
+    result = DirectOperatingCost.from_arrays(designs).calculate_result()
+
+    assert result.shape == (7,)
+    assert result.UNITS["doc_flight"] == "USD/flight"
+    assert result.UNITS["thermal_engine_maintenance"] == "USD/BHR"
+    assert all(np.shares_memory(value, result.values) for value in result.as_dict().values())
+    assert CostResult.from_dict(result.as_dict()).values.tolist() == result.values.tolist()
+
+
+def test_zero_copy_exports(designs):
+    pandas  = pytest.importorskip("pandas")
+    pyarrow = pytest.importorskip("pyarrow")
+    result  = DirectOperatingCost.from_arrays(designs).calculate_result()
+
+    frame = result.to_pandas()
+    assert isinstance(frame, pandas.DataFrame)
+    assert list(frame.columns) == list(result.FIELDS)
+    assert np.shares_memory(frame["fuel"].to_numpy(), result.values)
+
+    table = result.to_arrow()
+    assert table.schema.field("doc_flight").metadata[b"unit"] == b"USD/flight"
+    assert np.shares_memory(table.column("fuel").chunk(0).to_numpy(), result.values)
+    assert table.column("doc_flight").to_pylist() == result.doc_flight.tolist()
+
+
+def test_batch_dicts_are_views_of_the_memoized_block(designs):
+    calculator = DirectOperatingCost.from_arrays(designs)
+    result     = calculator.calculate_result()
+
+    assert calculator.calculate_result() is result
+    for values in (calculator.calculate_doc(), calculator.calculate_ioc(), calculator.calculate_all()):
+        assert all(np.shares_memory(value, result.values) for value in values.values())
+
+    calculator.update(fuelpri=2.5)
+    assert calculator.calculate_result() is not result
+    assert np.array_equal(calculator.calculate_all()["FUEL [USD/BHR]"],
+                          DirectOperatingCost.from_arrays({**designs, "fuelpri": 2.5}).calculate_all()["FUEL [USD/BHR]"])
@@ -0,0 +1,64 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost
+from doc_calculator.core.utils.params import Params
+import numpy as np
+
+
+def count_calls(doc_calc_object:DirectOperatingCost, name:str) -> list:
+    calls  = []
+    method = getattr(doc_calc_object, name)
+
+    def counted(*args, **kwargs):
+        calls.append(1)
+        return method(*args, **kwargs)
+
+    setattr(doc_calc_object, name, counted)
+    return calls
+
+
+def test_doc_and_ioc_share_one_evaluation(atr_72):
+    doc_calc_object = DirectOperatingCost(atr_72)
+    operating  = count_calls(doc_calc_object, "_calculate_cash_operating_cost")
+    investment = count_calls(doc_calc_object, "_calculate_investment")
+
+    doc_calc_object.calculate_doc()
+    doc_calc_object.calculate_ioc()
+    doc_calc_object.calculate_all()
+
+    assert len(operating) == 1
+    assert len(investment) == 1
+
+
+def test_cache_invalidated_by_aircraft_and_params(atr_72):
+    params = Params()
+    doc_calc_object = DirectOperatingCost(atr_72, params=params)
+    reference = doc_calc_object.calculate_all()
+
+    doc_calc_object.aircraft["fuelpri"] = 2.5
+    assert doc_calc_object.calculate_doc()["FUEL [USD/BHR]"] == DirectOperatingCost({**atr_72, "FUELPRI": 2.5}).calculate_doc()["FUEL [USD/BHR]"]
+
+    params.INTEREST_RATE = 0.08
+    assert doc_calc_object.calculate_doc()["INTEREST [USD/BHR]"] > reference["INTEREST [USD/BHR]"]
+
+    doc_calc_object._params = Params(ENR=80.0)
+    assert doc_calc_object.calculate_doc()["NAVIGATION CHARGES [USD/BHR]"] > reference["NAVIGATION CHARGES [USD/BHR]"]
+
+
+def test_calculate_all(readme_aircraft):
+    doc_calc_object = DirectOperatingCost(readme_aircraft)
+    result = doc_calc_object.calculate_all()
+
+    assert result["DOC [USD/flight]"] == doc_calc_object.calculate_doc()["DOC [USD/flight]"]
+    assert result["IOC [USD/flight]"] == doc_calc_object.calculate_ioc()["IOC [USD/flight]"]
+    assert result["TOC [USD/flight]"] == result["DOC [USD/flight]"] + result["IOC [USD/flight]"]
+
+
+def test_batch_cache_invalidated_by_new_arrays(atr_72):
+    batch = DirectOperatingCost.from_arrays({**atr_72, "BT": np.array([1.0, 1.5])})
+    before = batch.calculate_doc()["DOC [USD/flight]"]
+
+    batch.aircraft["bt"] = np.array([2.0, 2.5])
+
+    assert np.all(batch.calculate_doc()["DOC [USD/flight]"] > before)
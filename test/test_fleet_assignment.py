@@ -0,0 +1,90 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost
+from doc_calculator.core.fleet import assign_fleet, cost_matrix
+from doc_calculator.core.mission import MissionTable
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def fleet(atr_72, readme_aircraft):
+    return {"ATR 72": atr_72, "hybrid": readme_aircraft}
+
+
+@pytest.fixture
+def routes():
+    sector = np.array([150.0, 250.0, 400.0, 600.0])
+    return {"route": ["A", "B", "C", "D"], "sector": sector, "bt": 0.5 + sector/300.0, "bf": 200.0 + 1.5*sector}
+
+
+def test_cost_matrix(fleet, routes):
+    results, feasible = cost_matrix(fleet, routes)
+
+    assert results["DOC [USD/flight]"].shape == (2, 4)
+    assert feasible.all()
+    expected = DirectOperatingCost({**fleet["hybrid"], "sector": 400.0, "bt": routes["bt"][2], "bf": routes["bf"][2]}).calculate_all()
+    assert results["DOC [USD/flight]"][1, 2] == pytest.approx(expected["DOC [USD/flight]"], rel=1e-12)
+    assert np.all(results["BT [h]"] == routes["bt"])
+
+
+def test_scalar_route_columns(fleet, routes):
+    results, _ = cost_matrix(fleet, {**routes, "co2_value": 3000.0})
+
+    assert results["DOC [USD/flight]"].shape == (2, 4)
+    expected = DirectOperatingCost({**fleet["ATR 72"], "sector": 250.0, "bt": routes["bt"][1], "bf": routes["bf"][1],
+                                    "co2_value": 3000.0}).calculate_all()
+    assert results["DOC [USD/flight]"][0, 1] == pytest.approx(expected["DOC [USD/flight]"], rel=1e-12)
+
+    # only scalar columns: a single route
+    single, _ = cost_matrix(fleet, {"sector": 250.0, "bt": routes["bt"][1], "bf": routes["bf"][1], "co2_value": 3000.0})
+    assert single["DOC [USD/flight]"].shape == (2, 1)
+    assert single["DOC [USD/flight]"][:, 0] == pytest.approx(results["DOC [USD/flight]"][:, 1], rel=1e-12)
+
+
+def test_cheapest_type_without_capacity_limits(fleet, routes):
+    results, _ = cost_matrix(fleet, routes)
+    cheapest   = np.argmin(results["DOC [USD/flight]"], axis=0)
+
+    for method in ("lp", "greedy"):
+        plan = assign_fleet(fleet, routes, frequency=14, available_hours={"ATR 72": 1e6, "hybrid": 1e6}, method=method)
+        assert plan.route_types.tolist() == cheapest.tolist()
+        assert plan.flights.sum(axis=0) == pytest.approx(14.0)
+        assert plan.total_cost == pytest.approx(14.0*results["DOC [USD/flight]"].min(axis=0).sum())
+
+
+def test_capacity_constraints_and_breakdown(fleet, routes):
+    results, _ = cost_matrix(fleet, routes)
+    hours      = {"ATR 72": 20.0, "hybrid": 20.0}
+
+    lp     = assign_fleet(fleet, routes, frequency=[10, 5, 5, 4], available_hours=hours, method="lp")
+    greedy = assign_fleet(fleet, routes, frequency=[10, 5, 5, 4], available_hours=hours, method="greedy")
+
+    for plan in (lp, greedy):
+        assert plan.flights.sum(axis=0) == pytest.approx([10, 5, 5, 4])
+        assert np.all((plan.flights*results["BT [h]"]).sum(axis=1) <= 20.0 + 1e-9)
+    assert lp.total_cost <= greedy.total_cost + 1e-6
+
+    breakdown = lp.breakdown()
+    assert sum(values["DOC [USD]"] for values in breakdown.values()) == pytest.approx(lp.total_cost, rel=1e-10)
+    assert sum(values["flights"] for values in breakdown.values()) == pytest.approx(24.0)
+    assert "FUEL [USD]" in breakdown["hybrid"]
+    assert "total" in lp.report()
+
+    with pytest.raises(ValueError):
+        assign_fleet(fleet, routes, frequency=100, available_hours=hours, method="lp")
+    with pytest.raises(ValueError):
+        assign_fleet(fleet, routes, frequency=100, available_hours=hours, method="greedy")
+
+
+def test_mission_tables_limit_the_range(fleet, routes):
+    grid     = np.array([100.0, 300.0, 500.0])
+    missions = {"ATR 72": MissionTable(sector=grid, bt=0.4 + grid/280.0, bf=150.0 + 1.4*grid)}
+
+    results, feasible = cost_matrix(fleet, routes, missions=missions)
+    plan = assign_fleet(fleet, routes, frequency=7, available_hours={"ATR 72": 1e6, "hybrid": 1e6}, missions=missions)
+
+    assert feasible.tolist() == [[True, True, True, False], [True, True, True, True]]
+    assert results["BT [h]"][0, 1] == pytest.approx(0.4 + 250.0/280.0)
+    assert plan.flights[0, 3] == 0.0
@@ -0,0 +1,37 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost
+from doc_calculator.core.fused import fused_evaluator
+from doc_calculator.core.utils.params import Params
+from doc_calculator.core.utils.schema import INPUT_SCHEMA
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("params", [Params(), Params(ENR=80.0, INTEREST_RATE=0.07, AEC=0.5, TA=85.0)])
+def test_matches_the_calculator_methods(atr_72, readme_aircraft, params):
+    evaluate = fused_evaluator(params)
+    rng      = np.random.default_rng(0)
+
+    designs = [atr_72, readme_aircraft]
+    for _ in range(50):
+        design = dict(zip(INPUT_SCHEMA.names, rng.uniform(0.5, 2.0, len(INPUT_SCHEMA.names))*INPUT_SCHEMA.normalize(readme_aircraft).to_array()))
+        designs.append({**design, "ieng": float(rng.integers(1, 3)), "bt": rng.uniform(0.5, 3.0)})
+
+    for design in designs:
+        expected = DirectOperatingCost(design, params=params).calculate_all()
+        values   = evaluate(*INPUT_SCHEMA.normalize(design).values())
+        assert evaluate.labels == tuple(expected)
+        assert values == tuple(expected.values())
+
+
+def test_cached_per_params(readme_aircraft):
+    assert fused_evaluator(Params()) is fused_evaluator(Params())
+    assert fused_evaluator(Params(ENR=70.0)) is not fused_evaluator(Params())
+    assert "68.5" in fused_evaluator().source
+
+
+def test_invalid_ieng(readme_aircraft):
+    with pytest.raises(ValueError):
+        fused_evaluator()(*INPUT_SCHEMA.normalize({**readme_aircraft, "ieng": 3}).values())
@@ -0,0 +1,70 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost, GemseoDirectOperatingCost
+from doc_calculator.core.gradients import approximate_gradients, calculate_gradients
+import numpy as np
+import pytest
+
+
+def assert_gradients_close(analytic:dict, approximate:dict, rtol:float=1.0e-5) -> None:
+    for label, gradient in approximate.items():
+        for key, value in gradient.items():
+            expected = analytic[label].get(key, 0.0)
+            assert abs(expected - value) <= rtol*max(abs(value), abs(expected), 1.0e-3), (label, key)
+
+
+@pytest.mark.parametrize("fixture", ["atr_72", "readme_aircraft"])
+def test_gradients_match_finite_differences(fixture, request):
+    doc_calc_object = DirectOperatingCost(request.getfixturevalue(fixture))
+
+    assert_gradients_close(calculate_gradients(doc_calc_object), approximate_gradients(doc_calc_object))
+
+
+def test_gradients_assigned_engine_maintenance(readme_aircraft):
+    readme_aircraft.update(ieng=2, eoc=150.0)
+    doc_calc_object = DirectOperatingCost(readme_aircraft)
+
+    gradients = calculate_gradients(doc_calc_object)
+
+    assert gradients["THERM. ENG. MAINTENANCE [USD/BH]"] == {"eoc": 2, "en": 150.0}
+    assert_gradients_close(gradients, approximate_gradients(doc_calc_object))
+
+
+def test_batch_gradients_match_scalar(readme_aircraft):
+    designs = {**readme_aircraft, "mtow": np.array([60.0, 70.0, 80.0]), "ieng": np.array([1, 2, 1])}
+
+    batch = calculate_gradients(DirectOperatingCost.from_arrays(designs))
+
+    for i in range(3):
+        scalar = calculate_gradients(DirectOperatingCost({**designs, "mtow": designs["mtow"][i], "ieng": designs["ieng"][i]}))
+        for key in ("mtow", "bt", "en", "shp", "eoc"):
+            assert batch["DOC [USD/flight]"][key][i] == pytest.approx(scalar["DOC [USD/flight]"].get(key, 0.0), rel=1.0e-12)
+
+
+def test_discipline_jacobian(readme_aircraft):
+    discipline = GemseoDirectOperatingCost()
+    input_data = {key.upper(): np.array([float(value)]) for key, value in readme_aircraft.items()}
+
+    assert discipline.check_jacobian(input_data, threshold=1.0e-5, step=1.0e-6)
+
+    jacobian = discipline.linearize(input_data, compute_all_jacobians=True)
+    assert jacobian["TOC"]["FUELPRI"][0, 0] == pytest.approx(jacobian["DOC"]["FUELPRI"][0, 0] + jacobian["IOC"]["FUELPRI"][0, 0])
+
+
+def test_gradients_at_zero_mtow(readme_aircraft):
+    # sqrt(mtow) in the navigation charges is not differentiable at mtow = 0: finite Jacobian, as the costs
+    aircraft = {**readme_aircraft, "mtow": 0.0}
+    scalar   = calculate_gradients(DirectOperatingCost(aircraft))
+    batch    = calculate_gradients(DirectOperatingCost.from_arrays({**aircraft, "mtow": np.array([0.0, 70.0])}))
+
+    assert scalar["NAVIGATION CHARGES [USD/BHR]"]["mtow"] == 0.0
+    assert np.isfinite(scalar["DOC [USD/flight]"]["mtow"])
+    assert batch["DOC [USD/flight]"]["mtow"][0] == scalar["DOC [USD/flight]"]["mtow"]
+    assert batch["DOC [USD/flight]"]["mtow"][1] == pytest.approx(
+        calculate_gradients(DirectOperatingCost(readme_aircraft))["DOC [USD/flight]"]["mtow"], rel=1.0e-12)
+
+    discipline = GemseoDirectOperatingCost()
+    jacobian   = discipline.linearize({key.upper(): np.array([float(value)]) for key, value in aircraft.items()},
+                                      compute_all_jacobians=True)
+    assert np.isfinite(jacobian["DOC"]["MTOW"]).all()
@@ -0,0 +1,91 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost
+from doc_calculator.core.batch import BatchDirectOperatingCost
+from doc_calculator.core.dependencies import dependency_graph
+from doc_calculator.core.utils.params import Params
+from doc_calculator.core.utils.profiling import TimingStats
+import numpy as np
+import pytest
+
+CHANGES = [
+    {"fuelpri": 2.4},
+    {"bt": 1.9},
+    {"BT": 1.2, "bf": 3000.0},
+    {"crtechr": 310.0},
+    {"util": 2500.0, "adp": 90.0},
+    {"ieng": 2, "eoc": 310.0},
+    {"INTEREST_RATE": 0.07},
+    {"ENR": 75.0, "mtow": 72.0, "TA": 85.0},
+    {"batprice": 180000.0, "n_repbat": 4},
+]
+
+
+def test_dependency_graph_of_the_cost_terms():
+    graph = dependency_graph()
+
+    assert graph.dependents["crtechr"] == {"_calculate_cockpit_crew_cost"}
+    assert graph.dependents["INTEREST_RATE"] == {"_calculate_interest"}
+    # both branches of the thermal engine maintenance term are traced
+    assert {"ieng", "eoc", "shp"} <= graph.reads["_calculate_thermal_engine_maintenance_cost"]
+    assert "bt" in graph.reads["_calculate_fuel_cost"]
+    assert graph.dependents["ioc_fact"] == frozenset()
+
+
+@pytest.mark.parametrize("aircraft", ["atr_72", "readme_aircraft"])
+def test_update_matches_full_recomputation(aircraft, request):
+    aircraft = request.getfixturevalue(aircraft)
+    doc      = DirectOperatingCost(aircraft)
+    doc.calculate_all()
+
+    inputs = {key.lower(): value for key, value in aircraft.items()}
+    params = {}
+    for changes in CHANGES:
+        updated = doc.update(**changes)
+
+        params.update({key: value for key, value in changes.items() if key in vars(Params())})
+        inputs.update({key.lower(): value for key, value in changes.items() if key not in vars(Params())})
+        reference = DirectOperatingCost(inputs, params=Params(**params)).calculate_all()
+
+        assert updated == reference
+        assert doc.calculate_all() == reference
+
+
+def test_update_recomputes_only_dirty_terms(readme_aircraft):
+    stats = TimingStats()
+    doc   = DirectOperatingCost(readme_aircraft, stats=stats)
+    doc.calculate_doc()
+    stats.reset()
+
+    doc.update(crtechr=250.0)
+
+    terms = {name for name in stats.calls if name.startswith("_calculate_")}
+    assert terms == {"_calculate_cockpit_crew_cost"}
+
+
+def test_update_does_not_modify_shared_params(readme_aircraft):
+    params = Params()
+    doc    = DirectOperatingCost(readme_aircraft, params=params)
+
+    doc.update(INTEREST_RATE=0.08)
+
+    assert params.INTEREST_RATE == Params().INTEREST_RATE
+
+
+def test_update_unknown_input(readme_aircraft):
+    with pytest.raises(KeyError):
+        DirectOperatingCost(readme_aircraft).update(not_an_input=1.0)
+
+
+def test_batch_update_matches_full_recomputation(readme_aircraft):
+    inputs = {**readme_aircraft, "fuelpri": np.linspace(1.5, 2.5, 7)}
+    doc    = BatchDirectOperatingCost(inputs)
+    doc.calculate_all()
+
+    updated   = doc.update(bt=np.linspace(1.0, 2.0, 7), INTEREST_RATE=0.06)
+    reference = BatchDirectOperatingCost({**inputs, "bt": np.linspace(1.0, 2.0, 7)},
+                                         params=Params(INTEREST_RATE=0.06)).calculate_all()
+
+    for label, values in reference.items():
+        np.testing.assert_array_equal(updated[label], values)
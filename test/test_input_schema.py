@@ -0,0 +1,89 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost
+from doc_calculator.core.utils.params import default_dict
+from doc_calculator.core.utils.schema import INPUT_SCHEMA, AircraftRecord
+from doc_calculator.gemseo_discipline.utils.utils_functions import create_default_gemseo_grammar
+import pickle
+import pytest
+import warnings
+
+
+def test_normalize_is_case_insensitive_and_fills_defaults(atr_72):
+    record = INPUT_SCHEMA.normalize({"BT": 2.0, "FuelPri": 1.5, "util": 3000.0})
+
+    assert isinstance(record, AircraftRecord)
+    assert (record["bt"], record["fuelpri"], record["util"]) == (2.0, 1.5, 3000.0)
+    assert record["dyrs"] == default_dict["DYRS"]
+    assert list(record.keys()) == [key.lower() for key in default_dict]
+
+
+def test_unknown_keys_warn(atr_72):
+    with pytest.warns(UserWarning, match="FUEL_PRICE"):
+        DirectOperatingCost({**atr_72, "FUEL_PRICE": 2.0})
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        DirectOperatingCost(atr_72)
+
+
+def test_record_dict_style_access(readme_aircraft):
+    record = DirectOperatingCost(readme_aircraft).aircraft
+
+    record["bt"] = 2.5
+    assert record["bt"] == 2.5 and record.bt == 2.5
+    assert "bt" in record and "keys" not in record
+    assert dict(record)["bt"] == 2.5 == {**record}["bt"]
+    assert len(record) == len(default_dict)
+
+    with pytest.raises(KeyError):
+        record["keys"]
+    with pytest.raises(KeyError):
+        record["unknown"] = 1.0
+
+
+def test_record_pickle(readme_aircraft):
+    record = INPUT_SCHEMA.normalize(readme_aircraft)
+
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_grammar_uses_schema():
+    grammar = create_default_gemseo_grammar()
+
+    assert list(grammar) == list(default_dict)
+    assert all(grammar[key][0] == value for key, value in default_dict.items())
+
+
+def test_packed_records_round_trip(atr_72, readme_aircraft):
+    matrix = INPUT_SCHEMA.pack([atr_72, readme_aircraft])
+
+    assert matrix.shape == (2, len(INPUT_SCHEMA.names))
+    assert matrix[1, INPUT_SCHEMA.index["batprice"]] == readme_aircraft["batprice"]
+
+    record = INPUT_SCHEMA.from_array(matrix[1])
+    assert record == INPUT_SCHEMA.normalize(readme_aircraft)
+    assert (record.to_array() == matrix[1]).all()
+    assert type(record.bt) is float
+
+
+def test_scalar_and_batch_engines_share_packed_records(atr_72, readme_aircraft):
+    matrix = INPUT_SCHEMA.pack([atr_72, readme_aircraft])
+
+    batch = DirectOperatingCost.from_arrays(INPUT_SCHEMA.columns(matrix)).calculate_all()
+
+    for i, aircraft in enumerate((atr_72, readme_aircraft)):
+        scalar = DirectOperatingCost(INPUT_SCHEMA.from_array(matrix[i])).calculate_all()
+        assert scalar == DirectOperatingCost(aircraft).calculate_all()
+        assert batch["TOC [USD/flight]"][i] == pytest.approx(scalar["TOC [USD/flight]"], rel=1.0e-15)
+
+
+def test_records_are_copied(readme_aircraft):
+    record = INPUT_SCHEMA.normalize(readme_aircraft)
+    doc    = DirectOperatingCost(record)
+
+    doc.update(fuelpri=3.0)
+
+    assert doc.aircraft is not record
+    assert record.fuelpri == readme_aircraft["fuelpri"]
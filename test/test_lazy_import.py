@@ -0,0 +1,58 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+import doc_calculator
+from doc_calculator.core.utils.schema import INPUT_SCHEMA
+import subprocess
+import pytest
+import json
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# runs in a fresh interpreter: the modules loaded by the test session itself must not interfere
+CORE_EVALUATION = """
+import json, sys, time
+start = time.perf_counter()
+import doc_calculator
+import_time = time.perf_counter() - start
+from aircraft_data import ATR_72
+doc_calculator.DirectOperatingCost(ATR_72).calculate_doc()
+print(json.dumps({"import_time": import_time,
+                  "modules": [name for name in sys.modules if name.split(".")[0] in ("gemseo", "numpy")]}))
+"""
+
+
+def _run(source:str) -> dict:
+    env    = {**os.environ, "PYTHONPATH": os.pathsep.join([ROOT, os.path.join(ROOT, "test")])}
+    output = subprocess.run([sys.executable, "-c", source], env=env, check=True, capture_output=True, text=True)
+    return json.loads(output.stdout.splitlines()[-1])
+
+
+def test_core_evaluation_does_not_import_gemseo():
+    result = _run(CORE_EVALUATION)
+
+    assert result["modules"] == []
+    # gemseo alone takes seconds to import: the core package must stay well below that
+    assert result["import_time"] < 0.5
+
+
+def test_gemseo_discipline_loaded_on_first_access():
+    result = _run("""
+import json, sys
+import doc_calculator
+loaded = "gemseo" in sys.modules
+from doc_calculator import GemseoDirectOperatingCost, create_default_gemseo_grammar
+print(json.dumps({"before": loaded, "after": "gemseo" in sys.modules,
+                  "grammar": sorted(create_default_gemseo_grammar()),
+                  "discipline_grammar": sorted(GemseoDirectOperatingCost().io.input_grammar.names),
+                  "name": GemseoDirectOperatingCost.__name__}))
+""")
+
+    assert result["before"] is False and result["after"] is True
+    assert result["name"] == "GemseoDirectOperatingCost"
+    assert result["grammar"] == result["discipline_grammar"] == sorted(INPUT_SCHEMA.declared_names)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        doc_calculator.NotAnAttribute
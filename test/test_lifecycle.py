@@ -0,0 +1,77 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost
+from doc_calculator.core.lifecycle import Escalation, project_lifecycle
+from doc_calculator.core.utils.params import Params
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def fleet(readme_aircraft):
+    aircraft = {**readme_aircraft, "dyrs": 20, "lifespan": 20, "n_repbat": 3, "n_repfc": 1, "n_reppe": 2}
+    return [aircraft, {**aircraft, "bf": 2500.0, "util": 1800.0}]
+
+
+def test_undiscounted_flows_add_up_to_the_averaged_costs(fleet):
+    projection = project_lifecycle(fleet)
+
+    assert projection["TOC [USD/year]"].shape == (2, 20)
+    for i, aircraft in enumerate(fleet):
+        expected = DirectOperatingCost(aircraft).calculate_all()
+        hours    = aircraft["lifespan"]*aircraft["util"]
+        for total in ("DOC", "IOC", "TOC"):
+            assert projection[f"{total} [USD/year]"][i].sum() == pytest.approx(hours*expected[f"{total} [USD/BHR]"], rel=1e-12)
+
+
+def test_schedules_and_replacement_events(fleet):
+    aircraft   = {**fleet[0], "dyrs": 12}
+    projection = project_lifecycle([aircraft], years=25)
+    annual     = DirectOperatingCost(aircraft).calculate_doc()
+
+    depreciation = projection["DEPRECIATION [USD/year]"][0]
+    assert np.all(depreciation[:12] == pytest.approx(annual["DEPRECIATION [USD/BHR]"]*aircraft["util"]))
+    assert np.all(depreciation[12:] == 0.0)
+    assert np.all(projection["CABIN CREW [USD/year]"][0, 20:] == 0.0)
+
+    # 3 battery replacements at 5, 10 and 15 years, one fuel cell replacement at 10 years
+    battery = projection["BATTERY BASE MAINT. [USD/year]"][0]
+    assert np.flatnonzero(battery).tolist() == [5, 10, 15]
+    assert np.flatnonzero(projection["FUEL CELL BASE MAINT. [USD/year]"][0]).tolist() == [10]
+    assert battery.sum() == pytest.approx(annual["BATTERY BASE MAINT. [USD/BH]"]*20*aircraft["util"])
+
+
+def test_depreciation_stops_at_retirement(fleet):
+    aircraft   = {**fleet[0], "dyrs": 25, "lifespan": 15.5}
+    projection = project_lifecycle([aircraft], years=30)
+    annual     = DirectOperatingCost(aircraft).calculate_doc()["DEPRECIATION [USD/BHR]"]*aircraft["util"]
+
+    depreciation = projection["DEPRECIATION [USD/year]"][0]
+    assert np.all(depreciation[:15] == pytest.approx(annual))
+    assert depreciation[15] == pytest.approx(0.5*annual)
+    assert np.all(depreciation[16:] == 0.0)
+
+
+def test_escalation_and_discounting(fleet):
+    params     = Params(INTEREST_RATE=0.05)
+    base       = project_lifecycle(fleet, params=params)
+    escalated  = project_lifecycle(fleet, params=params, escalation=Escalation(FUEL=0.03, CO2=0.1))
+
+    ratio = escalated["FUEL [USD/year]"]/base["FUEL [USD/year]"]
+    assert ratio[:, 0] == pytest.approx(1.0) and ratio[:, 10] == pytest.approx(1.03**10)
+    assert np.all(escalated["CABIN CREW [USD/year]"] == base["CABIN CREW [USD/year]"])
+
+    discount = base["DISCOUNTED TOC [USD/year]"]/base["TOC [USD/year]"]
+    assert discount[0] == pytest.approx(1.05**-np.arange(1, 21))
+    assert base["NPV [USD]"] == pytest.approx(base["DISCOUNTED TOC [USD/year]"].sum(axis=1))
+    assert np.all(escalated["NPV [USD]"] > base["NPV [USD]"])
+
+
+def test_aircraft_dict_of_arrays(fleet):
+    designs = {**fleet[0], "util": np.array([2000.0, 2500.0, 3000.0])}
+
+    projection = project_lifecycle(designs)
+
+    assert projection["TOC [USD/year]"].shape == (3, 20)
+    assert projection["NPV [USD]"].shape == (3,)
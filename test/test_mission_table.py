@@ -0,0 +1,63 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost
+from doc_calculator.core.mission import MissionTable
+import numpy as np
+import pickle
+import pytest
+
+SECTOR = np.array([100.0, 200.0, 400.0, 800.0])
+
+
+@pytest.fixture
+def table():
+    # block time and fuel affine in the sector: interpolation is exact
+    return MissionTable(sector=SECTOR, BT=0.5 + SECTOR/300.0, bf=150.0 + 2.0*SECTOR, co2_value=3.16*(150.0 + 2.0*SECTOR))
+
+
+def test_interpolation(table):
+    sectors = np.array([[100.0, 150.0], [650.0, 800.0]])
+
+    values = table.interpolate(sectors)
+
+    assert table.columns == ("bt", "bf", "co2_value")
+    assert values["bt"].shape == (2, 2)
+    assert values["bt"] == pytest.approx(0.5 + sectors/300.0, rel=1e-14)
+    assert values["bf"] == pytest.approx(150.0 + 2.0*sectors, rel=1e-14)
+    with pytest.raises(ValueError):
+        table.interpolate([50.0, 300.0])
+    assert table.interpolate(50.0, extrapolate=True)["bf"] == pytest.approx(250.0)
+
+
+def test_evaluate_matches_the_calculator(table, atr_72):
+    sectors = np.array([120.0, 333.0, 799.0])
+
+    results = table.evaluate(atr_72, sectors, outputs=["DOC [USD/flight]", "FUEL [USD/BHR]"])
+
+    for i, sector in enumerate(sectors):
+        aircraft = {**{key.lower(): value for key, value in atr_72.items()}, "sector": sector,
+                    **{name: float(values[i]) for name, values in table.interpolate(sectors).items()}}
+        expected = DirectOperatingCost(aircraft).calculate_all()
+        assert results["DOC [USD/flight]"][i] == pytest.approx(expected["DOC [USD/flight]"], rel=1e-12)
+        assert results["FUEL [USD/BHR]"][i] == pytest.approx(expected["FUEL [USD/BHR]"], rel=1e-12)
+
+
+def test_memory_mapped_serialization(table, tmp_path):
+    path = str(tmp_path/"atr_72.npy")
+    table.save(path)
+
+    loaded = MissionTable.load(path)
+
+    assert isinstance(loaded.data, np.memmap)
+    assert loaded.columns == table.columns
+    assert np.array_equal(loaded.data, table.data)
+    assert pickle.loads(pickle.dumps(loaded)).path == path
+    assert np.array_equal(pickle.loads(pickle.dumps(table)).data, table.data)
+
+
+def test_invalid_tables():
+    with pytest.raises(ValueError):
+        MissionTable(sector=[100.0, 100.0], bt=[1.0, 2.0])
+    with pytest.raises(KeyError):
+        MissionTable(sector=[100.0, 200.0], block_time=[1.0, 2.0])
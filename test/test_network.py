@@ -0,0 +1,91 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost
+from doc_calculator.core.network import evaluate_network, read_route_chunks
+import csv
+import pytest
+
+ROUTES = [
+    # route, sector (NM), block time (HR), block fuel (KG), CO2 (KG)
+    ("NAP-FCO", 120.0, 0.85, 780.0, 2460.0),
+    ("NAP-LIN", 380.0, 1.35, 1290.0, 4070.0),
+    ("NAP-CTA", 210.0, 1.00, 950.0, 3000.0),
+    ("NAP-BRI", 130.0, 0.80, 740.0, 2330.0),
+    ("NAP-TRN", 430.0, 1.45, 1380.0, 4350.0),
+]
+
+
+def write_routes(path:str) -> None:
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["route", "SECTOR", "BT", "BF", "CO2_VALUE"])
+        writer.writerows(ROUTES)
+
+
+def read_results(path:str) -> list:
+    with open(path, newline="") as file:
+        return list(csv.DictReader(file))
+
+
+def test_network_matches_scalar_per_route(atr_72, tmp_path):
+    routes, output = str(tmp_path / "routes.csv"), str(tmp_path / "doc.csv")
+    write_routes(routes)
+
+    assert evaluate_network(atr_72, routes, output, chunk_size=2) == len(ROUTES)
+
+    for row, (route, sector, bt, bf, co2) in zip(read_results(output), ROUTES):
+        scalar = DirectOperatingCost({**atr_72, "SECTOR": sector, "BT": bt, "BF": bf, "CO2_VALUE": co2}).calculate_all()
+        assert row["route"] == route
+        assert float(row["DOC [USD/flight]"]) == pytest.approx(scalar["DOC [USD/flight]"], rel=1.0e-15)
+        assert float(row["TOC [USD/flight]"]) == pytest.approx(scalar["TOC [USD/flight]"], rel=1.0e-15)
+
+
+def test_network_several_aircraft_types(atr_72, readme_aircraft, tmp_path):
+    routes, output = str(tmp_path / "routes.csv"), str(tmp_path / "doc.csv")
+    write_routes(routes)
+
+    evaluate_network({"ATR 72": atr_72, "JET": readme_aircraft}, routes, output,
+                     chunk_size=3, outputs=["DOC [USD/flight]"])
+
+    rows = read_results(output)
+    assert len(rows) == 2*len(ROUTES)
+    assert list(rows[0]) == ["aircraft", "route", "DOC [USD/flight]"]
+    assert {row["aircraft"] for row in rows} == {"ATR 72", "JET"}
+
+
+def test_route_chunks(tmp_path):
+    routes = str(tmp_path / "routes.csv")
+    write_routes(routes)
+
+    chunks = list(read_route_chunks(routes, chunk_size=2))
+
+    assert [len(chunk["route"]) for chunk in chunks] == [2, 2, 1]
+
+
+def test_empty_fleet_and_route_table(atr_72, tmp_path):
+    routes, empty, output = str(tmp_path / "routes.csv"), str(tmp_path / "empty.csv"), str(tmp_path / "doc.csv")
+    write_routes(routes)
+    open(empty, "w").close()
+
+    with pytest.raises(ValueError, match="No aircraft"):
+        evaluate_network({}, routes, output)
+    with pytest.raises(ValueError, match="empty.csv"):
+        evaluate_network(atr_72, empty, output)
+
+
+def test_network_parquet(atr_72, tmp_path):
+    pytest.importorskip("pyarrow")
+    routes, parquet_routes, output = str(tmp_path / "routes.csv"), str(tmp_path / "routes.parquet"), str(tmp_path / "doc.parquet")
+    write_routes(routes)
+    evaluate_network(atr_72, routes, str(tmp_path / "doc.csv"))
+
+    import pyarrow.csv
+    import pyarrow.parquet
+    pyarrow.parquet.write_table(pyarrow.csv.read_csv(routes), parquet_routes)
+
+    assert evaluate_network(atr_72, parquet_routes, output, chunk_size=2) == len(ROUTES)
+
+    table = pyarrow.parquet.read_table(output)
+    expected = [float(row["DOC [USD/flight]"]) for row in read_results(str(tmp_path / "doc.csv"))]
+    assert table.column("DOC [USD/flight]").to_pylist() == expected
@@ -0,0 +1,54 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost
+from doc_calculator.core.parallel import evaluate_samples, run_campaign
+from doc_calculator.core.utils.params import Params
+import numpy as np
+import pytest
+
+NAMES = ["fuelpri", "util", "batprice", "Params.INTEREST_RATE"]
+
+
+def sample_matrix(n:int, seed:int=0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return np.column_stack([rng.uniform(1.5, 2.5, n), rng.uniform(2000.0, 3200.0, n),
+                            rng.uniform(1.5e5, 3.5e5, n), rng.uniform(0.03, 0.07, n)])
+
+
+@pytest.mark.parametrize("n_workers", [1, 3])
+def test_campaign_matches_batch_in_sample_order(readme_aircraft, n_workers):
+    samples = sample_matrix(1001)
+
+    result = run_campaign(readme_aircraft, samples, NAMES, n_workers=n_workers, chunk_size=97)
+
+    reference = evaluate_samples(readme_aircraft, samples, NAMES)
+    assert result.shape == (1001, 3)
+    np.testing.assert_array_equal(result[:, 0], reference["DOC [USD/flight]"])
+    np.testing.assert_array_equal(result[:, 2], reference["TOC [USD/flight]"])
+
+
+def test_campaign_sample_matches_scalar(readme_aircraft):
+    samples = sample_matrix(5)
+
+    result = run_campaign(readme_aircraft, samples, NAMES, n_workers=2, outputs=["DOC [USD/flight]"])
+
+    for i, (fuelpri, util, batprice, interest_rate) in enumerate(samples):
+        scalar = DirectOperatingCost({**readme_aircraft, "fuelpri": fuelpri, "util": util, "batprice": batprice},
+                                     params=Params(INTEREST_RATE=interest_rate))
+        assert result[i, 0] == pytest.approx(scalar.calculate_doc()["DOC [USD/flight]"], rel=1.0e-15)
+
+
+def test_campaign_memory_mapped_output(readme_aircraft, tmp_path):
+    samples = sample_matrix(500)
+    path    = str(tmp_path / "doe.npy")
+
+    result = run_campaign(readme_aircraft, samples, NAMES, n_workers=2, chunk_size=64, output_path=path)
+
+    assert isinstance(result, np.memmap)
+    np.testing.assert_array_equal(np.load(path), run_campaign(readme_aircraft, samples, NAMES, n_workers=1))
+
+
+def test_campaign_bad_sample_matrix(readme_aircraft):
+    with pytest.raises(ValueError):
+        run_campaign(readme_aircraft, np.ones((10, 2)), NAMES)
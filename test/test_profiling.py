@@ -0,0 +1,67 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost, GemseoDirectOperatingCost
+from doc_calculator.core.batch import BatchDirectOperatingCost
+from doc_calculator.core.utils.profiling import TimingStats, active_stats
+import numpy as np
+import pstats
+import json
+import io
+
+
+def test_instance_stats_record_every_stage(readme_aircraft):
+    stats = TimingStats()
+
+    values = DirectOperatingCost(readme_aircraft, stats=stats).calculate_all()
+
+    assert values == DirectOperatingCost(readme_aircraft).calculate_all()
+    recorded = stats.to_dict()
+    assert recorded["normalize_input"]["calls"] == 1
+    assert recorded["calculate_all"]["calls"] == 1
+    assert recorded["_calculate_cockpit_crew_cost"]["calls"] == 1
+    # own time excludes the callees, cumulative time includes them
+    for entry in recorded.values():
+        assert 0.0 <= entry["own_time"] <= entry["total_time"]
+    assert recorded["calculate_all"]["total_time"] >= recorded["_calculate_cash_operating_cost"]["total_time"]
+
+
+def test_uninstrumented_by_default(readme_aircraft):
+    doc = DirectOperatingCost(readme_aircraft)
+
+    assert active_stats() is None
+    assert "calculate_doc" not in vars(doc)
+
+
+def test_context_manager_covers_core_and_gemseo(readme_aircraft, tmp_path):
+    input_data = {key.upper(): np.array([float(value)]) for key, value in readme_aircraft.items()}
+
+    with TimingStats() as stats:
+        for _ in range(3):
+            DirectOperatingCost(readme_aircraft).calculate_doc()
+        GemseoDirectOperatingCost().execute(input_data)
+
+    assert active_stats() is None
+    # calculate_all (run by the discipline) calls calculate_doc and calculate_ioc
+    assert stats.calls["calculate_all"] == 1
+    assert stats.calls["calculate_doc"] == 4
+    assert stats.calls["gemseo.execute"] == 1
+    assert stats.calls["normalize_input"] == 4
+
+    # JSON and pstats exports
+    assert json.loads(stats.to_json(str(tmp_path/"stats.json")))["calculate_doc"]["calls"] == 4
+    stats.dump_stats(str(tmp_path/"stats.prof"))
+    profile = pstats.Stats(str(tmp_path/"stats.prof"), stream=io.StringIO())
+    assert profile.total_calls == sum(stats.calls.values())
+
+    stats.reset()
+    assert stats.to_dict() == {}
+
+
+def test_batch_engine_stats(readme_aircraft):
+    stats = TimingStats()
+
+    BatchDirectOperatingCost({**readme_aircraft, "fuelpri": np.linspace(1.5, 2.5, 10)}, stats=stats).calculate_doc()
+
+    assert stats.calls["_calculate_thermal_engine_maintenance_cost"] == 1
+    assert "calculate_doc" in stats.report()
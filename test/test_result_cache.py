@@ -0,0 +1,87 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost, GemseoDirectOperatingCost
+from doc_calculator.core.utils.cache import ResultCache
+from doc_calculator.core.utils.params import Params
+import numpy as np
+import pytest
+
+
+def test_repeated_design_points_hit(atr_72):
+    cache = ResultCache(max_size=8)
+
+    first  = DirectOperatingCost(atr_72, result_cache=cache).calculate_all()
+    second = DirectOperatingCost(dict(atr_72), result_cache=cache).calculate_all()
+
+    assert first == second
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    DirectOperatingCost(atr_72, params=Params(ENR=80.0), result_cache=cache).calculate_all()
+    assert cache.stats["misses"] == 2
+    assert cache.stats["hit_rate"] == pytest.approx(1.0/3.0)
+
+
+def test_lru_eviction(atr_72):
+    cache = ResultCache(max_size=2)
+
+    for fuel_price in (1.0, 2.0, 1.0, 3.0):
+        DirectOperatingCost({**atr_72, "FUELPRI": fuel_price}, result_cache=cache).calculate_doc()
+
+    assert len(cache) == 2
+    assert cache.hits == 1
+    assert cache.key(DirectOperatingCost({**atr_72, "FUELPRI": 2.0}).aircraft, Params(), DirectOperatingCost._cache_name()) not in cache
+
+
+def test_near_identical_points_share_entry(atr_72):
+    cache = ResultCache(digits=8)
+
+    DirectOperatingCost({**atr_72, "FUELPRI": 2.0}, result_cache=cache).calculate_doc()
+    DirectOperatingCost({**atr_72, "FUELPRI": 2.0 + 1.0e-12}, result_cache=cache).calculate_doc()
+
+    assert cache.hits == 1
+
+
+def test_persistence(atr_72, tmp_path):
+    path  = str(tmp_path / "doc_cache.pkl")
+    cache = ResultCache(path=path)
+    reference = DirectOperatingCost(atr_72, result_cache=cache).calculate_all()
+    cache.save()
+
+    reloaded = ResultCache(path=path)
+    assert len(reloaded) == 1
+    assert DirectOperatingCost(atr_72, result_cache=reloaded).calculate_all() == reference
+    assert reloaded.hits == 1
+
+
+def test_subclasses_do_not_share_entries(atr_72):
+    class DoubleFuelCost(DirectOperatingCost):
+        def _calculate_fuel_cost(self) -> float:
+            return 2.0*super()._calculate_fuel_cost()
+
+    cache     = ResultCache()
+    reference = DirectOperatingCost(atr_72, result_cache=cache).calculate_doc()
+    doubled   = DoubleFuelCost(atr_72, result_cache=cache).calculate_doc()
+
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert doubled == DoubleFuelCost(atr_72).calculate_doc() != reference
+    assert DoubleFuelCost(atr_72, result_cache=cache).calculate_doc() == doubled
+    assert cache.hits == 1
+
+    # same qualified name, other module
+    Homonym = type("DoubleFuelCost", (DirectOperatingCost,), {"__module__": "other_module",
+                                                               "__qualname__": DoubleFuelCost.__qualname__})
+    homonym = Homonym(atr_72, result_cache=cache).calculate_doc()
+    assert homonym == reference
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_discipline_result_cache(atr_72):
+    cache = ResultCache()
+    input_data = {key: np.array([float(value)]) for key, value in atr_72.items()}
+
+    first  = GemseoDirectOperatingCost(result_cache=cache).execute(input_data)
+    second = GemseoDirectOperatingCost(result_cache=cache).execute(input_data)
+
+    assert first["TOC"][0] == second["TOC"][0]
+    assert cache.hits == 1
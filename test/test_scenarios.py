@@ -0,0 +1,54 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost
+from doc_calculator.core.batch import BatchDirectOperatingCost
+from doc_calculator.core.dependencies import dependency_graph
+from doc_calculator.core.scenarios import evaluate_scenarios
+from doc_calculator.core.utils.params import PARAMS_FIELDS, Params
+from doc_calculator.core.utils.profiling import TimingStats
+import numpy as np
+import pytest
+
+SCENARIOS = [Params(), Params(ENR=1.2, LANDINGUR=12.0), Params(INTEREST_RATE=0.08, AEC=1.5, CNOISE=5.0)]
+
+
+def test_matches_one_calculator_per_scenario(atr_72, readme_aircraft):
+    aircraft = [atr_72, readme_aircraft, {**readme_aircraft, "bf": 2500.0}]
+
+    results = evaluate_scenarios(aircraft, SCENARIOS)
+
+    for i, design in enumerate(aircraft):
+        for j, params in enumerate(SCENARIOS):
+            expected = DirectOperatingCost(design, params=params).calculate_all()
+            for label, value in expected.items():
+                assert results[label].shape == (3, 3)
+                assert results[label][i, j] == pytest.approx(value, rel=1.0e-12)
+
+
+def test_aircraft_dict_of_arrays(readme_aircraft):
+    designs = {**readme_aircraft, "mtow": np.array([20000.0, 23000.0])}
+
+    results = evaluate_scenarios(designs, SCENARIOS, outputs=["DOC [USD/flight]"])
+
+    assert list(results) == ["DOC [USD/flight]"]
+    expected = DirectOperatingCost({**readme_aircraft, "mtow": 23000.0}, params=SCENARIOS[1]).calculate_doc()
+    assert results["DOC [USD/flight]"][1, 1] == pytest.approx(expected["DOC [USD/flight]"], rel=1.0e-12)
+
+
+def test_scenario_independent_terms_evaluated_once(readme_aircraft):
+    stats   = TimingStats()
+    results = evaluate_scenarios([readme_aircraft]*4, SCENARIOS, stats=stats)
+
+    assert all(calls == 1 for name, calls in stats.calls.items() if name.startswith("_calculate"))
+    graph = dependency_graph(BatchDirectOperatingCost)
+    for method, labels in graph.terms.items():
+        varying = not graph.reads[method].isdisjoint(PARAMS_FIELDS)
+        for label in labels:
+            assert varying or results[label].strides[1] == 0
+    assert np.unique(results["NAVIGATION CHARGES [USD/BHR]"][0]).size == 2
+
+
+def test_no_scenario(readme_aircraft):
+    with pytest.raises(ValueError):
+        evaluate_scenarios([readme_aircraft], [])
@@ -0,0 +1,59 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost
+from doc_calculator.core.utils.params import Params
+import numpy as np
+import pytest
+import math
+
+
+def test_elasticities_of_linear_and_inverse_terms(readme_aircraft):
+    sensitivities = DirectOperatingCost(readme_aircraft).calculate_sensitivities()
+
+    fuel = sensitivities["FUEL [USD/BHR]"]
+    assert fuel["fuelpri"]["elasticity"] == pytest.approx(1.0)
+    assert fuel["bt"]["elasticity"] == pytest.approx(-1.0)
+    assert sensitivities["INTEREST [USD/BHR]"]["INTEREST_RATE"]["elasticity"] == pytest.approx(1.0)
+    assert sensitivities["NAVIGATION CHARGES [USD/BHR]"]["mtow"]["elasticity"] == pytest.approx(0.5)
+
+
+def test_totals_match_relative_finite_differences(readme_aircraft):
+    doc           = DirectOperatingCost(readme_aircraft)
+    sensitivities = doc.calculate_sensitivities()
+    toc           = doc.calculate_all()["TOC [USD/flight]"]
+
+    for key in ("batprice", "fuelpri", "util", "bt"):
+        h        = 1.0e-6*readme_aircraft[key]
+        forward  = DirectOperatingCost({**readme_aircraft, key: readme_aircraft[key] + h}).calculate_all()["TOC [USD/flight]"]
+        backward = DirectOperatingCost({**readme_aircraft, key: readme_aircraft[key] - h}).calculate_all()["TOC [USD/flight]"]
+
+        derivative = (forward - backward)/(2.0*h)
+        assert sensitivities["TOC [USD/flight]"][key]["derivative"] == pytest.approx(derivative, rel=1.0e-6)
+        assert sensitivities["TOC [USD/flight]"][key]["elasticity"] == pytest.approx(derivative*readme_aircraft[key]/toc, rel=1.0e-6)
+
+    params   = Params(ENR=70.0)
+    forward  = DirectOperatingCost(readme_aircraft, params=params).calculate_all()["DOC [USD/flight]"]
+    derivative = (forward - doc.calculate_doc()["DOC [USD/flight]"])/(70.0 - Params().ENR)
+    assert sensitivities["DOC [USD/flight]"]["ENR"]["derivative"] == pytest.approx(derivative, rel=1.0e-9)
+
+
+def test_elasticity_of_a_zero_cost_line(atr_72):
+    sensitivities = DirectOperatingCost(atr_72).calculate_sensitivities()
+
+    # the ATR-72 has no H2 consumption
+    assert math.isnan(sensitivities["H2 [USD/BHR]"]["h2_pri"]["elasticity"])
+    assert sensitivities["H2 [USD/BHR]"]["h2_pri"]["derivative"] == 0.0
+
+
+def test_batch_sensitivities(readme_aircraft):
+    designs = {**readme_aircraft, "h2_req": np.array([0.0, 50.0])}
+
+    batch = DirectOperatingCost.from_arrays(designs).calculate_sensitivities()
+
+    for i in range(2):
+        scalar = DirectOperatingCost({**designs, "h2_req": designs["h2_req"][i]}).calculate_sensitivities()
+        for label in ("DOC [USD/flight]", "H2 [USD/BHR]"):
+            for key, entry in scalar[label].items():
+                np.testing.assert_allclose(np.broadcast_to(batch[label][key]["elasticity"], (2,))[i], entry["elasticity"],
+                                           rtol=1.0e-12)
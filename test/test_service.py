@@ -0,0 +1,147 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost
+from doc_calculator.core.service import MicroBatcher, PricingServer
+import asyncio
+import json
+import pytest
+
+
+async def _post(port, path, payload=None, method="POST"):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = b"" if payload is None else json.dumps(payload).encode()
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n"
+                 f"Connection: close\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+def test_micro_batches_match_the_scalar_class(atr_72, readme_aircraft):
+    designs = [atr_72, readme_aircraft, {**readme_aircraft, "bf": 2500.0}]*5
+
+    async def run():
+        async with MicroBatcher(window=0.05) as batcher:
+            results = await asyncio.gather(*(batcher.submit(design) for design in designs))
+            return results, batcher.metrics.to_dict()
+
+    results, metrics = asyncio.run(run())
+
+    for design, result in zip(designs, results):
+        expected = DirectOperatingCost(design).calculate_all()
+        assert result == pytest.approx(expected, rel=1.0e-12)
+    assert metrics["requests"] == 15
+    assert metrics["batches"] == 1
+    assert metrics["largest_batch_size"] == 15
+
+
+def test_max_batch_size_and_invalid_request(readme_aircraft):
+    async def run():
+        async with MicroBatcher(window=0.05, max_batch_size=4, outputs=["DOC [USD/flight]"]) as batcher:
+            results = await asyncio.gather(*(batcher.submit(readme_aircraft) for _ in range(10)))
+            with pytest.raises(ValueError):
+                await batcher.submit({**readme_aircraft, "bt": "one hour"})
+            return results, batcher.metrics.to_dict()
+
+    results, metrics = asyncio.run(run())
+
+    assert all(list(result) == ["DOC [USD/flight]"] for result in results)
+    assert metrics["batches"] == 3
+    assert metrics["errors"] == 1
+
+
+def test_http_endpoints(readme_aircraft):
+    async def run():
+        async with PricingServer(MicroBatcher(window=0.02), port=0) as server:
+            responses = await asyncio.gather(*(_post(server.port, "/doc", readme_aircraft) for _ in range(8)))
+            bad       = await _post(server.port, "/doc", [1, 2])
+            missing   = await _post(server.port, "/quote", readme_aircraft)
+            metrics   = await _post(server.port, "/metrics", method="GET")
+            return responses, bad, missing, metrics
+
+    responses, bad, missing, metrics = asyncio.run(run())
+
+    expected = DirectOperatingCost(readme_aircraft).calculate_all()["DOC [USD/flight]"]
+    assert all(status == 200 and result["DOC [USD/flight]"] == pytest.approx(expected) for status, result in responses)
+    assert bad[0] == 400 and missing[0] == 404
+
+    status, counters = metrics
+    assert status == 200
+    assert counters["requests"] == 8
+    assert counters["mean_batch_size"] > 1.0
+    assert counters["latency_p99_ms"] >= counters["latency_p50_ms"] > 0.0
+    assert counters["throughput_rps"] > 0.0
+
+
+def test_invalid_request_does_not_fail_its_batch(readme_aircraft):
+    async def run():
+        async with MicroBatcher(window=0.05) as batcher:
+            return await asyncio.gather(batcher.submit(readme_aircraft), batcher.submit({**readme_aircraft, "ieng": 3}),
+                                        batcher.submit(readme_aircraft), return_exceptions=True), batcher.metrics
+
+    (good, bad, other), metrics = asyncio.run(run())
+
+    expected = DirectOperatingCost(readme_aircraft).calculate_all()
+    assert good == pytest.approx(expected, rel=1.0e-12) and other == pytest.approx(expected, rel=1.0e-12)
+    assert isinstance(bad, ValueError)
+    assert (metrics.requests, metrics.errors, metrics.batches) == (2, 1, 1)
+
+
+def test_batcher_not_running_and_stopped(readme_aircraft):
+    async def run():
+        batcher = MicroBatcher(window=1.0)
+        with pytest.raises(RuntimeError, match="not running"):
+            await batcher.submit(readme_aircraft)
+
+        await batcher.start()
+        pending = [asyncio.ensure_future(batcher.submit(readme_aircraft)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        await batcher.stop()
+        return await asyncio.wait_for(asyncio.gather(*pending, return_exceptions=True), 1.0)
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_malformed_content_length(readme_aircraft):
+    async def run():
+        async with PricingServer(MicroBatcher(), port=0) as server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(b"POST /doc HTTP/1.1\r\nHost: localhost\r\nContent-Length: twelve\r\n\r\n{}")
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(), 1.0)
+            writer.close()
+            valid = await _post(server.port, "/doc", readme_aircraft)
+            return response, valid
+
+    response, valid = asyncio.run(run())
+
+    assert response.startswith(b"HTTP/1.1 400")
+    assert b"Content-Length" in response.partition(b"\r\n\r\n")[2]
+    assert valid[0] == 200
+
+
+def test_error_statuses_and_non_finite_costs(readme_aircraft):
+    async def run():
+        stopped = await PricingServer(MicroBatcher())._respond("POST", "/doc", json.dumps(readme_aircraft).encode())
+        async with PricingServer(MicroBatcher(outputs=["NOT A LABEL"]), port=0) as server:
+            failing = await _post(server.port, "/doc", readme_aircraft)
+        async with PricingServer(MicroBatcher(), port=0) as server:
+            null     = await _post(server.port, "/doc", {**readme_aircraft, "bt": None})
+            constant = await _post(server.port, "/doc", {**readme_aircraft, "bt": float("nan")})
+            infinite = await _post(server.port, "/doc", {**readme_aircraft, "dyrs": 0.0})
+        return stopped, failing, null, constant, infinite
+
+    with pytest.warns(RuntimeWarning):
+        stopped, failing, null, constant, infinite = asyncio.run(run())
+
+    assert stopped[0] == 503 and failing[0] == 500
+    assert null[0] == 400 and "bt" in null[1]["error"]
+    assert constant[0] == 400
+    assert infinite[0] == 200 and infinite[1]["DOC [USD/flight]"] is None
+    assert infinite[1]["FUEL [USD/BHR]"] == pytest.approx(DirectOperatingCost(readme_aircraft).calculate_all()["FUEL [USD/BHR]"])
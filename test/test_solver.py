@@ -0,0 +1,105 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost
+from doc_calculator.core.solver import breakeven, solve
+from doc_calculator.core.utils.params import Params
+import numpy as np
+import pytest
+import warnings
+
+
+@pytest.mark.parametrize("variable", ["fuelpri", "batprice", "h2_pri", "crtechr", "BT"])
+def test_affine_outputs_solved_in_one_step(readme_aircraft, variable):
+    target = 1.1*DirectOperatingCost(readme_aircraft).calculate_doc()["DOC [USD/flight]"]
+
+    value = solve(readme_aircraft, variable, target, max_iter=1)
+
+    solved = DirectOperatingCost({**readme_aircraft, variable.lower(): value}).calculate_doc()["DOC [USD/flight]"]
+    assert solved == pytest.approx(target, rel=1.0e-10)
+
+
+@pytest.mark.parametrize("variable, output", [("util", "DOC [USD/flight]"), ("mtow", "TOC [USD/flight]"),
+                                              ("l_app", "DOC [USD/BHR]"), ("INTEREST_RATE", "DOC [USD/flight]"),
+                                              ("ENR", "TOC [USD/BHR]")])
+def test_newton_solutions(readme_aircraft, variable, output):
+    target = 1.05*DirectOperatingCost(readme_aircraft).calculate_all()[output]
+
+    value = solve(readme_aircraft, variable, target, output=output)
+
+    if variable.isupper():
+        solved = DirectOperatingCost(readme_aircraft, params=Params(**{variable: value})).calculate_all()[output]
+    else:
+        solved = DirectOperatingCost({**readme_aircraft, variable: value}).calculate_all()[output]
+    assert solved == pytest.approx(target, rel=1.0e-9)
+
+
+def test_vectorized_over_aircraft_and_targets(readme_aircraft):
+    designs = {**readme_aircraft, "bf": np.array([2000.0, 2500.0, 3000.0])}
+    targets = np.array([15000.0, 16000.0, 17000.0])
+
+    values = solve(designs, "fuelpri", targets)
+
+    assert values.shape == (3,)
+    for i in range(3):
+        assert values[i] == pytest.approx(solve({**designs, "bf": designs["bf"][i]}, "fuelpri", targets[i]), rel=1.0e-12)
+
+
+def test_breakeven_battery_price(readme_aircraft):
+    # conventional baseline: no battery, more block fuel
+    baseline     = {**readme_aircraft, "n_bat": 0, "ener_req": 0.0, "bf": 3200.0}
+    baseline_doc = DirectOperatingCost(baseline).calculate_doc()["DOC [USD/flight]"]
+
+    price = breakeven(readme_aircraft, baseline, "batprice")
+
+    matched = DirectOperatingCost({**readme_aircraft, "batprice": price}).calculate_doc()["DOC [USD/flight]"]
+    assert matched == pytest.approx(baseline_doc, rel=1.0e-10)
+
+
+def test_unreachable_targets_do_not_converge(readme_aircraft, atr_72):
+    # DOC does not depend on ioc_fact
+    with pytest.warns(RuntimeWarning):
+        value = solve(readme_aircraft, "ioc_fact", 1.0e4, output="DOC [USD/flight]")
+    assert np.isnan(value)
+
+    # matching the ATR-72 DOC would take a negative battery price
+    with pytest.warns(RuntimeWarning):
+        value = breakeven(readme_aircraft, atr_72, "batprice")
+    assert np.isnan(value)
+
+
+@pytest.mark.parametrize("factor", [3.0, 5.0])
+def test_large_targets_of_convex_outputs(readme_aircraft, factor):
+    # from the right, the Newton steps on the 1/util terms undershoot below zero several times in a row
+    reference = DirectOperatingCost(readme_aircraft).calculate_doc()["DOC [USD/flight]"]
+    target    = factor*reference
+
+    def residual(util:float) -> float:
+        return DirectOperatingCost({**readme_aircraft, "util": util}).calculate_doc()["DOC [USD/flight]"] - target
+
+    low, high = 1.0, readme_aircraft["util"]
+    for _ in range(100):
+        middle = 0.5*(low + high)
+        low, high = (middle, high) if residual(middle) > 0.0 else (low, middle)
+
+    assert solve(readme_aircraft, "util", target) == pytest.approx(low, rel=1e-9)
+
+
+def test_zero_derivative_entry_already_at_target(readme_aircraft):
+    # without block fuel the DOC does not depend on fuelpri, and already matches the target
+    designs = {**readme_aircraft, "bf": np.array([0.0, 2500.0])}
+    target  = DirectOperatingCost({**readme_aircraft, "bf": 0.0}).calculate_doc()["DOC [USD/flight]"]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        values = solve(designs, "fuelpri", target)
+
+    assert values[0] == readme_aircraft["fuelpri"]
+    assert values[1] == pytest.approx(0.0, abs=1.0e-6)
+
+
+def test_invalid_variables(readme_aircraft):
+    with pytest.raises(KeyError):
+        solve(readme_aircraft, "not_an_input", 1.0e4)
+    with pytest.raises(ValueError):
+        solve(readme_aircraft, "ieng", 1.0e4)
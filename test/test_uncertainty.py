@@ -0,0 +1,65 @@
+import os
+import sys
+sys.path.append(os.getcwd())
+from doc_calculator import DirectOperatingCost
+from doc_calculator.core.gradients import calculate_gradients
+from doc_calculator.core.parallel import evaluate_samples
+from doc_calculator.core.uncertainty import Normal, RunningStatistics, Triangular, Uniform, propagate
+import numpy as np
+import pytest
+
+
+def test_running_statistics_match_numpy():
+    values     = np.random.default_rng(1).normal(size=(1000, 3))
+    statistics = RunningStatistics(3, reservoir_size=2000)
+
+    for chunk in np.array_split(values, 7):
+        statistics.update(chunk)
+
+    np.testing.assert_allclose(statistics.mean, values.mean(axis=0))
+    np.testing.assert_allclose(statistics.std, values.std(axis=0, ddof=1))
+    np.testing.assert_allclose(statistics.percentiles([5, 50, 95]), np.percentile(values, [5, 50, 95], axis=0))
+
+
+def test_reservoir_keeps_memory_flat():
+    statistics = RunningStatistics(1, reservoir_size=500, rng=np.random.default_rng(0))
+
+    for _ in range(50):
+        statistics.update(np.random.default_rng(2).uniform(size=(1000, 1)))
+
+    assert statistics.count == 50000
+    assert statistics._reservoir.shape == (500, 1)
+    assert statistics.percentiles([50])[0, 0] == pytest.approx(0.5, abs=0.05)
+
+
+def test_propagate_statistics(readme_aircraft):
+    distributions = {"fuelpri": Normal(1.8, 0.2), "batprice": Triangular(2.0e5, 2.5e5, 3.5e5),
+                     "Params.INTEREST_RATE": Uniform(0.03, 0.07)}
+
+    results = propagate(readme_aircraft, distributions, 3000, seed=7, chunk_size=700,
+                        outputs=["DOC [USD/flight]", "INTEREST [USD/BHR]", "H2 [USD/BHR]"])
+
+    # same seed, same samples
+    assert results == propagate(readme_aircraft, distributions, 3000, seed=7, chunk_size=700,
+                                outputs=["DOC [USD/flight]", "INTEREST [USD/BHR]", "H2 [USD/BHR]"])
+
+    nominal = DirectOperatingCost(readme_aircraft).calculate_doc()
+    doc     = results["DOC [USD/flight]"]
+    assert doc["min"] < doc["percentiles"][5.0] < doc["percentiles"][50.0] < doc["percentiles"][95.0] < doc["max"]
+    assert doc["mean"] == pytest.approx(nominal["DOC [USD/flight]"], rel=0.01)
+    assert results["H2 [USD/BHR]"]["std"] == 0.0
+
+
+def test_sobol_indices_of_linear_response(readme_aircraft):
+    distributions = {"fuelpri": Uniform(1.0, 3.0), "crtechr": Uniform(150.0, 250.0)}
+
+    results = propagate(readme_aircraft, distributions, 20000, seed=3, chunk_size=5000,
+                        outputs=["DOC [USD/flight]"], sobol=True)["DOC [USD/flight]"]
+
+    # DOC [USD/flight] is linear in both inputs: S_i = a_i^2 var_i / sum_j a_j^2 var_j
+    gradient = calculate_gradients(DirectOperatingCost(readme_aircraft))["DOC [USD/flight]"]
+    partial  = {"fuelpri": gradient["fuelpri"]**2*2.0**2/12.0, "crtechr": gradient["crtechr"]**2*100.0**2/12.0}
+    for name in distributions:
+        expected = partial[name]/sum(partial.values())
+        assert results["first_order"][name] == pytest.approx(expected, abs=0.03)
+        assert results["total_order"][name] == pytest.approx(expected, abs=0.03)